@@ -0,0 +1,45 @@
+"""Add issue ranks for manual ordering
+
+Revision ID: 02014e8dd256
+Revises: ba0ee8ee5d25
+Create Date: 2026-10-17 07:59:43.256724
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "02014e8dd256"
+down_revision: Union[str, None] = "ba0ee8ee5d25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite only adds NOT NULL columns with a default, and rebuilding the
+    # table instead would drop its search triggers. The default is never
+    # used: every insert path ranks its issues.
+    op.add_column(
+        "issues",
+        sa.Column("rank", sa.String(length=64), server_default="", nullable=False),
+    )
+
+    # Existing issues keep their creation order within each project; the
+    # ranks are zero-padded issue numbers, so string order is number order
+    op.execute("UPDATE issues SET rank = printf('%07d', number) || 'i'")
+    op.create_index(
+        "ix_issues_project_id_rank", "issues", ["project_id", "rank"], unique=False
+    )
+    op.create_index(
+        "ix_issues_sprint_id_rank", "issues", ["sprint_id", "rank"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_sprint_id_rank", table_name="issues")
+    op.drop_index("ix_issues_project_id_rank", table_name="issues")
+    op.drop_column("issues", "rank")
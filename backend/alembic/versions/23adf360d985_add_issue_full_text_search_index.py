@@ -0,0 +1,118 @@
+"""Add issue full text search index
+
+Revision ID: 23adf360d985
+Revises: 4f60d9febfc5
+Create Date: 2026-10-17 07:17:12.936512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "23adf360d985"
+down_revision: Union[str, None] = "4f60d9febfc5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COMMENTS_OF_NEW = (
+    "(SELECT coalesce(group_concat(body, ' '), '') FROM comments "
+    "WHERE issue_id = new.issue_id)"
+)
+COMMENTS_OF_OLD = (
+    "(SELECT coalesce(group_concat(body, ' '), '') FROM comments "
+    "WHERE issue_id = old.issue_id)"
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE issue_search USING fts5(
+            title, description, comments,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO issue_search (rowid, title, description, comments)
+        SELECT issues.id, issues.title, coalesce(issues.description, ''),
+               (SELECT coalesce(group_concat(body, ' '), '') FROM comments
+                WHERE comments.issue_id = issues.id)
+        FROM issues
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_search_insert AFTER INSERT ON issues
+        BEGIN
+            INSERT INTO issue_search (rowid, title, description, comments)
+            VALUES (new.id, new.title, coalesce(new.description, ''), '');
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_search_update
+        AFTER UPDATE OF title, description ON issues
+        BEGIN
+            UPDATE issue_search
+            SET title = new.title, description = coalesce(new.description, '')
+            WHERE rowid = new.id;
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_search_delete AFTER DELETE ON issues
+        BEGIN
+            DELETE FROM issue_search WHERE rowid = old.id;
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER comments_search_insert AFTER INSERT ON comments
+        BEGIN
+            UPDATE issue_search SET comments = {COMMENTS_OF_NEW}
+            WHERE rowid = new.issue_id;
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER comments_search_update
+        AFTER UPDATE OF body, issue_id ON comments
+        BEGIN
+            UPDATE issue_search SET comments = {COMMENTS_OF_OLD}
+            WHERE rowid = old.issue_id;
+            UPDATE issue_search SET comments = {COMMENTS_OF_NEW}
+            WHERE rowid = new.issue_id;
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER comments_search_delete AFTER DELETE ON comments
+        BEGIN
+            UPDATE issue_search SET comments = {COMMENTS_OF_OLD}
+            WHERE rowid = old.issue_id;
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER comments_search_delete")
+    op.execute("DROP TRIGGER comments_search_update")
+    op.execute("DROP TRIGGER comments_search_insert")
+    op.execute("DROP TRIGGER issues_search_delete")
+    op.execute("DROP TRIGGER issues_search_update")
+    op.execute("DROP TRIGGER issues_search_insert")
+    op.execute("DROP TABLE issue_search")
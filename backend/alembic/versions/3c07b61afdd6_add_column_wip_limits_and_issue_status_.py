@@ -0,0 +1,89 @@
+"""Add column WIP limits and issue status counters
+
+Revision ID: 3c07b61afdd6
+Revises: 02014e8dd256
+Create Date: 2026-10-17 08:19:39.464288
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c07b61afdd6"
+down_revision: Union[str, None] = "02014e8dd256"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNT_IN = """
+    INSERT INTO issue_status_counts (project_id, status, issue_count)
+    VALUES (new.project_id, new.status, 1)
+    ON CONFLICT (project_id, status) DO UPDATE SET issue_count = issue_count + 1;
+"""
+COUNT_OUT = """
+    UPDATE issue_status_counts SET issue_count = issue_count - 1
+    WHERE project_id = old.project_id AND status = old.status;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_status_counts",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("TO_DO", "IN_PROGRESS", "IN_REVIEW", "DONE", name="issuestatus"),
+            nullable=False,
+        ),
+        sa.Column("issue_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "status"),
+    )
+    op.add_column("board_columns", sa.Column("wip_limit", sa.Integer(), nullable=True))
+    op.execute(
+        """
+        INSERT INTO issue_status_counts (project_id, status, issue_count)
+        SELECT project_id, status, count(*) FROM issues GROUP BY project_id, status
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER issues_count_insert AFTER INSERT ON issues
+        BEGIN {COUNT_IN} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER issues_count_update
+        AFTER UPDATE OF status, project_id ON issues
+        WHEN old.status IS NOT new.status OR old.project_id IS NOT new.project_id
+        BEGIN {COUNT_OUT} {COUNT_IN} END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER issues_count_delete AFTER DELETE ON issues
+        BEGIN {COUNT_OUT} END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER projects_count_delete AFTER DELETE ON projects
+        BEGIN
+            DELETE FROM issue_status_counts WHERE project_id = old.id;
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER projects_count_delete")
+    op.execute("DROP TRIGGER issues_count_delete")
+    op.execute("DROP TRIGGER issues_count_update")
+    op.execute("DROP TRIGGER issues_count_insert")
+    op.drop_column("board_columns", "wip_limit")
+    op.drop_table("issue_status_counts")
@@ -0,0 +1,56 @@
+"""Add saved filters
+
+Revision ID: 4f60d9febfc5
+Revises: ea1cafe0361e
+Create Date: 2026-10-17 07:13:51.074923
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f60d9febfc5"
+down_revision: Union[str, None] = "ea1cafe0361e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "saved_filters",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("jql", sa.Text(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["owner_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_saved_filters_id"), "saved_filters", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_saved_filters_owner_id"), "saved_filters", ["owner_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_saved_filters_owner_id"), table_name="saved_filters")
+    op.drop_index(op.f("ix_saved_filters_id"), table_name="saved_filters")
+    op.drop_table("saved_filters")
@@ -0,0 +1,34 @@
+"""Delete issue events with their issue
+
+Revision ID: 5a1e0c7d9b42
+Revises: 3c07b61afdd6
+Create Date: 2026-10-17 12:04:11.518203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1e0c7d9b42"
+down_revision: Union[str, None] = "3c07b61afdd6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM issue_events WHERE issue_id NOT IN (SELECT id FROM issues)")
+    op.execute(
+        """
+        CREATE TRIGGER issues_events_delete AFTER DELETE ON issues
+        BEGIN
+            DELETE FROM issue_events WHERE issue_id = old.id;
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER issues_events_delete")
@@ -0,0 +1,37 @@
+"""Index board columns by project, status and creation
+
+Revision ID: 64bef3f72e4e
+Revises: 23adf360d985
+Create Date: 2026-10-17 07:51:15.852179
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "64bef3f72e4e"
+down_revision: Union[str, None] = "23adf360d985"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The new index covers every lookup of the old one, so build it first
+    op.create_index(
+        "ix_issues_project_id_status_created_at",
+        "issues",
+        ["project_id", "status", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_issues_project_id_status", table_name="issues")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_issues_project_id_status", "issues", ["project_id", "status"], unique=False
+    )
+    op.drop_index("ix_issues_project_id_status_created_at", table_name="issues")
@@ -0,0 +1,44 @@
+"""Add issue events history table
+
+Revision ID: 7f88461945ea
+Revises: e123dda50700
+Create Date: 2026-10-17 06:53:22.034690
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f88461945ea"
+down_revision: Union[str, None] = "e123dda50700"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("issue_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "ts",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("changes", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["issue_id"], ["issues.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_issue_events_issue_id_ts", "issue_events", ["issue_id", "ts"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issue_events_issue_id_ts", table_name="issue_events")
+    op.drop_table("issue_events")
@@ -0,0 +1,48 @@
+"""add board column statuses
+
+Revision ID: ba0ee8ee5d25
+Revises: 64bef3f72e4e
+Create Date: 2026-10-17 07:55:15.004553
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ba0ee8ee5d25"
+down_revision: Union[str, None] = "64bef3f72e4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "board_column_statuses",
+        sa.Column("column_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("TO_DO", "IN_PROGRESS", "IN_REVIEW", "DONE", name="issuestatus"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["column_id"], ["board_columns.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("column_id", "status"),
+    )
+    # Columns so far showed the status their name spelled, e.g. "In Progress"
+    op.execute(
+        """
+        INSERT INTO board_column_statuses (column_id, status)
+        SELECT id, upper(replace(name, ' ', '_')) FROM board_columns
+        WHERE upper(replace(name, ' ', '_'))
+            IN ('TO_DO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("board_column_statuses")
@@ -0,0 +1,30 @@
+"""Add issue row version
+
+Revision ID: c931172151c8
+Revises: 7f88461945ea
+Create Date: 2026-10-17 06:59:01.571238
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c931172151c8"
+down_revision: Union[str, None] = "7f88461945ea"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "issues", sa.Column("version", sa.Integer(), server_default="1", nullable=False)
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("issues") as batch_op:
+        batch_op.drop_column("version")
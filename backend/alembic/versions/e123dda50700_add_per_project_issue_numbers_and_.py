@@ -0,0 +1,57 @@
+"""Add per-project issue numbers and stored issue keys
+
+Revision ID: e123dda50700
+Revises: c23c31bc1f4a
+Create Date: 2026-10-17 06:44:16.664344
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e123dda50700"
+down_revision: Union[str, None] = "c23c31bc1f4a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "projects",
+        sa.Column("issue_seq", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column("issues", sa.Column("number", sa.Integer(), nullable=True))
+    op.add_column("issues", sa.Column("issue_key", sa.String(length=30), nullable=True))
+
+    # Existing issues keep the keys they were already served under
+    # (PROJ-<id>); new issues continue each project's sequence from there
+    op.execute("UPDATE issues SET number = id")
+    op.execute(
+        "UPDATE issues SET issue_key = "
+        "(SELECT projects.key FROM projects WHERE projects.id = issues.project_id)"
+        " || '-' || number"
+    )
+    op.execute(
+        "UPDATE projects SET issue_seq = COALESCE("
+        "(SELECT MAX(issues.number) FROM issues"
+        " WHERE issues.project_id = projects.id), 0)"
+    )
+
+    with op.batch_alter_table("issues") as batch_op:
+        batch_op.alter_column("number", existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column(
+            "issue_key", existing_type=sa.String(length=30), nullable=False
+        )
+    op.create_index(op.f("ix_issues_issue_key"), "issues", ["issue_key"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_issues_issue_key"), table_name="issues")
+    with op.batch_alter_table("issues") as batch_op:
+        batch_op.drop_column("issue_key")
+        batch_op.drop_column("number")
+    op.drop_column("projects", "issue_seq")
@@ -0,0 +1,29 @@
+"""Add parent issue index
+
+Revision ID: ea1cafe0361e
+Revises: c931172151c8
+Create Date: 2026-10-17 07:04:47.595193
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ea1cafe0361e"
+down_revision: Union[str, None] = "c931172151c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_issues_parent_issue_id", "issues", ["parent_issue_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_parent_issue_id", table_name="issues")
@@ -5,6 +5,7 @@ from . import (
     auth,
     boards,
     comments,
+    filters,
     issues,
     notifications,
     priorities,
@@ -33,6 +34,7 @@ api_router.include_router(workflows.router, prefix="/workflows", tags=["workflow
 api_router.include_router(statuses.router, prefix="/statuses", tags=["statuses"])
 api_router.include_router(priorities.router, prefix="/priorities", tags=["priorities"])
 api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(filters.router, prefix="/filters", tags=["filters"])
 api_router.include_router(
     notifications.router, prefix="/notifications", tags=["notifications"]
 )
@@ -1,12 +1,36 @@
 from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from app.db.base import get_db
-from app.models.board import Board, BoardColumn, BoardType
-from app.models.issue import Issue
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.core.board_columns import get_board_column_cache
+from app.core.board_events import board_event_stream, get_board_event_hub
+from app.core.conditional import (
+    conditional_response,
+    issue_collection_state,
+    latest,
+    make_etag,
+)
+from app.core.fields import (
+    FIELDS_DESCRIPTION,
+    issue_fields_response,
+    load_issue_fields,
+    parse_issue_fields,
+)
+from app.core.pagination import (
+    ISSUE_ORDER_DESCRIPTION,
+    SortColumn,
+    paginate_newest_first,
+    paginate_ranked,
+)
+from app.db.base import get_db, get_engine
+from app.models.board import Board, BoardColumn, BoardColumnStatus, BoardType
+from app.models.issue import Issue, IssueStatus
+from app.models.issue_counts import issue_status_counts
 from app.models.project import Project
 
 router = APIRouter()
@@ -43,6 +67,18 @@ class ColumnCreate(BaseModel):
     name: str
     description: str | None = None
     position: int = 0
+    # Defaults to the status the name spells, e.g. "In Progress"
+    statuses: list[IssueStatus] | None = None
+    wip_limit: int | None = None
+
+
+class ColumnUpdate(BaseModel):
+    name: str | None = None
+    description: str | None = None
+    position: int | None = None
+    statuses: list[IssueStatus] | None = None
+    # May be null to remove the limit
+    wip_limit: int | None = None
 
 
 class ColumnResponse(BaseModel):
@@ -51,6 +87,8 @@ class ColumnResponse(BaseModel):
     description: str | None = None
     position: int
     board_id: int
+    statuses: list[IssueStatus] = []
+    wip_limit: int | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -58,8 +96,109 @@ class ColumnResponse(BaseModel):
         from_attributes = True
 
 
+class SnapshotColumn(ColumnResponse):
+    total: int
+    issues: list[dict]
+
+
+class BoardSnapshot(BoardResponse):
+    columns: list[SnapshotColumn]
+
+
+class ColumnCount(BaseModel):
+    id: int
+    name: str
+    count: int
+    wip_limit: int | None = None
+    over_limit: bool
+
+
+class BoardCounts(BaseModel):
+    board_id: int
+    statuses: dict[IssueStatus, int]
+    columns: list[ColumnCount]
+
+
+def _column_status(name: str) -> IssueStatus | None:
+    """The issue status a column name spells; None if no match"""
+    try:
+        return IssueStatus[name.upper().replace(" ", "_")]
+    except KeyError:
+        return None
+
+
+def _sorted_statuses(statuses) -> list[IssueStatus]:
+    return sorted(statuses, key=list(IssueStatus).index)
+
+
+def _status_mappings(statuses: list[IssueStatus]) -> list[BoardColumnStatus]:
+    return [BoardColumnStatus(status=status) for status in dict.fromkeys(statuses)]
+
+
+def _check_wip_limit(wip_limit: int | None) -> None:
+    if wip_limit is not None and wip_limit < 1:
+        raise HTTPException(status_code=400, detail="WIP limit must be at least 1")
+
+
+def _get_column(db: Session, board_id: int, column_id: int) -> BoardColumn:
+    column = (
+        db.query(BoardColumn)
+        .options(selectinload(BoardColumn.status_mappings))
+        .filter(BoardColumn.id == column_id, BoardColumn.board_id == board_id)
+        .first()
+    )
+    if not column:
+        raise HTTPException(status_code=404, detail="Column not found")
+    return column
+
+
+def _board_issue(issue: Issue) -> dict:
+    return {
+        "id": issue.id,
+        "title": issue.title,
+        "description": issue.description,
+        "status": issue.status.value,
+        "priority": issue.priority.value,
+        "issue_type": issue.issue_type.value,
+        "project_id": issue.project_id,
+        "reporter_id": issue.reporter_id,
+        "assignee_id": issue.assignee_id,
+        "sprint_id": issue.sprint_id,
+        "rank": issue.rank,
+        "created_at": issue.created_at.isoformat() if issue.created_at else None,
+        "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+    }
+
+
+def _newest_issues_by_status(
+    db: Session, project_id: int, statuses: list[IssueStatus], limit: int
+) -> list[Issue]:
+    """
+    The newest limit issues of a project in each status, newest first, from
+    one query: a UNION ALL of one index range scan per status, joined back
+    to issues.
+    """
+    if not statuses:
+        return []
+    branches = [
+        select(Issue.id)
+        .where(Issue.project_id == project_id, Issue.status == status)
+        .order_by(Issue.created_at.desc(), Issue.id.desc())
+        .limit(limit)
+        .subquery()
+        for status in statuses
+    ]
+    newest = union_all(*(select(branch.c.id) for branch in branches)).subquery()
+    return (
+        db.query(Issue)
+        .join(newest, Issue.id == newest.c.id)
+        .order_by(Issue.created_at.desc(), Issue.id.desc())
+        .all()
+    )
+
+
 @router.get("/", response_model=list[BoardResponse])
-async def get_boards(
+def get_boards(
     project_id: int | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
@@ -78,7 +217,7 @@ async def get_boards(
 
 
 @router.get("/{board_id}", response_model=BoardResponse)
-async def get_board(board_id: int, db: Session = Depends(get_db)):
+def get_board(board_id: int, db: Session = Depends(get_db)):
     """
     Get a specific board by ID
     """
@@ -89,7 +228,7 @@ async def get_board(board_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=BoardResponse, status_code=201)
-async def create_board(board: BoardCreate, db: Session = Depends(get_db)):
+def create_board(board: BoardCreate, db: Session = Depends(get_db)):
     """
     Create a new board
     """
@@ -112,9 +251,7 @@ async def create_board(board: BoardCreate, db: Session = Depends(get_db)):
 
 
 @router.put("/{board_id}", response_model=BoardResponse)
-async def update_board(
-    board_id: int, board: BoardUpdate, db: Session = Depends(get_db)
-):
+def update_board(board_id: int, board: BoardUpdate, db: Session = Depends(get_db)):
     """
     Update an existing board
     """
@@ -136,7 +273,7 @@ async def update_board(
 
 
 @router.delete("/{board_id}", status_code=204)
-async def delete_board(board_id: int, db: Session = Depends(get_db)):
+def delete_board(board_id: int, db: Session = Depends(get_db)):
     """
     Delete a board
     """
@@ -150,7 +287,7 @@ async def delete_board(board_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{board_id}/columns", response_model=list[ColumnResponse])
-async def get_board_columns(board_id: int, db: Session = Depends(get_db)):
+def get_board_columns(board_id: int, db: Session = Depends(get_db)):
     """
     Get all columns for a board (e.g., To Do, In Progress, Done)
     """
@@ -161,6 +298,7 @@ async def get_board_columns(board_id: int, db: Session = Depends(get_db)):
 
     columns = (
         db.query(BoardColumn)
+        .options(selectinload(BoardColumn.status_mappings))
         .filter(BoardColumn.board_id == board_id)
         .order_by(BoardColumn.position)
         .all()
@@ -169,16 +307,18 @@ async def get_board_columns(board_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/{board_id}/columns", response_model=ColumnResponse, status_code=201)
-async def create_board_column(
+def create_board_column(
     board_id: int, column: ColumnCreate, db: Session = Depends(get_db)
 ):
     """
-    Create a new column for a board
+    Create a new column for a board. Without statuses, the column shows
+    the issue status its name spells, if any.
     """
     # Verify board exists
     board = db.query(Board).filter(Board.id == board_id).first()
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
+    _check_wip_limit(column.wip_limit)
 
     # Get the maximum position to append at the end if position not specified
     if column.position == 0:
@@ -192,12 +332,19 @@ async def create_board_column(
     else:
         position = column.position
 
+    statuses = column.statuses
+    if statuses is None:
+        status = _column_status(column.name)
+        statuses = [status] if status is not None else []
+
     # Create new column
     db_column = BoardColumn(
         name=column.name,
         description=column.description,
         position=position,
         board_id=board_id,
+        wip_limit=column.wip_limit,
+        status_mappings=_status_mappings(statuses),
     )
     db.add(db_column)
     db.commit()
@@ -205,66 +352,278 @@ async def create_board_column(
     return db_column
 
 
+@router.put("/{board_id}/columns/{column_id}", response_model=ColumnResponse)
+def update_board_column(
+    board_id: int,
+    column_id: int,
+    column: ColumnUpdate,
+    db: Session = Depends(get_db),
+):
+    """
+    Update a board column; statuses replaces the statuses it shows and a
+    null wip_limit removes the limit
+    """
+    db_column = _get_column(db, board_id, column_id)
+
+    # Update fields if provided
+    if column.name is not None:
+        db_column.name = column.name
+    if column.description is not None:
+        db_column.description = column.description
+    if column.position is not None:
+        db_column.position = column.position
+    if "wip_limit" in column.model_fields_set:
+        _check_wip_limit(column.wip_limit)
+        db_column.wip_limit = column.wip_limit
+    if column.statuses is not None:
+        kept = {m.status: m for m in db_column.status_mappings}
+        db_column.status_mappings = [
+            kept.get(status) or BoardColumnStatus(status=status)
+            for status in dict.fromkeys(column.statuses)
+        ]
+
+    db.commit()
+    db.refresh(db_column)
+    return db_column
+
+
+@router.delete("/{board_id}/columns/{column_id}", status_code=204)
+def delete_board_column(board_id: int, column_id: int, db: Session = Depends(get_db)):
+    """
+    Delete a board column; its issues stay on the board
+    """
+    db_column = _get_column(db, board_id, column_id)
+    db.delete(db_column)
+    db.commit()
+    return None
+
+
 @router.get("/{board_id}/issues", response_model=list[dict])
-async def get_board_issues(
+def get_board_issues(
     board_id: int,
+    request: Request,
+    response: Response,
     column_id: int | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    order: Literal["newest", "rank"] = Query(
+        "newest", description=ISSUE_ORDER_DESCRIPTION
+    ),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """
     Get all issues on a board, optionally filtered by column.
     Note: Issues are filtered by the board's project. If column_id is provided,
-    issues are further filtered by matching column name to issue status.
+    issues are further filtered to the statuses mapped to the column.
+    Issues come newest first or, with order=rank, in their manual order.
+    With fields, only those issue fields are loaded and returned.
+    Supports If-None-Match; the ETag covers every issue of the board's project.
     """
+    field_names = parse_issue_fields(fields)
+
     # Verify board exists
-    board = db.query(Board).filter(Board.id == board_id).first()
+    board = (
+        db.query(Board.project_id, Board.updated_at)
+        .filter(Board.id == board_id)
+        .first()
+    )
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
 
     # Get all issues for the board's project
     query = db.query(Issue).filter(Issue.project_id == board.project_id)
 
-    # If column_id is provided, filter by column name matching issue status
+    # If column_id is provided, filter by the statuses mapped to the column
+    shown = None
     if column_id is not None:
-        column = (
-            db.query(BoardColumn)
-            .filter(BoardColumn.id == column_id, BoardColumn.board_id == board_id)
-            .first()
+        column_statuses = get_board_column_cache(get_engine(db)).column_statuses(
+            db, board_id
         )
-        if not column:
+        if column_id not in column_statuses:
             raise HTTPException(status_code=404, detail="Column not found")
 
-        # Map column name to issue status (simple mapping - can be enhanced)
-        # This is a basic implementation - you may want to add a proper mapping table
-        column_name_upper = column.name.upper().replace(" ", "_")
-        from app.models.issue import IssueStatus
-
-        try:
-            issue_status = IssueStatus[column_name_upper]
-            query = query.filter(Issue.status == issue_status)
-        except KeyError:
-            # If column name doesn't match any status, return empty list
-            # In a real implementation, you might want a mapping table
+        statuses = column_statuses[column_id]
+        if not statuses:
+            # If no status is mapped to the column, return empty list
             return []
+        shown = _sorted_statuses(statuses)
+        query = query.filter(Issue.status.in_(shown))
+
+    # Answer unchanged polls before any issue row is loaded; remapping the
+    # column's statuses changes which issues it shows, so they are part of it
+    state = issue_collection_state(db, Issue.project_id == board.project_id)
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag(
+            "board-issues", board_id, request.url.query, board.updated_at, shown, state
+        ),
+        latest(board.updated_at, state[1]),
+        is_collection=True,
+    )
+    if not_modified is not None:
+        return not_modified
 
-    issues = query.offset(skip).limit(limit).all()
-
-    return [
-        {
-            "id": issue.id,
-            "title": issue.title,
-            "description": issue.description,
-            "status": issue.status.value,
-            "priority": issue.priority.value,
-            "issue_type": issue.issue_type.value,
-            "project_id": issue.project_id,
-            "reporter_id": issue.reporter_id,
-            "assignee_id": issue.assignee_id,
-            "sprint_id": issue.sprint_id,
-            "created_at": issue.created_at.isoformat() if issue.created_at else None,
-            "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
-        }
-        for issue in issues
+    if field_names is not None:
+        query = load_issue_fields(query, field_names)
+
+    sort_column: SortColumn
+    if order == "rank":
+        paginate, sort_column = paginate_ranked, Issue.rank
+    else:
+        paginate, sort_column = paginate_newest_first, Issue.created_at
+    issues = paginate(
+        query,
+        sort_column=sort_column,
+        id_column=Issue.id,
+        request=request,
+        response=response,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+
+    if field_names is not None:
+        return issue_fields_response(issues, field_names, response)
+
+    return [_board_issue(issue) for issue in issues]
+
+
+@router.get("/{board_id}/snapshot", response_model=BoardSnapshot)
+def get_board_snapshot(
+    board_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=100, description="Issues per column"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a board, its ordered columns and each column's newest issues.
+    The number of queries does not depend on the number of columns: one
+    loads the board with its columns, one the issues of every column and
+    one reads the project's per-status counters for the column totals; the
+    column statuses are cached. Supports If-None-Match.
+    """
+    board = (
+        db.query(Board)
+        .options(joinedload(Board.columns))
+        .filter(Board.id == board_id)
+        .first()
+    )
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    mapping = get_board_column_cache(get_engine(db)).column_statuses(db, board_id)
+    column_statuses = [
+        _sorted_statuses(mapping.get(column.id, ())) for column in board.columns
+    ]
+
+    # Answer unchanged polls before any issue row is loaded
+    state = issue_collection_state(db, Issue.project_id == board.project_id)
+    columns = [
+        (
+            column.id,
+            column.name,
+            column.position,
+            column.updated_at,
+            statuses,
+            column.wip_limit,
+        )
+        for column, statuses in zip(board.columns, column_statuses, strict=True)
     ]
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag("board-snapshot", board_id, limit, board.updated_at, columns, state),
+        latest(board.updated_at, state[1], *(column[3] for column in columns)),
+        is_collection=True,
+    )
+    if not_modified is not None:
+        return not_modified
+
+    statuses = _sorted_statuses({s for group in column_statuses for s in group})
+    issues = _newest_issues_by_status(db, board.project_id, statuses, limit)
+    totals = issue_status_counts(db, board.project_id)
+
+    snapshot_columns = []
+    for column, shown in zip(board.columns, column_statuses, strict=True):
+        column_issues = [issue for issue in issues if issue.status in shown][:limit]
+        snapshot_columns.append(
+            SnapshotColumn(
+                id=column.id,
+                name=column.name,
+                description=column.description,
+                position=column.position,
+                board_id=column.board_id,
+                statuses=shown,
+                wip_limit=column.wip_limit,
+                created_at=column.created_at,
+                updated_at=column.updated_at,
+                total=sum(totals[status] for status in shown),
+                issues=[_board_issue(issue) for issue in column_issues],
+            )
+        )
+    return BoardSnapshot(
+        **BoardResponse.model_validate(board).model_dump(), columns=snapshot_columns
+    )
+
+
+@router.get("/{board_id}/counts", response_model=BoardCounts)
+def get_board_counts(board_id: int, db: Session = Depends(get_db)):
+    """
+    Get the issue counts of a board's header: per status and per column,
+    with each column's WIP limit. Counts come from counters that are kept
+    up to date on every write, so this reads a few rows however many issues
+    the board has.
+    """
+    board = db.query(Board.project_id).filter(Board.id == board_id).first()
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    mapping = get_board_column_cache(get_engine(db)).column_statuses(db, board_id)
+    columns = db.execute(
+        select(BoardColumn.id, BoardColumn.name, BoardColumn.wip_limit)
+        .where(BoardColumn.board_id == board_id)
+        .order_by(BoardColumn.position, BoardColumn.id)
+    )
+    counts = issue_status_counts(db, board.project_id)
+
+    column_counts = []
+    for column in columns:
+        count = sum(counts[status] for status in mapping.get(column.id, ()))
+        column_counts.append(
+            ColumnCount(
+                id=column.id,
+                name=column.name,
+                count=count,
+                wip_limit=column.wip_limit,
+                over_limit=column.wip_limit is not None and count > column.wip_limit,
+            )
+        )
+    return BoardCounts(board_id=board_id, statuses=counts, columns=column_counts)
+
+
+@router.get("/{board_id}/events")
+def stream_board_events(board_id: int, db: Session = Depends(get_db)):
+    """
+    Stream changes to the board's issues as Server-Sent Events, instead of
+    polling the board. Each "issue" event carries a compact diff as JSON:
+    {"op": "created", "id", "issue"}, {"op": "updated", "id", "changes"}
+    with the new status, rank, assignee_id or sprint_id, or
+    {"op": "deleted", "id"}. A "reset" event means the client fell behind
+    and should reload the board. Streams end after a few minutes and
+    EventSource reconnects; reload the board when a stream (re)opens.
+    """
+    board = db.query(Board.project_id).filter(Board.id == board_id).first()
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    hub = get_board_event_hub(get_engine(db))
+    return StreamingResponse(
+        board_event_stream(hub, board.project_id),
+        media_type="text/event-stream",
+        # Keep proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
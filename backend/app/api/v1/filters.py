@@ -0,0 +1,186 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.filter_cache import get_filter_cache
+from app.core.jql import JQLError, compile_order_by, compile_where, parse_jql
+from app.db.base import get_db, get_engine
+from app.models.issue import Issue
+from app.models.saved_filter import SavedFilter
+from app.models.user import User
+
+router = APIRouter()
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+class SavedFilterCreate(BaseModel):
+    name: str
+    jql: str
+    owner_id: int
+
+
+class SavedFilterUpdate(BaseModel):
+    name: str | None = None
+    jql: str | None = None
+
+
+class SavedFilterResponse(BaseModel):
+    id: int
+    name: str
+    jql: str
+    owner_id: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+def _validate_jql(jql: str) -> None:
+    try:
+        parse_jql(jql)
+    except JQLError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+
+def _get_filter_or_404(db: Session, filter_id: int) -> SavedFilter:
+    saved_filter = db.query(SavedFilter).filter(SavedFilter.id == filter_id).first()
+    if not saved_filter:
+        raise HTTPException(status_code=404, detail="Filter not found")
+    return saved_filter
+
+
+@router.get("/", response_model=list[SavedFilterResponse])
+def get_filters(
+    owner_id: int | None = Query(None),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Get saved filters, optionally only those of one owner
+    """
+    query = db.query(SavedFilter)
+    if owner_id is not None:
+        query = query.filter(SavedFilter.owner_id == owner_id)
+    return query.order_by(SavedFilter.id).offset(skip).limit(limit).all()
+
+
+@router.get("/{filter_id}", response_model=SavedFilterResponse)
+def get_filter(filter_id: int, db: Session = Depends(get_db)):
+    """
+    Get a specific saved filter by ID
+    """
+    return _get_filter_or_404(db, filter_id)
+
+
+@router.post("/", response_model=SavedFilterResponse, status_code=201)
+def create_filter(saved_filter: SavedFilterCreate, db: Session = Depends(get_db)):
+    """
+    Save a JQL query under a name
+    """
+    _validate_jql(saved_filter.jql)
+    owner = db.query(User.id).filter(User.id == saved_filter.owner_id).first()
+    if not owner:
+        raise HTTPException(status_code=404, detail="Owner not found")
+
+    db_filter = SavedFilter(**saved_filter.model_dump())
+    db.add(db_filter)
+    db.commit()
+    db.refresh(db_filter)
+    return db_filter
+
+
+@router.put("/{filter_id}", response_model=SavedFilterResponse)
+def update_filter(
+    filter_id: int, saved_filter: SavedFilterUpdate, db: Session = Depends(get_db)
+):
+    """
+    Rename a saved filter or change its query
+    """
+    db_filter = _get_filter_or_404(db, filter_id)
+
+    if saved_filter.name is not None:
+        db_filter.name = saved_filter.name
+    if saved_filter.jql is not None:
+        _validate_jql(saved_filter.jql)
+        db_filter.jql = saved_filter.jql
+
+    db.commit()
+    db.refresh(db_filter)
+    get_filter_cache(get_engine(db)).invalidate(filter_id)
+    return db_filter
+
+
+@router.delete("/{filter_id}", status_code=204)
+def delete_filter(filter_id: int, db: Session = Depends(get_db)):
+    """
+    Delete a saved filter
+    """
+    db_filter = _get_filter_or_404(db, filter_id)
+    db.delete(db_filter)
+    db.commit()
+    get_filter_cache(get_engine(db)).invalidate(filter_id)
+    return None
+
+
+@router.get("/{filter_id}/issues", response_model=list[dict])
+def get_filter_issues(
+    filter_id: int,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Get one page of the issues matching a saved filter.
+    Pages are sliced from the filter's cached result set, which is kept
+    current as issues change; the total is returned in X-Total-Count.
+    """
+    jql = db.query(SavedFilter.jql).filter(SavedFilter.id == filter_id).scalar()
+    if jql is None:
+        raise HTTPException(status_code=404, detail="Filter not found")
+
+    page = get_filter_cache(get_engine(db)).page(filter_id, jql, skip, limit)
+    if page is None:
+        # Too many matches to cache: run the query for this page
+        parsed = parse_jql(jql)
+        query = db.query(Issue).filter(compile_where(parsed.where))
+        response.headers[TOTAL_COUNT_HEADER] = str(query.count())
+        issues = (
+            query.order_by(*compile_order_by(parsed.order_by))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    else:
+        ids, total = page
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+        issues_by_id = {
+            issue.id: issue for issue in db.query(Issue).filter(Issue.id.in_(ids)).all()
+        }
+        issues = [
+            issues_by_id[issue_id] for issue_id in ids if issue_id in issues_by_id
+        ]
+
+    return [
+        {
+            "id": issue.id,
+            "key": issue.issue_key,
+            "title": issue.title,
+            "description": issue.description,
+            "status": issue.status.value,
+            "priority": issue.priority.value,
+            "issue_type": issue.issue_type.value,
+            "project_id": issue.project_id,
+            "reporter_id": issue.reporter_id,
+            "assignee_id": issue.assignee_id,
+            "sprint_id": issue.sprint_id,
+            "created_at": issue.created_at.isoformat() if issue.created_at else None,
+            "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+        }
+        for issue in issues
+    ]
@@ -1,13 +1,56 @@
+import json
+from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
-
-from app.db.base import get_db
-from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import String, bindparam, cast, insert, literal, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.core.board_events import stage_issue_created, stage_issue_updated
+from app.core.changes import CREATED, UPDATED, mark_issues_changed
+from app.core.conditional import conditional_response, make_etag
+from app.core.config import settings
+from app.core.facets import (
+    FACETS_DESCRIPTION,
+    count_facets,
+    parse_facets,
+    set_facets_header,
+)
+from app.core.fields import (
+    FIELDS_DESCRIPTION,
+    issue_fields_response,
+    load_issue_fields,
+    parse_issue_fields,
+)
+from app.core.fulltext import matching_issues
+from app.core.lexorank import MAX_RANK_LENGTH, rank_between, spread_ranks
+from app.core.pagination import paginate_newest_first
+from app.core.wip_limits import WIP_OVERRIDE_DESCRIPTION, enforce_wip_limits
+from app.db.base import get_db, get_engine
+from app.models.issue import (
+    Issue,
+    IssuePriority,
+    IssueStatus,
+    IssueType,
+    allocate_issue_numbers,
+    allocate_issue_ranks,
+)
+from app.models.issue_history import IssueEvent, decode_changes, record_issue_events
 from app.models.project import Project
+from app.models.sprint import Sprint
 from app.models.user import User
 
 router = APIRouter()
@@ -53,6 +96,7 @@ class IssueResponse(BaseModel):
     reporter_id: int
     sprint_id: int | None = None
     parent_issue_id: int | None = None
+    rank: str
     created_at: datetime
     updated_at: datetime
 
@@ -60,16 +104,31 @@ class IssueResponse(BaseModel):
         from_attributes = True
 
 
-def _generate_issue_key(project_key: str, issue_id: int) -> str:
-    """Generate issue key in format PROJ-123"""
-    return f"{project_key}-{issue_id}"
+class BulkItemResult(BaseModel):
+    index: int
+    status: Literal["created", "error"]
+    id: int | None = None
+    key: str | None = None
+    detail: str | None = None
+
+
+class BulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkItemResult]
+
+
+# Issues on either side of a too long rank that a rebalance starts with
+RANK_REBALANCE_WINDOW = 16
+
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
 
 
 def _issue_to_response(issue: Issue) -> IssueResponse:
-    """Convert Issue model to IssueResponse with generated key"""
+    """Convert Issue model to IssueResponse"""
     return IssueResponse(
         id=issue.id,
-        key=_generate_issue_key(issue.project.key, issue.id),
+        key=issue.issue_key,
         title=issue.title,
         description=issue.description,
         issue_type=issue.issue_type,
@@ -80,15 +139,87 @@ def _issue_to_response(issue: Issue) -> IssueResponse:
         reporter_id=issue.reporter_id,
         sprint_id=issue.sprint_id,
         parent_issue_id=issue.parent_issue_id,
+        rank=issue.rank,
         created_at=issue.created_at,
         updated_at=issue.updated_at,
     )
 
 
+def rebalance_issue_ranks(bind: Engine, project_id: int, rank: str) -> None:
+    """
+    Spread out the ranks of a project's issues around rank, keeping their
+    order. Only a window of issues on either side is rewritten; it doubles
+    until the ranks just outside it leave enough room, which at worst means
+    the whole project.
+    """
+    ranked = select(Issue.id, Issue.rank).where(Issue.project_id == project_id)
+    with Session(bind) as db:
+        window = RANK_REBALANCE_WINDOW
+        while True:
+            below = list(
+                db.execute(
+                    ranked.where(Issue.rank < rank)
+                    .order_by(Issue.rank.desc(), Issue.id.desc())
+                    .limit(window + 1)
+                    .with_for_update()
+                )
+            )
+            above = list(
+                db.execute(
+                    ranked.where(Issue.rank >= rank)
+                    .order_by(Issue.rank, Issue.id)
+                    .limit(window + 1)
+                    .with_for_update()
+                )
+            )
+            # The issues just outside the window bound it and stay put
+            low = below.pop().rank if len(below) > window else None
+            high = above.pop().rank if len(above) > window else None
+            rows = below[::-1] + above
+            ranks = spread_ranks(low, high, len(rows))
+            if ranks is not None:
+                break
+            window *= 2
+
+        if not rows:
+            return
+        db.execute(
+            update(Issue.__table__)
+            .where(Issue.id == bindparam("issue_id"))
+            .values(rank=bindparam("new_rank")),
+            [
+                {"issue_id": row.id, "new_rank": new_rank}
+                for row, new_rank in zip(rows, ranks, strict=True)
+            ],
+        )
+        for row, new_rank in zip(rows, ranks, strict=True):
+            stage_issue_updated(db, project_id, row.id, {"rank": new_rank})
+        mark_issues_changed(db, UPDATED, [row.id for row in rows])
+        db.commit()
+
+
+def _rebalance_long_ranks(
+    background_tasks: BackgroundTasks, db: Session, ranked: list[tuple[int, str]]
+) -> None:
+    """
+    Schedule a rebalance, after the response, around every rank that is too
+    long. ranked holds (project_id, rank) pairs.
+    """
+    for project_id, rank in ranked:
+        if len(rank) > MAX_RANK_LENGTH:
+            background_tasks.add_task(
+                rebalance_issue_ranks, get_engine(db), project_id, rank
+            )
+
+
 @router.get("/", response_model=list[IssueResponse])
-async def get_issues(
+def get_issues(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     project_id: int | None = None,
     assignee_id: int | None = None,
     reporter_id: int | None = None,
@@ -97,11 +228,16 @@ async def get_issues(
     priority: IssuePriority | None = None,
     status: IssueStatus | None = None,
     search: str | None = None,
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """
-    Get all issues with filtering and pagination
+    Get all issues with filtering and pagination.
+    With fields, only those issue fields are loaded and returned. With
+    facets, counts over all matching issues come back in X-Facets.
     """
+    field_names = parse_issue_fields(fields)
+    facet_names = parse_facets(facets)
     query = db.query(Issue)
 
     if project_id is not None:
@@ -119,21 +255,51 @@ async def get_issues(
     if status is not None:
         query = query.filter(Issue.status == status)
     if search is not None:
-        search_filter = or_(
-            Issue.title.ilike(f"%{search}%"),
-            Issue.description.ilike(f"%{search}%"),
-        )
-        query = query.filter(search_filter)
-
-    issues = query.order_by(Issue.created_at.desc()).offset(skip).limit(limit).all()
+        query = query.filter(matching_issues(search))
+
+    if facet_names is not None:
+        set_facets_header(response, count_facets(query, facet_names))
+    if field_names is not None:
+        query = load_issue_fields(query, field_names)
+
+    issues = paginate_newest_first(
+        query,
+        sort_column=Issue.created_at,
+        id_column=Issue.id,
+        request=request,
+        response=response,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    if field_names is not None:
+        return issue_fields_response(issues, field_names, response)
     return [_issue_to_response(issue) for issue in issues]
 
 
 @router.get("/{issue_id}", response_model=IssueResponse)
-async def get_issue(issue_id: int, db: Session = Depends(get_db)):
+def get_issue(
+    issue_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
     """
-    Get a specific issue by ID
+    Get a specific issue by ID.
+    Supports If-None-Match and If-Modified-Since, answered with 304 from the
+    issue's updated_at and version without loading the issue.
     """
+    state = (
+        db.query(Issue.updated_at, Issue.version).filter(Issue.id == issue_id).first()
+    )
+    if not state:
+        raise HTTPException(status_code=404, detail="Issue not found")
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag("issue", issue_id, state.updated_at, state.version),
+        state.updated_at,
+    )
+    if not_modified is not None:
+        return not_modified
+
     issue = db.query(Issue).filter(Issue.id == issue_id).first()
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
@@ -141,28 +307,16 @@ async def get_issue(issue_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/key/{issue_key}", response_model=IssueResponse)
-async def get_issue_by_key(issue_key: str, db: Session = Depends(get_db)):
+def get_issue_by_key(issue_key: str, db: Session = Depends(get_db)):
     """
     Get a specific issue by key (e.g., "PROJ-123")
     """
-    # Parse issue key (format: PROJ-123)
-    try:
-        project_key, issue_id_str = issue_key.rsplit("-", 1)
-        issue_id = int(issue_id_str)
-    except ValueError:
+    # Reject malformed keys (format: PROJ-123) without touching the database
+    _, _, number = issue_key.rpartition("-")
+    if not number.isdigit():
         raise HTTPException(status_code=400, detail="Invalid issue key format")
 
-    # Find project by key
-    project = db.query(Project).filter(Project.key == project_key).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Find issue
-    issue = (
-        db.query(Issue)
-        .filter(Issue.id == issue_id, Issue.project_id == project.id)
-        .first()
-    )
+    issue = db.query(Issue).filter(Issue.issue_key == issue_key).first()
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
@@ -170,9 +324,17 @@ async def get_issue_by_key(issue_key: str, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=IssueResponse, status_code=201)
-async def create_issue(issue: IssueCreate, db: Session = Depends(get_db)):
+def create_issue(
+    issue: IssueCreate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    override_wip_limit: bool = Query(False, description=WIP_OVERRIDE_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
     """
-    Create a new issue
+    Create a new issue, ranked last in its project. New issues enter the
+    columns showing their status, so one that takes a column past its WIP
+    limit fails with 409 unless override_wip_limit is set.
     """
     # Verify project exists
     project = db.query(Project).filter(Project.id == issue.project_id).first()
@@ -192,9 +354,7 @@ async def create_issue(issue: IssueCreate, db: Session = Depends(get_db)):
 
     # Verify parent issue if provided
     if issue.parent_issue_id is not None:
-        parent_issue = (
-            db.query(Issue).filter(Issue.id == issue.parent_issue_id).first()
-        )
+        parent_issue = db.query(Issue).filter(Issue.id == issue.parent_issue_id).first()
         if not parent_issue:
             raise HTTPException(status_code=404, detail="Parent issue not found")
         if parent_issue.project_id != issue.project_id:
@@ -215,15 +375,388 @@ async def create_issue(issue: IssueCreate, db: Session = Depends(get_db)):
         parent_issue_id=issue.parent_issue_id,
     )
     db.add(db_issue)
+    db.flush()
+    enforce_wip_limits(
+        db, response, [(db_issue.project_id, None, db_issue.status)], override_wip_limit
+    )
     db.commit()
     db.refresh(db_issue)
+    _rebalance_long_ranks(background_tasks, db, [(db_issue.project_id, db_issue.rank)])
     return _issue_to_response(db_issue)
 
 
-@router.put("/{issue_id}", response_model=IssueResponse)
-async def update_issue(
-    issue_id: int, issue: IssueUpdate, db: Session = Depends(get_db)
+async def read_bulk_items(request: Request) -> list:
+    """Read a bulk request body sent as a JSON array or as NDJSON"""
+    body = await request.body()
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if media_type in NDJSON_MEDIA_TYPES:
+        items = []
+        for line_number, line in enumerate(body.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid JSON on line {line_number}"
+                ) from None
+    else:
+        try:
+            items = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body") from None
+        if not isinstance(items, list):
+            raise HTTPException(
+                status_code=400, detail="Expected a JSON array of issues"
+            )
+
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many issues in one request (max {settings.BULK_MAX_ITEMS})",
+        )
+    return items
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Flatten a pydantic error into one line per invalid field"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'body'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+def _check_bulk_references(db: Session, issues: list[IssueCreate]) -> list[str | None]:
+    """
+    Check the foreign keys of a whole batch with one IN query per table.
+    Returns an error message (or None) for each issue, in the same order.
+    """
+    project_ids = {issue.project_id for issue in issues}
+    user_ids = {issue.reporter_id for issue in issues} | {
+        issue.assignee_id for issue in issues if issue.assignee_id is not None
+    }
+    parent_ids = {
+        issue.parent_issue_id for issue in issues if issue.parent_issue_id is not None
+    }
+    sprint_ids = {issue.sprint_id for issue in issues if issue.sprint_id is not None}
+
+    existing_projects = {
+        row.id for row in db.query(Project.id).filter(Project.id.in_(project_ids))
+    }
+    existing_users = {row.id for row in db.query(User.id).filter(User.id.in_(user_ids))}
+    parent_projects: dict[int, int] = (
+        {
+            row.id: row.project_id
+            for row in db.query(Issue.id, Issue.project_id).filter(
+                Issue.id.in_(parent_ids)
+            )
+        }
+        if parent_ids
+        else {}
+    )
+    existing_sprints = (
+        {row.id for row in db.query(Sprint.id).filter(Sprint.id.in_(sprint_ids))}
+        if sprint_ids
+        else set()
+    )
+
+    errors: list[str | None] = []
+    for issue in issues:
+        if issue.project_id not in existing_projects:
+            errors.append("Project not found")
+        elif issue.reporter_id not in existing_users:
+            errors.append("Reporter not found")
+        elif issue.assignee_id is not None and issue.assignee_id not in existing_users:
+            errors.append("Assignee not found")
+        elif (
+            issue.parent_issue_id is not None
+            and issue.parent_issue_id not in parent_projects
+        ):
+            errors.append("Parent issue not found")
+        elif (
+            issue.parent_issue_id is not None
+            and parent_projects[issue.parent_issue_id] != issue.project_id
+        ):
+            errors.append("Parent issue must be in the same project")
+        elif issue.sprint_id is not None and issue.sprint_id not in existing_sprints:
+            errors.append("Sprint not found")
+        else:
+            errors.append(None)
+    return errors
+
+
+def _insert_issue_chunk(
+    db: Session,
+    chunk: list[tuple[int, IssueCreate]],
+    background_tasks: BackgroundTasks,
+    response: Response,
+    override_wip_limit: bool,
+) -> list[tuple[int, str]]:
+    """
+    Insert a chunk of validated issues with one executemany in one transaction
+    and return the (id, key) of each, in chunk order. A chunk that takes a
+    column past its WIP limit is rolled back with a 409 HTTPException unless
+    override_wip_limit is set.
+    Issue numbers and ranks are reserved per project in a single block,
+    since bulk inserts bypass the flush hooks that number and rank single
+    issues.
+    """
+    connection = db.connection()
+    next_number: dict[int, tuple[str, int]] = {}
+    ranks: dict[int, Iterator[str]] = {}
+    for project_id, count in Counter(issue.project_id for _, issue in chunk).items():
+        project_key, first_number = allocate_issue_numbers(
+            connection, project_id, count
+        )
+        next_number[project_id] = (project_key, first_number)
+        ranks[project_id] = iter(allocate_issue_ranks(connection, project_id, count))
+
+    rows: list[dict[str, Any]] = []
+    for _, issue in chunk:
+        project_key, number = next_number[issue.project_id]
+        next_number[issue.project_id] = (project_key, number + 1)
+        rows.append(
+            {
+                **issue.model_dump(),
+                "number": number,
+                "issue_key": f"{project_key}-{number}",
+                "rank": next(ranks[issue.project_id]),
+            }
+        )
+
+    # A table insert is one executemany; the ORM bulk path would split the
+    # batch wherever rows differ in which optional fields are None
+    db.execute(insert(Issue.__table__), rows)
+    # SQLite cannot return ids from a batched insert in parameter order, so
+    # read them back through the unique key index instead
+    keys = [row["issue_key"] for row in rows]
+    ids_by_key: dict[str, int] = {
+        row.issue_key: row.id
+        for row in db.query(Issue.issue_key, Issue.id).filter(Issue.issue_key.in_(keys))
+    }
+    for row in rows:
+        # New issues start in the column default status
+        fields = {"status": IssueStatus.TO_DO, **row}
+        stage_issue_created(db, row["project_id"], ids_by_key[row["issue_key"]], fields)
+    enforce_wip_limits(
+        db,
+        response,
+        [(row["project_id"], None, IssueStatus.TO_DO) for row in rows],
+        override_wip_limit,
+    )
+    mark_issues_changed(db, CREATED, ids_by_key.values())
+    db.commit()
+    _rebalance_long_ranks(
+        background_tasks, db, [(row["project_id"], row["rank"]) for row in rows]
+    )
+    return [(ids_by_key[key], key) for key in keys]
+
+
+@router.post("/bulk", response_model=BulkCreateResponse)
+def create_issues_bulk(
+    background_tasks: BackgroundTasks,
+    response: Response,
+    override_wip_limit: bool = Query(False, description=WIP_OVERRIDE_DESCRIPTION),
+    items: list = Depends(read_bulk_items),
+    db: Session = Depends(get_db),
 ):
+    """
+    Create many issues at once from a JSON array or an NDJSON body
+    (Content-Type: application/x-ndjson). Each item is validated on its own
+    and reported in results by its position in the request; invalid items
+    do not stop the valid ones from being created. Issues are inserted in
+    chunks, and a chunk that takes a board column past its WIP limit fails
+    as a whole unless override_wip_limit is set.
+    """
+    results: dict[int, BulkItemResult] = {}
+
+    parsed = []
+    for index, item in enumerate(items):
+        try:
+            parsed.append((index, IssueCreate.model_validate(item)))
+        except ValidationError as e:
+            results[index] = BulkItemResult(
+                index=index, status="error", detail=_format_validation_error(e)
+            )
+
+    accepted = []
+    if parsed:
+        errors = _check_bulk_references(db, [issue for _, issue in parsed])
+        for (index, issue), error in zip(parsed, errors, strict=True):
+            if error is None:
+                accepted.append((index, issue))
+            else:
+                results[index] = BulkItemResult(
+                    index=index, status="error", detail=error
+                )
+
+    chunk_size = settings.BULK_CHUNK_SIZE
+    for start in range(0, len(accepted), chunk_size):
+        chunk = accepted[start : start + chunk_size]
+        try:
+            inserted = _insert_issue_chunk(
+                db, chunk, background_tasks, response, override_wip_limit
+            )
+        except IntegrityError:
+            db.rollback()
+            for index, _ in chunk:
+                results[index] = BulkItemResult(
+                    index=index, status="error", detail="Issue could not be saved"
+                )
+            continue
+        except HTTPException as e:
+            # Over a WIP limit; the chunk has been rolled back
+            for index, _ in chunk:
+                results[index] = BulkItemResult(
+                    index=index, status="error", detail=e.detail
+                )
+            continue
+        for (index, _), (issue_id, issue_key) in zip(chunk, inserted, strict=True):
+            results[index] = BulkItemResult(
+                index=index, status="created", id=issue_id, key=issue_key
+            )
+
+    ordered = [results[index] for index in range(len(items))]
+    created = sum(1 for result in ordered if result.status == "created")
+    return BulkCreateResponse(
+        created=created, failed=len(ordered) - created, results=ordered
+    )
+
+
+class BulkIssueFilter(BaseModel):
+    project_id: int | None = None
+    assignee_id: int | None = None
+    reporter_id: int | None = None
+    sprint_id: int | None = None
+    issue_type: IssueType | None = None
+    priority: IssuePriority | None = None
+    status: IssueStatus | None = None
+
+
+class BulkIssuePatch(BaseModel):
+    status: IssueStatus | None = None
+    priority: IssuePriority | None = None
+    issue_type: IssueType | None = None
+    assignee_id: int | None = None
+    sprint_id: int | None = None
+
+
+class BulkUpdateRequest(BaseModel):
+    ids: list[int] | None = None
+    filter: BulkIssueFilter | None = None
+    patch: BulkIssuePatch
+    return_rows: bool = False
+    # Apply status changes that take a board column past its WIP limit
+    override_wip_limit: bool = False
+
+
+class BulkUpdateResponse(BaseModel):
+    updated: int
+    issues: list[IssueResponse] | None = None
+
+
+# Patch fields that may be set to null to clear them
+CLEARABLE_PATCH_FIELDS = {"assignee_id", "sprint_id"}
+
+
+@router.patch("/bulk", response_model=BulkUpdateResponse)
+def update_issues_bulk(
+    request: BulkUpdateRequest, response: Response, db: Session = Depends(get_db)
+):
+    """
+    Apply one field patch to every issue selected by ids or by filter.
+    The change is a single UPDATE in one transaction; only fields present
+    in patch are written, and assignee_id/sprint_id may be null to clear them.
+    A status change that takes a board column past its WIP limit fails with
+    409 unless override_wip_limit is set.
+    """
+    if (request.ids is None) == (request.filter is None):
+        raise HTTPException(
+            status_code=400, detail="Provide either ids or filter, not both"
+        )
+
+    if request.ids is not None:
+        if len(request.ids) > settings.BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Too many issues in one request (max {settings.BULK_MAX_ITEMS})",
+            )
+        conditions = [Issue.id.in_(request.ids)]
+    elif request.filter is not None:
+        criteria = request.filter.model_dump(exclude_none=True)
+        if not criteria:
+            raise HTTPException(
+                status_code=400, detail="Filter must set at least one field"
+            )
+        conditions = [
+            getattr(Issue, field) == value for field, value in criteria.items()
+        ]
+
+    values = request.patch.model_dump(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="Patch must set at least one field")
+    for field, value in values.items():
+        if value is None and field not in CLEARABLE_PATCH_FIELDS:
+            raise HTTPException(status_code=400, detail=f"{field} cannot be null")
+
+    if values.get("assignee_id") is not None:
+        assignee = db.query(User.id).filter(User.id == values["assignee_id"]).first()
+        if not assignee:
+            raise HTTPException(status_code=404, detail="Assignee not found")
+    if values.get("sprint_id") is not None:
+        sprint = db.query(Sprint.id).filter(Sprint.id == values["sprint_id"]).first()
+        if not sprint:
+            raise HTTPException(status_code=404, detail="Sprint not found")
+
+    # Read the current values first so the history records what changed;
+    # both statements run in the same transaction
+    patched_columns = [getattr(Issue, field) for field in values]
+    previous = (
+        db.query(Issue.id, Issue.project_id, *patched_columns).filter(*conditions).all()
+    )
+
+    updated_ids = db.scalars(
+        update(Issue).where(*conditions).values(**values).returning(Issue.id)
+    ).all()
+
+    if "status" in values:
+        enforce_wip_limits(
+            db,
+            response,
+            [(row.project_id, row.status, values["status"]) for row in previous],
+            request.override_wip_limit,
+        )
+
+    events = []
+    for row in previous:
+        changes = {
+            field: (old, values[field])
+            for field, old in zip(values, row[2:], strict=True)
+            if old != values[field]
+        }
+        if changes:
+            events.append((row.id, changes))
+            stage_issue_updated(
+                db, row.project_id, row.id, {field: values[field] for field in changes}
+            )
+    record_issue_events(db.connection(), events)
+    mark_issues_changed(db, UPDATED, updated_ids)
+    db.commit()
+
+    issues = None
+    if request.return_rows:
+        issues = [
+            _issue_to_response(issue)
+            for issue in db.query(Issue)
+            .filter(Issue.id.in_(updated_ids))
+            .order_by(Issue.id)
+        ]
+    return BulkUpdateResponse(updated=len(updated_ids), issues=issues)
+
+
+@router.put("/{issue_id}", response_model=IssueResponse)
+def update_issue(issue_id: int, issue: IssueUpdate, db: Session = Depends(get_db)):
     """
     Update an existing issue
     """
@@ -253,9 +786,7 @@ async def update_issue(
             raise HTTPException(
                 status_code=400, detail="Issue cannot be its own parent"
             )
-        parent_issue = (
-            db.query(Issue).filter(Issue.id == issue.parent_issue_id).first()
-        )
+        parent_issue = db.query(Issue).filter(Issue.id == issue.parent_issue_id).first()
         if not parent_issue:
             raise HTTPException(status_code=404, detail="Parent issue not found")
         if parent_issue.project_id != db_issue.project_id:
@@ -274,7 +805,7 @@ class AssignIssueRequest(BaseModel):
 
 
 @router.patch("/{issue_id}/assign", response_model=IssueResponse)
-async def assign_issue(
+def assign_issue(
     issue_id: int, request: AssignIssueRequest, db: Session = Depends(get_db)
 ):
     """
@@ -300,17 +831,30 @@ class UpdateStatusRequest(BaseModel):
 
 
 @router.patch("/{issue_id}/status", response_model=IssueResponse)
-async def update_issue_status(
-    issue_id: int, request: UpdateStatusRequest, db: Session = Depends(get_db)
+def update_issue_status(
+    issue_id: int,
+    request: UpdateStatusRequest,
+    response: Response,
+    override_wip_limit: bool = Query(False, description=WIP_OVERRIDE_DESCRIPTION),
+    db: Session = Depends(get_db),
 ):
     """
-    Update the status of an issue
+    Update the status of an issue. A move that takes a board column past
+    its WIP limit fails with 409 unless override_wip_limit is set.
     """
     db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
     if not db_issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
+    previous_status = db_issue.status
     db_issue.status = request.status
+    db.flush()
+    enforce_wip_limits(
+        db,
+        response,
+        [(db_issue.project_id, previous_status, request.status)],
+        override_wip_limit,
+    )
     db.commit()
     db.refresh(db_issue)
     return _issue_to_response(db_issue)
@@ -321,7 +865,7 @@ class UpdatePriorityRequest(BaseModel):
 
 
 @router.patch("/{issue_id}/priority", response_model=IssueResponse)
-async def update_issue_priority(
+def update_issue_priority(
     issue_id: int, request: UpdatePriorityRequest, db: Session = Depends(get_db)
 ):
     """
@@ -337,8 +881,97 @@ async def update_issue_priority(
     return _issue_to_response(db_issue)
 
 
+class RankIssueRequest(BaseModel):
+    # The neighbours the issue is dropped between; at least one is required
+    after_id: int | None = None
+    before_id: int | None = None
+
+
+def _neighbour_rank(db: Session, issue: Issue, neighbour_id: int | None) -> str | None:
+    if neighbour_id is None:
+        return None
+    if neighbour_id == issue.id:
+        raise HTTPException(status_code=400, detail="Issue cannot be its own neighbour")
+    neighbour = (
+        db.query(Issue.project_id, Issue.rank).filter(Issue.id == neighbour_id).first()
+    )
+    if not neighbour:
+        raise HTTPException(status_code=404, detail="Neighbour issue not found")
+    if neighbour.project_id != issue.project_id:
+        raise HTTPException(
+            status_code=400, detail="Neighbour issue must be in the same project"
+        )
+    rank: str = neighbour.rank
+    return rank
+
+
+def _rank_bounds(
+    db: Session, issue: Issue, request: RankIssueRequest
+) -> tuple[str | None, str | None]:
+    """The ranks the issue is to be placed between; None is an open end"""
+    lower = _neighbour_rank(db, issue, request.after_id)
+    upper = _neighbour_rank(db, issue, request.before_id)
+
+    # With one neighbour, the other is the next rank over in the project,
+    # one seek on the (project_id, rank) index
+    others = select(Issue.rank).where(
+        Issue.project_id == issue.project_id, Issue.id != issue.id
+    )
+    if upper is None:
+        upper = db.scalar(
+            others.where(Issue.rank > lower).order_by(Issue.rank).limit(1)
+        )
+    elif lower is None:
+        lower = db.scalar(
+            others.where(Issue.rank < upper).order_by(Issue.rank.desc()).limit(1)
+        )
+    return lower, upper
+
+
+@router.patch("/{issue_id}/rank", response_model=IssueResponse)
+def rank_issue(
+    issue_id: int,
+    request: RankIssueRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    """
+    Move an issue in its project's manual order, e.g. after a drag and drop
+    in a board column or sprint backlog: after after_id and/or before
+    before_id. Given one neighbour, the issue goes right next to it.
+    Only the moved issue's row is written; when its new rank gets long, the
+    project's ranks are rebalanced after the response is sent.
+    """
+    if request.after_id is None and request.before_id is None:
+        raise HTTPException(
+            status_code=400, detail="Provide after_id, before_id or both"
+        )
+
+    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    if not db_issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    lower, upper = _rank_bounds(db, db_issue, request)
+    if lower is not None and lower == upper:
+        # Only issues created concurrently share a rank; spreading the
+        # project out separates them. End this transaction so it can write.
+        db.rollback()
+        rebalance_issue_ranks(get_engine(db), db_issue.project_id, lower)
+        lower, upper = _rank_bounds(db, db_issue, request)
+    if lower is not None and upper is not None and lower >= upper:
+        raise HTTPException(
+            status_code=400, detail="after_id must be ranked before before_id"
+        )
+
+    db_issue.rank = rank_between(lower, upper)
+    db.commit()
+    db.refresh(db_issue)
+    _rebalance_long_ranks(background_tasks, db, [(db_issue.project_id, db_issue.rank)])
+    return _issue_to_response(db_issue)
+
+
 @router.delete("/{issue_id}", status_code=204)
-async def delete_issue(issue_id: int, db: Session = Depends(get_db)):
+def delete_issue(issue_id: int, db: Session = Depends(get_db)):
     """
     Delete an issue
     """
@@ -352,7 +985,7 @@ async def delete_issue(issue_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{issue_id}/comments", response_model=list[dict])
-async def get_issue_comments(issue_id: int, db: Session = Depends(get_db)):
+def get_issue_comments(issue_id: int, db: Session = Depends(get_db)):
     """
     Get all comments for an issue
     """
@@ -376,14 +1009,16 @@ async def get_issue_comments(issue_id: int, db: Session = Depends(get_db)):
             "body": comment.body,
             "author_id": comment.author_id,
             "issue_id": comment.issue_id,
-            "created_at": comment.created_at.isoformat() if comment.created_at else None,
+            "created_at": comment.created_at.isoformat()
+            if comment.created_at
+            else None,
         }
         for comment in comments
     ]
 
 
 @router.get("/{issue_id}/attachments", response_model=list[dict])
-async def get_issue_attachments(issue_id: int, db: Session = Depends(get_db)):
+def get_issue_attachments(issue_id: int, db: Session = Depends(get_db)):
     """
     Get all attachments for an issue
     """
@@ -396,15 +1031,120 @@ async def get_issue_attachments(issue_id: int, db: Session = Depends(get_db)):
     return []
 
 
+# Deepest level returned by the tree endpoint; also stops runaway recursion
+# should parent links ever form a cycle
+MAX_TREE_DEPTH = 50
+
+
+@router.get("/{issue_id}/tree", response_model=list[dict])
+def get_issue_tree(
+    issue_id: int,
+    max_depth: int | None = Query(None, ge=0, le=MAX_TREE_DEPTH),
+    db: Session = Depends(get_db),
+):
+    """
+    Get an issue and all of its descendants in one recursive query.
+    Nodes are returned depth-first with their depth below the root, the
+    path of issue ids from the root, and status counts rolled up over the
+    node's returned subtree (including itself).
+    """
+    depth_limit = MAX_TREE_DEPTH if max_depth is None else max_depth
+
+    tree = (
+        select(
+            Issue.id,
+            literal(0).label("depth"),
+            cast(Issue.id, String).label("path"),
+        )
+        .where(Issue.id == issue_id)
+        .cte("tree", recursive=True)
+    )
+    child = aliased(Issue)
+    tree = tree.union_all(
+        select(
+            child.id,
+            tree.c.depth + 1,
+            tree.c.path + "/" + cast(child.id, String),
+        )
+        .join(tree, child.parent_issue_id == tree.c.id)
+        .where(tree.c.depth < depth_limit)
+    )
+
+    rows = db.execute(
+        select(
+            Issue.id,
+            Issue.issue_key,
+            Issue.title,
+            Issue.status,
+            Issue.priority,
+            Issue.issue_type,
+            Issue.assignee_id,
+            Issue.parent_issue_id,
+            tree.c.depth,
+            tree.c.path,
+        ).join(tree, Issue.id == tree.c.id)
+    ).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Issue not found")
+
+    nodes = {}
+    for row in rows:
+        nodes[row.id] = {
+            "id": row.id,
+            "key": row.issue_key,
+            "title": row.title,
+            "status": row.status.value,
+            "priority": row.priority.value,
+            "issue_type": row.issue_type.value,
+            "assignee_id": row.assignee_id,
+            "parent_issue_id": row.parent_issue_id,
+            "depth": row.depth,
+            "path": [int(part) for part in row.path.split("/")],
+            "status_counts": dict.fromkeys((status.value for status in IssueStatus), 0),
+        }
+    # Every node counts towards itself and each of its ancestors
+    for node in nodes.values():
+        for ancestor_id in node["path"]:
+            nodes[ancestor_id]["status_counts"][node["status"]] += 1
+
+    return sorted(nodes.values(), key=lambda node: node["path"])
+
+
 @router.get("/{issue_id}/history", response_model=list[dict])
-async def get_issue_history(issue_id: int, db: Session = Depends(get_db)):
+def get_issue_history(
+    issue_id: int,
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    db: Session = Depends(get_db),
+):
     """
-    Get change history for an issue
+    Get change history for an issue, newest first
     """
     # Verify issue exists
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = db.query(Issue.id).filter(Issue.id == issue_id).first()
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
 
-    # TODO: Implement when IssueHistory model is added
-    return []
+    events = paginate_newest_first(
+        db.query(IssueEvent).filter(IssueEvent.issue_id == issue_id),
+        sort_column=IssueEvent.ts,
+        id_column=IssueEvent.id,
+        request=request,
+        response=response,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+
+    return [
+        {
+            "id": event.id,
+            "issue_id": event.issue_id,
+            "ts": event.ts.isoformat() if event.ts else None,
+            "changes": decode_changes(event.changes),
+        }
+        for event in events
+    ]
@@ -59,7 +59,7 @@ class NotificationResponse(NotificationBase):
 
 
 @router.get("/", response_model=list[NotificationResponse])
-async def get_notifications(
+def get_notifications(
     user_id: int,
     type: NotificationType | None = Query(None),
     unread_only: bool = Query(False),
@@ -74,7 +74,7 @@ async def get_notifications(
         query = query.filter(Notification.type == type)
 
     if unread_only:
-        query = query.filter(not Notification.is_read)
+        query = query.filter(Notification.is_read.is_(False))
 
     notifications = (
         query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
@@ -84,7 +84,7 @@ async def get_notifications(
 
 
 @router.get("/{notification_id}", response_model=NotificationResponse)
-async def get_notification(notification_id: int, db: Session = Depends(get_db)):
+def get_notification(notification_id: int, db: Session = Depends(get_db)):
     """Get a specific notification"""
     notification = (
         db.query(Notification).filter(Notification.id == notification_id).first()
@@ -96,7 +96,7 @@ async def get_notification(notification_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=NotificationResponse, status_code=201)
-async def create_notification(
+def create_notification(
     notification: NotificationCreate, db: Session = Depends(get_db)
 ):
     """Create a new notification"""
@@ -120,7 +120,7 @@ async def create_notification(
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
-async def mark_as_read(notification_id: int, db: Session = Depends(get_db)):
+def mark_as_read(notification_id: int, db: Session = Depends(get_db)):
     """Mark notification as read"""
     notification = (
         db.query(Notification).filter(Notification.id == notification_id).first()
@@ -136,7 +136,7 @@ async def mark_as_read(notification_id: int, db: Session = Depends(get_db)):
 
 
 @router.patch("/{notification_id}/toggle", response_model=NotificationResponse)
-async def toggle_read_status(notification_id: int, db: Session = Depends(get_db)):
+def toggle_read_status(notification_id: int, db: Session = Depends(get_db)):
     """Toggle notification read status"""
     notification = (
         db.query(Notification).filter(Notification.id == notification_id).first()
@@ -152,10 +152,10 @@ async def toggle_read_status(notification_id: int, db: Session = Depends(get_db)
 
 
 @router.patch("/mark-all-read")
-async def mark_all_read(user_id: int, db: Session = Depends(get_db)):
+def mark_all_read(user_id: int, db: Session = Depends(get_db)):
     """Mark all notifications as read for a user"""
     db.query(Notification).filter(
-        Notification.user_id == user_id, not Notification.is_read
+        Notification.user_id == user_id, Notification.is_read.is_(False)
     ).update({"is_read": True})
     db.commit()
 
@@ -163,11 +163,11 @@ async def mark_all_read(user_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/unread/count")
-async def get_unread_count(user_id: int, db: Session = Depends(get_db)):
+def get_unread_count(user_id: int, db: Session = Depends(get_db)):
     """Get unread notification count for a user"""
     count = (
         db.query(Notification)
-        .filter(Notification.user_id == user_id, not Notification.is_read)
+        .filter(Notification.user_id == user_id, Notification.is_read.is_(False))
         .count()
     )
 
@@ -175,7 +175,7 @@ async def get_unread_count(user_id: int, db: Session = Depends(get_db)):
 
 
 @router.delete("/{notification_id}", status_code=204)
-async def delete_notification(notification_id: int, db: Session = Depends(get_db)):
+def delete_notification(notification_id: int, db: Session = Depends(get_db)):
     """Delete a notification"""
     notification = (
         db.query(Notification).filter(Notification.id == notification_id).first()
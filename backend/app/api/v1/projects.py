@@ -1,8 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app.core.export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    stream_issues_csv,
+    stream_issues_ndjson,
+)
+from app.core.fields import (
+    FIELDS_DESCRIPTION,
+    ISSUE_FIELDS,
+    issue_fields_response,
+    load_issue_fields,
+    parse_issue_fields,
+)
+from app.core.pagination import paginate_newest_first
 from app.db.base import get_db
 from app.models.project import Project, ProjectMember, ProjectRole
 
@@ -167,13 +182,20 @@ async def delete_project(project_id: int, db: Session = Depends(get_db)):
 @router.get("/{project_id}/issues", response_model=list[dict])
 async def get_project_issues(
     project_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """
-    Get all issues for a specific project
+    Get all issues for a specific project.
+    With fields, only those issue fields are loaded and returned.
     """
+    field_names = parse_issue_fields(fields)
+
     # Verify project exists
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
@@ -181,14 +203,24 @@ async def get_project_issues(
 
     from app.models.issue import Issue
 
-    issues = (
-        db.query(Issue)
-        .filter(Issue.project_id == project_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(Issue).filter(Issue.project_id == project_id)
+    if field_names is not None:
+        query = load_issue_fields(query, field_names)
+
+    issues = paginate_newest_first(
+        query,
+        sort_column=Issue.created_at,
+        id_column=Issue.id,
+        request=request,
+        response=response,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
     )
 
+    if field_names is not None:
+        return issue_fields_response(issues, field_names, response)
+
     # Convert to dict format (you can create a proper IssueResponse schema later)
     return [
         {
@@ -208,6 +240,38 @@ async def get_project_issues(
     ]
 
 
+@router.get("/{project_id}/issues/export")
+def export_project_issues(
+    project_id: int,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db),
+):
+    """
+    Export every issue of a project as NDJSON or CSV, oldest first.
+    The response is streamed, so there is no row limit and memory use stays
+    constant however large the project is.
+    """
+    field_names = parse_issue_fields(fields) or list(ISSUE_FIELDS)
+
+    # Verify project exists
+    project = db.query(Project.key).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    from app.models.issue import Issue
+
+    stream = (
+        stream_issues_csv if export_format == ExportFormat.CSV else stream_issues_ndjson
+    )
+    filename = f"{project.key}-issues.{export_format.value}"
+    return StreamingResponse(
+        stream(db.get_bind(), field_names, Issue.project_id == project_id),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{project_id}/stats", response_model=dict)
 async def get_project_stats(project_id: int, db: Session = Depends(get_db)):
     """
@@ -1,21 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy import or_
+from sqlalchemy import false, or_
 from sqlalchemy.orm import Session
 
-from app.db.base import get_db
+from app.core.changes import COMMENT, ISSUE, PROJECT, USER
+from app.core.facets import (
+    FACETS_DESCRIPTION,
+    count_facets,
+    parse_facets,
+    set_facets_header,
+)
+from app.core.fulltext import fts_query, search_match, search_rank, search_snippet
+from app.core.global_search import SEARCH_TYPES, search_all
+from app.core.jql import JQLError, compile_order_by, compile_where, parse_jql
+from app.core.pagination import (
+    decode_rank_cursor,
+    encode_rank_cursor,
+    set_next_page,
+)
+from app.core.search_cache import get_search_cache, normalize_query
+from app.core.typeahead import SUGGEST_TYPES, get_typeahead
+from app.db.base import get_db, get_engine
 from app.models.issue import Issue
 from app.models.project import Project
+from app.models.search_index import issue_search
 from app.models.user import User
 
 router = APIRouter()
 
+# Writes to which entity types can change the results of each search type;
+# issues also match on the text of their comments
+_DEPENDS_ON = {"issue": (ISSUE, COMMENT), "project": (PROJECT,), "user": (USER,)}
+
 
 class SearchResult(BaseModel):
     type: str
     id: int
     title: str
     description: str | None = None
+    snippet: str | None = None
+    score: float
+    url: str
+
+
+class SuggestResult(BaseModel):
+    type: str
+    id: int
+    label: str
+    detail: str | None = None
+    score: float
     url: str
 
 
@@ -23,117 +56,183 @@ class SearchResponse(BaseModel):
     query: str
     results: list[SearchResult]
     total: int
+    totals: dict[str, int]
     page: int
     page_size: int
 
 
+def _requested_types(type: str | None, types: tuple[str, ...]) -> tuple[str, ...]:
+    """The types to search: all, or the one given by the type parameter"""
+    if type is None:
+        return types
+    if type.lower() in types:
+        return (type.lower(),)
+    raise HTTPException(
+        status_code=400,
+        detail=f"Invalid type. Must be one of: {list(types)}",
+    )
+
+
+def _ranked_issues(db: Session, q: str):
+    """
+    Query (issue, snippet) pairs matching q on the full-text index, best
+    first. Input without any words matches nothing.
+    """
+    query = (
+        db.query(Issue, search_snippet())
+        .select_from(issue_search)
+        .join(Issue, Issue.id == issue_search.c.rowid)
+    )
+    match = fts_query(q)
+    if match is None:
+        return query.filter(false())
+    return query.filter(search_match(match)).order_by(search_rank(), Issue.id)
+
+
+def _issue_result(issue: Issue, snippet: str | None) -> dict:
+    return {
+        "id": issue.id,
+        "title": issue.title,
+        "description": issue.description,
+        "snippet": snippet,
+        "status": issue.status.value,
+        "priority": issue.priority.value,
+        "issue_type": issue.issue_type.value,
+        "project_id": issue.project_id,
+        "reporter_id": issue.reporter_id,
+        "assignee_id": issue.assignee_id,
+        "created_at": issue.created_at.isoformat() if issue.created_at else None,
+        "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+    }
+
+
+def _jql_result(issue: Issue) -> dict:
+    return {
+        "id": issue.id,
+        "key": issue.issue_key,
+        "title": issue.title,
+        "description": issue.description,
+        "status": issue.status.value,
+        "priority": issue.priority.value,
+        "issue_type": issue.issue_type.value,
+        "project_id": issue.project_id,
+        "reporter_id": issue.reporter_id,
+        "assignee_id": issue.assignee_id,
+        "sprint_id": issue.sprint_id,
+        "created_at": issue.created_at.isoformat() if issue.created_at else None,
+        "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+    }
+
+
 @router.get("/", response_model=SearchResponse)
-async def search(
+def search(
+    request: Request,
+    response: Response,
     q: str = Query(..., min_length=1, description="Search query"),
     type: str | None = Query(None, description="Filter by type: issue, project, user"),
-    project_id: int | None = Query(None, description="Filter by project"),
+    project_id: int | None = Query(None, description="Filter issues by project"),
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
     """
-    Global search across issues, projects, users, etc.
+    Global search across issues, projects and users.
+    Results of all types are ranked together by score. total counts every
+    match and totals breaks it down by type; follow the X-Next-Cursor
+    header rather than skip to page deeply.
     """
-    results: list[SearchResult] = []
-    search_types = ["issue", "project", "user"] if type is None else [type.lower()]
-
-    if "issue" in search_types:
-        query = db.query(Issue)
-        if project_id:
-            query = query.filter(Issue.project_id == project_id)
-
-        search_filter = or_(
-            Issue.title.ilike(f"%{q}%"),
-            Issue.description.ilike(f"%{q}%"),
-        )
-        issues = query.filter(search_filter).offset(skip).limit(limit).all()
-
-        for issue in issues:
-            results.append(
-                SearchResult(
-                    type="issue",
-                    id=issue.id,
-                    title=issue.title,
-                    description=issue.description,
-                    url=f"/api/v1/issues/{issue.id}",
-                )
-            )
-
-    if "project" in search_types:
-        query = db.query(Project)
-        search_filter = or_(
-            Project.name.ilike(f"%{q}%"),
-            Project.key.ilike(f"%{q}%"),
-            Project.description.ilike(f"%{q}%"),
-        )
-        projects = query.filter(search_filter).offset(skip).limit(limit).all()
-
-        for project in projects:
-            results.append(
-                SearchResult(
-                    type="project",
-                    id=project.id,
-                    title=project.name,
-                    description=project.description,
-                    url=f"/api/v1/projects/{project.id}",
-                )
-            )
-
-    if "user" in search_types:
-        search_filter = or_(
-            User.username.ilike(f"%{q}%"),
-            User.email.ilike(f"%{q}%"),
-            User.full_name.ilike(f"%{q}%"),
+    search_types = _requested_types(type, SEARCH_TYPES)
+    after = decode_rank_cursor(cursor) if cursor is not None else None
+    hits, totals, has_more = get_search_cache(get_engine(db)).get_or_compute(
+        ("all", normalize_query(q), search_types, project_id, skip, limit, after),
+        tuple(entity for t in search_types for entity in _DEPENDS_ON[t]),
+        lambda: search_all(
+            db,
+            q,
+            search_types,
+            project_id=project_id,
+            skip=skip,
+            limit=limit,
+            cursor=after,
+        ),
+    )
+    if has_more:
+        last = hits[-1]
+        set_next_page(
+            request, response, encode_rank_cursor(last.score, last.type, last.id)
         )
-        users = db.query(User).filter(search_filter).offset(skip).limit(limit).all()
-
-        for user in users:
-            results.append(
-                SearchResult(
-                    type="user",
-                    id=user.id,
-                    title=user.username,
-                    description=user.full_name,
-                    url=f"/api/v1/users/{user.id}",
-                )
-            )
 
-    total = len(results)
+    results = [
+        SearchResult(
+            type=hit.type,
+            id=hit.id,
+            title=hit.title,
+            description=hit.description,
+            snippet=hit.snippet,
+            score=hit.score,
+            url=f"/api/v1/{hit.type}s/{hit.id}",
+        )
+        for hit in hits
+    ]
 
     return SearchResponse(
         query=q,
         results=results,
-        total=total,
+        total=sum(totals.values()),
+        totals=totals,
         page=skip // limit + 1,
         page_size=limit,
     )
 
 
+@router.get("/suggest", response_model=list[SuggestResult])
+def suggest(
+    q: str = Query(..., min_length=1, description="Text typed so far"),
+    type: str | None = Query(None, description="Filter by type: user, project, issue"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions"),
+    db: Session = Depends(get_db),
+):
+    """
+    Typeahead suggestions for user and project pickers and issue keys.
+    Served from an in-memory index: names match by prefix of any word, with
+    a fuzzy fallback for typos, and "WEB-12" suggests WEB-12, WEB-120, ...
+    """
+    suggest_types = _requested_types(type, SUGGEST_TYPES)
+    suggestions = get_typeahead(get_engine(db)).suggest(q, suggest_types, limit)
+    return [
+        SuggestResult(
+            type=suggestion.type,
+            id=suggestion.id,
+            label=suggestion.label,
+            detail=suggestion.detail,
+            score=suggestion.score,
+            url=f"/api/v1/{suggestion.type}s/{suggestion.id}",
+        )
+        for suggestion in suggestions
+    ]
+
+
 @router.get("/issues", response_model=list[dict])
-async def search_issues(
+def search_issues(
+    response: Response,
     q: str = Query(..., min_length=1),
     project_id: int | None = Query(None),
     assignee_id: int | None = Query(None),
     status: str | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    facets: str | None = Query(None, description=FACETS_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """
-    Search issues with advanced filtering
+    Search issues with advanced filtering.
+    Matches words in titles, descriptions and comments, the last word as a
+    prefix, and returns the best matches first with a highlighted snippet.
+    With facets, counts over all matches come back in X-Facets.
     """
-    query = db.query(Issue)
-
-    search_filter = or_(
-        Issue.title.ilike(f"%{q}%"),
-        Issue.description.ilike(f"%{q}%"),
-    )
-    query = query.filter(search_filter)
+    facet_names = parse_facets(facets)
+    query = _ranked_issues(db, q)
 
     if project_id:
         query = query.filter(Issue.project_id == project_id)
@@ -153,28 +252,69 @@ async def search_issues(
                 detail=f"Invalid status. Must be one of: {[s.value for s in IssueStatus]}",
             ) from None
 
-    issues = query.offset(skip).limit(limit).all()
+    def page():
+        rows = query.offset(skip).limit(limit).all()
+        counts = count_facets(query, facet_names) if facet_names else None
+        return [_issue_result(issue, snippet) for issue, snippet in rows], counts
+
+    results, counts = get_search_cache(get_engine(db)).get_or_compute(
+        (
+            "issues",
+            normalize_query(q),
+            project_id,
+            assignee_id,
+            status.upper() if status else None,
+            skip,
+            limit,
+            tuple(facet_names or ()),
+        ),
+        _DEPENDS_ON["issue"],
+        page,
+    )
+    if counts is not None:
+        set_facets_header(response, counts)
+    return results
+
+
+@router.get("/jql", response_model=list[dict])
+def search_jql(
+    q: str = Query(
+        ...,
+        min_length=1,
+        description="JQL query, e.g. project = WEB AND status IN (TO_DO, "
+        "IN_PROGRESS) AND assignee = 12 ORDER BY priority DESC",
+    ),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Search issues with a JQL-style query.
+    Queries that could only be answered by scanning every issue are rejected.
+    """
+    try:
+        parsed = parse_jql(q)
+    except JQLError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+    query = (
+        db.query(Issue)
+        .filter(compile_where(parsed.where))
+        .order_by(*compile_order_by(parsed.order_by))
+        .offset(skip)
+        .limit(limit)
+    )
 
-    return [
-        {
-            "id": issue.id,
-            "title": issue.title,
-            "description": issue.description,
-            "status": issue.status.value,
-            "priority": issue.priority.value,
-            "issue_type": issue.issue_type.value,
-            "project_id": issue.project_id,
-            "reporter_id": issue.reporter_id,
-            "assignee_id": issue.assignee_id,
-            "created_at": issue.created_at.isoformat() if issue.created_at else None,
-            "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
-        }
-        for issue in issues
-    ]
+    # Project keys in the query resolve against projects
+    return get_search_cache(get_engine(db)).get_or_compute(
+        ("jql", q, skip, limit),
+        (ISSUE, PROJECT),
+        lambda: [_jql_result(issue) for issue in query.all()],
+    )
 
 
 @router.get("/projects", response_model=list[dict])
-async def search_projects(
+def search_projects(
     q: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -188,22 +328,26 @@ async def search_projects(
         Project.key.ilike(f"%{q}%"),
         Project.description.ilike(f"%{q}%"),
     )
-    projects = db.query(Project).filter(search_filter).offset(skip).limit(limit).all()
-
-    return [
-        {
-            "id": project.id,
-            "name": project.name,
-            "key": project.key,
-            "description": project.description,
-            "owner_id": project.owner_id,
-        }
-        for project in projects
-    ]
+    query = db.query(Project).filter(search_filter).offset(skip).limit(limit)
+
+    return get_search_cache(get_engine(db)).get_or_compute(
+        ("projects", normalize_query(q), skip, limit),
+        _DEPENDS_ON["project"],
+        lambda: [
+            {
+                "id": project.id,
+                "name": project.name,
+                "key": project.key,
+                "description": project.description,
+                "owner_id": project.owner_id,
+            }
+            for project in query.all()
+        ],
+    )
 
 
 @router.get("/users", response_model=list[dict])
-async def search_users(
+def search_users(
     q: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -217,15 +361,27 @@ async def search_users(
         User.email.ilike(f"%{q}%"),
         User.full_name.ilike(f"%{q}%"),
     )
-    users = db.query(User).filter(search_filter).offset(skip).limit(limit).all()
+    query = db.query(User).filter(search_filter).offset(skip).limit(limit)
+
+    return get_search_cache(get_engine(db)).get_or_compute(
+        ("users", normalize_query(q), skip, limit),
+        _DEPENDS_ON["user"],
+        lambda: [
+            {
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+                "full_name": user.full_name,
+                "is_active": user.is_active,
+            }
+            for user in query.all()
+        ],
+    )
 
-    return [
-        {
-            "id": user.id,
-            "username": user.username,
-            "email": user.email,
-            "full_name": user.full_name,
-            "is_active": user.is_active,
-        }
-        for user in users
-    ]
+
+@router.get("/cache", response_model=dict)
+def search_cache_stats(db: Session = Depends(get_db)):
+    """
+    Hit, miss and eviction counts of the search result cache.
+    """
+    return get_search_cache(get_engine(db)).stats()
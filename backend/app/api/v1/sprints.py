@@ -1,9 +1,27 @@
 from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.core.conditional import (
+    conditional_response,
+    issue_collection_state,
+    make_etag,
+)
+from app.core.fields import (
+    FIELDS_DESCRIPTION,
+    issue_fields_response,
+    load_issue_fields,
+    parse_issue_fields,
+)
+from app.core.pagination import (
+    ISSUE_ORDER_DESCRIPTION,
+    SortColumn,
+    paginate_newest_first,
+    paginate_ranked,
+)
 from app.db.base import get_db
 from app.models.issue import Issue
 from app.models.project import Project
@@ -42,7 +60,7 @@ class SprintResponse(SprintBase):
 
 
 @router.get("/", response_model=list[SprintResponse])
-async def get_sprints(
+def get_sprints(
     project_id: int | None = Query(None),
     status: str | None = Query(None),
     skip: int = Query(0, ge=0),
@@ -72,7 +90,7 @@ async def get_sprints(
 
 
 @router.get("/{sprint_id}", response_model=SprintResponse)
-async def get_sprint(sprint_id: int, db: Session = Depends(get_db)):
+def get_sprint(sprint_id: int, db: Session = Depends(get_db)):
     """
     Get a specific sprint by ID
     """
@@ -83,7 +101,7 @@ async def get_sprint(sprint_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=SprintResponse, status_code=201)
-async def create_sprint(sprint: SprintCreate, db: Session = Depends(get_db)):
+def create_sprint(sprint: SprintCreate, db: Session = Depends(get_db)):
     """
     Create a new sprint
     """
@@ -112,9 +130,7 @@ async def create_sprint(sprint: SprintCreate, db: Session = Depends(get_db)):
 
 
 @router.put("/{sprint_id}", response_model=SprintResponse)
-async def update_sprint(
-    sprint_id: int, sprint: SprintUpdate, db: Session = Depends(get_db)
-):
+def update_sprint(sprint_id: int, sprint: SprintUpdate, db: Session = Depends(get_db)):
     """
     Update an existing sprint
     """
@@ -150,7 +166,7 @@ async def update_sprint(
 
 
 @router.delete("/{sprint_id}", status_code=204)
-async def delete_sprint(sprint_id: int, db: Session = Depends(get_db)):
+def delete_sprint(sprint_id: int, db: Session = Depends(get_db)):
     """
     Delete a sprint
     """
@@ -164,7 +180,7 @@ async def delete_sprint(sprint_id: int, db: Session = Depends(get_db)):
 
 
 @router.patch("/{sprint_id}/start", response_model=SprintResponse)
-async def start_sprint(sprint_id: int, db: Session = Depends(get_db)):
+def start_sprint(sprint_id: int, db: Session = Depends(get_db)):
     """
     Start a sprint (change status to active)
     """
@@ -186,7 +202,7 @@ async def start_sprint(sprint_id: int, db: Session = Depends(get_db)):
 
 
 @router.patch("/{sprint_id}/close", response_model=SprintResponse)
-async def close_sprint(sprint_id: int, db: Session = Depends(get_db)):
+def close_sprint(sprint_id: int, db: Session = Depends(get_db)):
     """
     Close a sprint (change status to closed)
     """
@@ -205,27 +221,53 @@ async def close_sprint(sprint_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{sprint_id}/issues", response_model=list[dict])
-async def get_sprint_issues(
+def get_sprint_issues(
     sprint_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    order: Literal["newest", "rank"] = Query(
+        "newest", description=ISSUE_ORDER_DESCRIPTION
+    ),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db),
 ):
     """
-    Get all issues in a sprint
+    Get all issues in a sprint, newest first or, with order=rank, in the
+    sprint backlog's manual order.
+    With fields, only those issue fields are loaded and returned.
     """
+    field_names = parse_issue_fields(fields)
+
     sprint = db.query(Sprint).filter(Sprint.id == sprint_id).first()
     if not sprint:
         raise HTTPException(status_code=404, detail="Sprint not found")
 
-    issues = (
-        db.query(Issue)
-        .filter(Issue.sprint_id == sprint_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(Issue).filter(Issue.sprint_id == sprint_id)
+    if field_names is not None:
+        query = load_issue_fields(query, field_names)
+
+    sort_column: SortColumn
+    if order == "rank":
+        paginate, sort_column = paginate_ranked, Issue.rank
+    else:
+        paginate, sort_column = paginate_newest_first, Issue.created_at
+    issues = paginate(
+        query,
+        sort_column=sort_column,
+        id_column=Issue.id,
+        request=request,
+        response=response,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
     )
 
+    if field_names is not None:
+        return issue_fields_response(issues, field_names, response)
+
     return [
         {
             "id": issue.id,
@@ -237,6 +279,7 @@ async def get_sprint_issues(
             "project_id": issue.project_id,
             "reporter_id": issue.reporter_id,
             "assignee_id": issue.assignee_id,
+            "rank": issue.rank,
             "created_at": issue.created_at.isoformat() if issue.created_at else None,
             "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
         }
@@ -245,9 +288,7 @@ async def get_sprint_issues(
 
 
 @router.post("/{sprint_id}/issues/{issue_id}", status_code=201)
-async def add_issue_to_sprint(
-    sprint_id: int, issue_id: int, db: Session = Depends(get_db)
-):
+def add_issue_to_sprint(sprint_id: int, issue_id: int, db: Session = Depends(get_db)):
     """
     Add an issue to a sprint
     """
@@ -273,7 +314,7 @@ async def add_issue_to_sprint(
 
 
 @router.delete("/{sprint_id}/issues/{issue_id}", status_code=204)
-async def remove_issue_from_sprint(
+def remove_issue_from_sprint(
     sprint_id: int, issue_id: int, db: Session = Depends(get_db)
 ):
     """
@@ -297,14 +338,28 @@ async def remove_issue_from_sprint(
 
 
 @router.get("/{sprint_id}/stats", response_model=dict)
-async def get_sprint_stats(sprint_id: int, db: Session = Depends(get_db)):
+def get_sprint_stats(
+    sprint_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
     """
     Get sprint statistics (total issues, completed issues, etc.)
+    Supports If-None-Match; unchanged stats are answered with 304.
     """
-    sprint = db.query(Sprint).filter(Sprint.id == sprint_id).first()
+    sprint = db.query(Sprint.id).filter(Sprint.id == sprint_id).first()
     if not sprint:
         raise HTTPException(status_code=404, detail="Sprint not found")
 
+    state = issue_collection_state(db, Issue.sprint_id == sprint_id)
+    not_modified = conditional_response(
+        request,
+        response,
+        make_etag("sprint-stats", sprint_id, state),
+        state[1],
+        is_collection=True,
+    )
+    if not_modified is not None:
+        return not_modified
+
     from app.models.issue import IssueStatus
 
     total_issues = db.query(Issue).filter(Issue.sprint_id == sprint_id).count()
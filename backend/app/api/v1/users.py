@@ -1,11 +1,12 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from passlib.context import CryptContext
 from pydantic import BaseModel, EmailStr
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app.core.pagination import paginate_newest_first
 from app.db.base import get_db
 from app.models.issue import Issue
 from app.models.project import Project, ProjectMember
@@ -196,9 +197,12 @@ async def delete_user(user_id: int, db: Session = Depends(get_db)):
 @router.get("/{user_id}/issues", response_model=list[dict])
 async def get_user_issues(
     user_id: int,
+    request: Request,
+    response: Response,
     assigned: bool = Query(True),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
     """
@@ -215,7 +219,16 @@ async def get_user_issues(
     else:
         query = query.filter(Issue.reporter_id == user_id)
 
-    issues = query.offset(skip).limit(limit).all()
+    issues = paginate_newest_first(
+        query,
+        sort_column=Issue.created_at,
+        id_column=Issue.id,
+        request=request,
+        response=response,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
 
     return [
         {
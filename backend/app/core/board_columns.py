@@ -0,0 +1,81 @@
+"""
+In-memory column -> status sets per board.
+
+A board's mapping is read once, with one query over its columns and their
+board_column_statuses rows, and kept until a column of the board is added,
+edited or removed. Board issue queries then become status IN (...) lookups
+without reading the columns again.
+"""
+
+import threading
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.changes import BOARD, subscribe_changes
+from app.models.board import BoardColumn, BoardColumnStatus
+from app.models.issue import IssueStatus
+
+# Column id -> statuses shown in it, in column position order
+ColumnStatuses = dict[int, frozenset[IssueStatus]]
+
+
+class BoardColumnCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._boards: dict[int, ColumnStatuses] = {}
+        # Bumped on every change, so a read that raced one is not kept
+        self._versions: dict[int, int] = {}
+
+    def column_statuses(self, db: Session, board_id: int) -> ColumnStatuses:
+        with self._lock:
+            cached = self._boards.get(board_id)
+            if cached is not None:
+                return cached
+            version = self._versions.get(board_id, 0)
+
+        rows = db.execute(
+            select(BoardColumn.id, BoardColumnStatus.status)
+            .outerjoin(BoardColumnStatus, BoardColumnStatus.column_id == BoardColumn.id)
+            .where(BoardColumn.board_id == board_id)
+            .order_by(BoardColumn.position, BoardColumn.id)
+        )
+        mapping: dict[int, set[IssueStatus]] = {}
+        for column_id, status in rows:
+            statuses = mapping.setdefault(column_id, set())
+            if status is not None:
+                statuses.add(status)
+        result = {column_id: frozenset(s) for column_id, s in mapping.items()}
+
+        with self._lock:
+            if self._versions.get(board_id, 0) == version:
+                self._boards[board_id] = result
+        return result
+
+    def invalidate(self, board_ids) -> None:
+        with self._lock:
+            for board_id in board_ids:
+                self._boards.pop(board_id, None)
+                self._versions[board_id] = self._versions.get(board_id, 0) + 1
+
+
+# One cache per engine, so separate databases never share mappings
+_caches: WeakKeyDictionary[Engine, BoardColumnCache] = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_board_column_cache(bind: Engine) -> BoardColumnCache:
+    with _caches_lock:
+        cache = _caches.get(bind)
+        if cache is None:
+            cache = _caches[bind] = BoardColumnCache()
+        return cache
+
+
+@subscribe_changes(BOARD)
+def _invalidate_boards(bind, changes: dict[int, str]) -> None:
+    cache = _caches.get(bind)
+    if cache is not None:
+        cache.invalidate(changes)
@@ -0,0 +1,269 @@
+"""
+Live board updates, pushed to clients as Server-Sent Events.
+
+Every committed issue creation or deletion, and every change to a field a
+board shows (status, rank, assignee or sprint), becomes a compact event for
+the issue's project:
+
+    {"op": "created", "id": 7, "issue": {"issue_key": "P-7", ...}}
+    {"op": "updated", "id": 7, "changes": {"status": "DONE"}}
+    {"op": "deleted", "id": 7}
+
+ORM flushes are tracked automatically. Core statements bypass the session's
+bookkeeping, so paths that insert or update issues with them call
+stage_issue_created or stage_issue_updated before committing, as they do
+mark_changed. Events of a transaction are merged per issue and published
+once it commits, to every stream open on a board of the project.
+
+Each stream reads from its own queue of at most BOARD_EVENTS_QUEUE_SIZE
+events. A client that falls that far behind loses its backlog and gets a
+single "reset" event instead, telling it to reload the board, so a slow
+reader holds a bounded amount of memory.
+"""
+
+import asyncio
+import enum
+import json
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.changes import CREATED, DELETED, UPDATED
+from app.core.config import settings
+from app.db.base import get_engine
+from app.models.issue import Issue
+
+# Issue fields whose changes are pushed to boards
+BOARD_FIELDS = ("status", "rank", "assignee_id", "sprint_id")
+# Issue fields sent with a created event
+CREATED_FIELDS = (
+    "issue_key",
+    "title",
+    "status",
+    "priority",
+    "issue_type",
+    "assignee_id",
+    "sprint_id",
+    "rank",
+)
+
+RESET = {"op": "reset"}
+# Milliseconds EventSource waits before reconnecting a closed stream
+RETRY_MS = 3000
+
+_PENDING_KEY = "pending_board_events"
+
+
+def _plain(value):
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _stage(session: Session, project_id: int, issue_id: int, op: str, payload):
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    previous = pending.get(issue_id)
+    if previous is not None:
+        _, previous_op, previous_payload = previous
+        if op == UPDATED:
+            # Fold into the created issue or the earlier changes
+            if previous_op != DELETED:
+                previous_payload.update(payload)
+            return
+        if op == DELETED and previous_op == CREATED:
+            # Never seen outside the transaction
+            del pending[issue_id]
+            return
+    pending[issue_id] = (project_id, op, payload)
+
+
+def stage_issue_created(session: Session, project_id: int, issue_id: int, fields):
+    """Record a created issue to announce once the session commits"""
+    issue = {field: _plain(fields[field]) for field in CREATED_FIELDS}
+    _stage(session, project_id, issue_id, CREATED, issue)
+
+
+def stage_issue_updated(session: Session, project_id: int, issue_id: int, changes):
+    """Record the new values of changed issue fields; non-board fields are ignored"""
+    changes = {
+        field: _plain(value)
+        for field, value in changes.items()
+        if field in BOARD_FIELDS
+    }
+    if changes:
+        _stage(session, project_id, issue_id, UPDATED, changes)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_board_events(session, flush_context):
+    for obj in session.new:
+        if isinstance(obj, Issue):
+            fields = {field: getattr(obj, field) for field in CREATED_FIELDS}
+            stage_issue_created(session, obj.project_id, obj.id, fields)
+    for obj in session.dirty:
+        if not isinstance(obj, Issue):
+            continue
+        attrs = inspect(obj).attrs
+        changes = {}
+        for field in BOARD_FIELDS:
+            history = attrs[field].history
+            old = history.deleted[0] if history.deleted else None
+            new = history.added[0] if history.added else None
+            if history.added and old != new:
+                changes[field] = new
+        stage_issue_updated(session, obj.project_id, obj.id, changes)
+    for obj in session.deleted:
+        if isinstance(obj, Issue):
+            _stage(session, obj.project_id, obj.id, DELETED, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_board_events(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    hub = _hubs.get(get_engine(session))
+    if hub is None:
+        # Nobody has streamed a board of this database yet
+        return
+    for issue_id, (project_id, op, payload) in pending.items():
+        board_event = {"op": op, "id": issue_id}
+        if op == CREATED:
+            board_event["issue"] = payload
+        elif op == UPDATED:
+            board_event["changes"] = payload
+        hub.publish(project_id, board_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_board_events(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+class BoardSubscription:
+    """
+    The queue of one stream. Events are put from any thread and read on the
+    event loop the subscription was made on.
+    """
+
+    def __init__(self, project_id: int, max_size: int):
+        self.project_id = project_id
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._events: deque[tuple[int, dict]] = deque()
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+
+    def put(self, event_id: int, board_event: dict) -> None:
+        with self._lock:
+            was_empty = not self._events
+            if len(self._events) >= self.max_size:
+                # The reload the reset asks for includes this event too
+                self._events.clear()
+                self._events.append((event_id, RESET))
+            else:
+                self._events.append((event_id, board_event))
+        if was_empty:
+            try:
+                self._loop.call_soon_threadsafe(self._ready.set)
+            except RuntimeError:
+                # The stream's loop is closed; it is unsubscribing
+                pass
+
+    async def get(self, timeout: float) -> tuple[int, dict] | None:
+        """The next (id, event), or None if none came within timeout seconds"""
+        with self._lock:
+            if self._events:
+                return self._events.popleft()
+            self._ready.clear()
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except TimeoutError:
+            return None
+        with self._lock:
+            return self._events.popleft() if self._events else None
+
+
+class BoardEventHub:
+    """Fans published events out to the subscriptions of each project"""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[BoardSubscription]] = {}
+        self._last_id = 0
+
+    def subscribe(self, project_id: int) -> BoardSubscription:
+        """Start queueing a project's events; call on the stream's event loop"""
+        subscription = BoardSubscription(project_id, self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: BoardSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.project_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.project_id]
+
+    def subscriber_count(self, project_id: int) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(project_id, ()))
+
+    def publish(self, project_id: int, board_event: dict) -> None:
+        with self._lock:
+            self._last_id += 1
+            event_id = self._last_id
+            subscriptions = list(self._subscriptions.get(project_id, ()))
+        for subscription in subscriptions:
+            subscription.put(event_id, board_event)
+
+
+# One hub per engine, so separate databases never share streams
+_hubs: WeakKeyDictionary[Engine, BoardEventHub] = WeakKeyDictionary()
+_hubs_lock = threading.Lock()
+
+
+def get_board_event_hub(bind: Engine) -> BoardEventHub:
+    with _hubs_lock:
+        hub = _hubs.get(bind)
+        if hub is None:
+            hub = _hubs[bind] = BoardEventHub(settings.BOARD_EVENTS_QUEUE_SIZE)
+        return hub
+
+
+def format_event(event_id: int, board_event: dict) -> str:
+    """One SSE frame: issue events are named "issue", the reset "reset" """
+    name = "reset" if board_event is RESET else "issue"
+    data = json.dumps(board_event, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {name}\ndata: {data}\n\n"
+
+
+async def board_event_stream(hub: BoardEventHub, project_id: int) -> AsyncIterator[str]:
+    """
+    SSE frames for a project's boards, with a comment line whenever nothing
+    happened for BOARD_EVENTS_KEEPALIVE seconds so proxies keep the
+    connection open. The stream ends after BOARD_EVENTS_STREAM_TIMEOUT
+    seconds and EventSource reconnects on its own; events committed in
+    between are not replayed, so clients reload the board on (re)connect.
+    """
+    subscription = hub.subscribe(project_id)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.BOARD_EVENTS_STREAM_TIMEOUT
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            item = await subscription.get(
+                min(settings.BOARD_EVENTS_KEEPALIVE, remaining)
+            )
+            if item is None:
+                yield ": keepalive\n\n"
+            else:
+                yield format_event(*item)
+    finally:
+        hub.unsubscribe(subscription)
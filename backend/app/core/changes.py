@@ -0,0 +1,133 @@
+"""
+In-process notifications about committed issue, comment, project, user and
+board changes.
+
+ORM flushes are tracked automatically. Core statements bypass the session's
+bookkeeping, so paths that insert or update rows with them call
+mark_changed (or mark_issues_changed) before committing. Subscribers to an
+entity run after the commit in the committing thread and receive the engine
+plus {id: kind}, where kind is "created", "updated" or "deleted". Adding,
+editing or removing a board column is an update of its board.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.db.base import get_engine
+from app.models.board import Board, BoardColumn
+from app.models.issue import Comment, Issue
+from app.models.project import Project
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+ISSUE = "issue"
+COMMENT = "comment"
+PROJECT = "project"
+USER = "user"
+BOARD = "board"
+
+_TRACKED_MODELS = {
+    Issue: ISSUE,
+    Comment: COMMENT,
+    Project: PROJECT,
+    User: USER,
+    Board: BOARD,
+}
+# Rows that are part of a tracked row: (entity, attribute with the owner's id)
+_PART_MODELS = {BoardColumn: (BOARD, "board_id")}
+_CHANGED_KEY = "changed_rows"
+
+ChangeCallback = Callable[[Engine, dict[int, str]], None]
+_subscribers: defaultdict[str, list[ChangeCallback]] = defaultdict(list)
+
+
+def subscribe_changes(entity: str) -> Callable[[ChangeCallback], ChangeCallback]:
+    """Register a callback for committed changes to an entity; a decorator"""
+
+    def register(callback: ChangeCallback) -> ChangeCallback:
+        _subscribers[entity].append(callback)
+        return callback
+
+    return register
+
+
+def subscribe_issue_changes(callback: ChangeCallback) -> ChangeCallback:
+    """Register a callback for committed issue changes; usable as a decorator"""
+    return subscribe_changes(ISSUE)(callback)
+
+
+def mark_changed(session: Session, entity: str, kind: str, ids: Iterable[int]):
+    """Record changes to announce once the session commits"""
+    changed = session.info.setdefault(_CHANGED_KEY, {}).setdefault(entity, {})
+    for row_id in ids:
+        previous = changed.get(row_id)
+        # A row created or deleted in this transaction stays so for subscribers
+        if kind == UPDATED and previous in (CREATED, DELETED):
+            continue
+        changed[row_id] = kind
+
+
+def mark_issues_changed(session: Session, kind: str, issue_ids: Iterable[int]):
+    """Record issue changes to announce once the session commits"""
+    mark_changed(session, ISSUE, kind, issue_ids)
+
+
+def _mark_objects(session: Session, kind: str, objects) -> None:
+    ids = defaultdict(list)
+    owner_ids = defaultdict(list)
+    for obj in objects:
+        entity = _TRACKED_MODELS.get(type(obj))
+        if entity is not None:
+            ids[entity].append(obj.id)
+        elif type(obj) in _PART_MODELS:
+            entity, attribute = _PART_MODELS[type(obj)]
+            owner_ids[entity].append(getattr(obj, attribute))
+    for entity, entity_ids in ids.items():
+        mark_changed(session, entity, kind, entity_ids)
+    for entity, entity_ids in owner_ids.items():
+        mark_changed(session, entity, UPDATED, entity_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    modified = (
+        obj
+        for obj in session.dirty
+        if (type(obj) in _TRACKED_MODELS or type(obj) in _PART_MODELS)
+        and session.is_modified(obj)
+    )
+    _mark_objects(session, CREATED, session.new)
+    _mark_objects(session, UPDATED, modified)
+    _mark_objects(session, DELETED, session.deleted)
+
+
+@event.listens_for(Session, "after_commit")
+def _announce_changes(session):
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if not changed:
+        return
+    bind = get_engine(session)
+    for entity, rows in changed.items():
+        if not rows:
+            continue
+        for callback in _subscribers[entity]:
+            try:
+                callback(bind, rows)
+            except Exception:
+                # The change is committed; a failing subscriber must not undo it
+                logger.exception("%s change subscriber %r failed", entity, callback)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_CHANGED_KEY, None)
@@ -0,0 +1,99 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.issue import Issue
+
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the values that identify a representation"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive timestamps that are stored in UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+    *,
+    is_collection: bool = False,
+) -> Response | None:
+    """
+    Set ETag/Last-Modified on the response and evaluate the request's
+    conditional headers. Returns a 304 response when the client's copy is
+    current, otherwise None and the caller builds the full response.
+    For collections only If-None-Match is honoured: deleting a row does not
+    move the latest updated_at, so If-Modified-Since could miss the change.
+    """
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if (
+        if_modified_since is not None
+        and last_modified is not None
+        and not is_collection
+        and _not_modified_since(if_modified_since, last_modified)
+    ):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def issue_collection_state(db: Session, *conditions) -> tuple:
+    """
+    Summarize the issues matching conditions as (count, latest updated_at,
+    sum of versions). Any insert, update or delete changes at least one of
+    them, so the tuple can stand in for the collection in an ETag.
+    """
+    return tuple(
+        db.execute(
+            select(
+                func.count(Issue.id),
+                func.max(Issue.updated_at),
+                func.coalesce(func.sum(Issue.version), 0),
+            ).where(*conditions)
+        ).one()
+    )
+
+
+def latest(*timestamps: datetime | None) -> datetime | None:
+    """Return the most recent of the given timestamps, ignoring None"""
+    present = [_as_utc(value) for value in timestamps if value is not None]
+    return max(present, default=None)
@@ -12,6 +12,42 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./scrumflow.db"
 
+    # Database engine profile (SQLite pragmas are applied on every connection)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -64000  # negative values are KiB, i.e. 64 MiB
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_BUSY_TIMEOUT: int = 5000  # milliseconds
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
+    # Bulk operations
+    BULK_MAX_ITEMS: int = 20000
+    BULK_CHUNK_SIZE: int = 500  # rows per insert transaction
+    EXPORT_BATCH_SIZE: int = 1000  # rows fetched per round trip when streaming
+
+    # Saved filters
+    SAVED_FILTER_CACHE_SIZE: int = 256  # filters whose results are kept in memory
+    SAVED_FILTER_MAX_IDS: int = 10000  # larger result sets are queried each time
+
+    # Search result cache
+    SEARCH_CACHE_SIZE: int = 1024  # cached responses, least recently used evicted
+    SEARCH_CACHE_TTL: float = 60.0  # seconds; bounds staleness from outside writes
+
+    # Facet counts
+    FACET_MAX_BUCKETS: int = 20  # per facet; the rest are summed under "other"
+
+    # Typeahead
+    TYPEAHEAD_WARM_ON_STARTUP: bool = True  # else the index loads on first use
+
+    # Board event streams
+    BOARD_EVENTS_QUEUE_SIZE: int = 256  # events held per stream before it resets
+    BOARD_EVENTS_KEEPALIVE: float = 15.0  # seconds of silence before a keepalive
+    BOARD_EVENTS_STREAM_TIMEOUT: float = 300.0  # seconds; clients then reconnect
+
     # Security
     SECRET_KEY: str = "change-this-in-production"
     ALGORITHM: str = "HS256"
@@ -0,0 +1,82 @@
+import csv
+import enum
+import io
+import json
+from collections.abc import Iterator
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.fields import ISSUE_FIELDS
+from app.models.issue import Issue
+
+
+class ExportFormat(str, enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _issue_batches(
+    bind: Engine | Connection, names: list[str], *conditions
+) -> Iterator[list]:
+    """
+    Yield the matching issues as batches of plain column tuples.
+    Rows come from a server-side cursor in EXPORT_BATCH_SIZE partitions, so
+    memory use does not depend on how many issues match. The session is
+    owned by the generator because it outlives the request's own session.
+    """
+    columns = [getattr(Issue, ISSUE_FIELDS[name]) for name in names]
+    statement = (
+        select(*columns)
+        .where(*conditions)
+        .order_by(Issue.created_at, Issue.id)
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+    with Session(bind=bind) as db:
+        for partition in db.execute(statement).partitions():
+            yield [[_plain(value) for value in row] for row in partition]
+
+
+def stream_issues_ndjson(
+    bind: Engine | Connection, names: list[str], *conditions
+) -> Iterator[str]:
+    """Stream issues as one JSON object per line"""
+    for batch in _issue_batches(bind, names, *conditions):
+        yield "".join(
+            json.dumps(dict(zip(names, row, strict=True))) + "\n" for row in batch
+        )
+
+
+def stream_issues_csv(
+    bind: Engine | Connection, names: list[str], *conditions
+) -> Iterator[str]:
+    """Stream issues as CSV, starting with the header row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # Send the header before the query runs so the client sees bytes at once
+    writer.writerow(names)
+    yield buffer.getvalue()
+
+    for batch in _issue_batches(bind, names, *conditions):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
@@ -0,0 +1,100 @@
+"""
+Facet counts for issue lists.
+
+Every requested facet comes from one grouped aggregate over the matching
+issues: grouping by the combination of facet columns yields one row per
+distinct combination, which is folded into a histogram per facet. Counts
+cover all matches rather than the page, and enum facets list every value,
+including those without matches. They are returned as JSON in the X-Facets
+header so list responses keep their shape; to keep the header small, each
+facet lists at most FACET_MAX_BUCKETS values, largest first, and sums the
+rest under "other".
+"""
+
+import enum
+import json
+from typing import Any
+
+from fastapi import HTTPException, Response
+from sqlalchemy import func
+from sqlalchemy.orm import InstrumentedAttribute, Query
+
+from app.core.config import settings
+from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
+
+FACETS_HEADER = "X-Facets"
+FACETS_DESCRIPTION = (
+    "Comma-separated facets to count over all matches, returned in the "
+    "X-Facets header: status, priority, issue_type, assignee_id"
+)
+
+# Facet name (the matching filter parameter) -> column and its enum, if any
+ISSUE_FACETS: dict[str, tuple[InstrumentedAttribute[Any], type[enum.Enum] | None]] = {
+    "status": (Issue.status, IssueStatus),
+    "priority": (Issue.priority, IssuePriority),
+    "issue_type": (Issue.issue_type, IssueType),
+    "assignee_id": (Issue.assignee_id, None),
+}
+
+# Key of issues with no value, e.g. unassigned ones
+NO_VALUE = "none"
+# Key summing the values past FACET_MAX_BUCKETS, e.g. of rarely used assignees
+OTHER = "other"
+
+
+def parse_facets(facets: str | None) -> list[str] | None:
+    """Parse a facets parameter; None means no facets were requested"""
+    if facets is None:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in facets.split(",")))
+    names = [name for name in names if name]
+    if not names:
+        raise HTTPException(
+            status_code=400, detail="facets must name at least one facet"
+        )
+    unknown = [name for name in names if name not in ISSUE_FACETS]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown facets: {', '.join(unknown)}"
+        )
+    return names
+
+
+def count_facets(query: Query, names: list[str]) -> dict[str, dict[str, int]]:
+    """Histograms of the named facets over every issue the query matches"""
+    columns = [ISSUE_FACETS[name][0] for name in names]
+    histograms: dict[str, dict[str, int]] = {}
+    for name in names:
+        enum_type = ISSUE_FACETS[name][1]
+        histograms[name] = (
+            dict.fromkeys((member.value for member in enum_type), 0)
+            if enum_type
+            else {}
+        )
+
+    rows = query.with_entities(*columns, func.count()).order_by(None).group_by(*columns)
+    for *values, count in rows:
+        for name, value in zip(names, values, strict=True):
+            if value is None:
+                key = NO_VALUE
+            elif ISSUE_FACETS[name][1] is not None:
+                key = value.value
+            else:
+                key = str(value)
+            histogram = histograms[name]
+            histogram[key] = histogram.get(key, 0) + count
+    return {name: _top_buckets(histogram) for name, histogram in histograms.items()}
+
+
+def _top_buckets(histogram: dict[str, int]) -> dict[str, int]:
+    max_buckets = settings.FACET_MAX_BUCKETS
+    if len(histogram) <= max_buckets:
+        return histogram
+    ranked = sorted(histogram.items(), key=lambda bucket: (-bucket[1], bucket[0]))
+    top = dict(ranked[:max_buckets])
+    top[OTHER] = sum(count for _, count in ranked[max_buckets:])
+    return top
+
+
+def set_facets_header(response: Response, facets: dict[str, dict[str, int]]):
+    response.headers[FACETS_HEADER] = json.dumps(facets, separators=(",", ":"))
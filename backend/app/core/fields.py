@@ -0,0 +1,65 @@
+from fastapi import HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Query, load_only
+
+from app.models.issue import Issue
+
+FIELDS_DESCRIPTION = "Comma-separated issue fields to return, e.g. id,key,title,status"
+
+# Response field name -> Issue attribute
+ISSUE_FIELDS = {
+    "id": "id",
+    "key": "issue_key",
+    "title": "title",
+    "description": "description",
+    "status": "status",
+    "priority": "priority",
+    "issue_type": "issue_type",
+    "project_id": "project_id",
+    "reporter_id": "reporter_id",
+    "assignee_id": "assignee_id",
+    "sprint_id": "sprint_id",
+    "parent_issue_id": "parent_issue_id",
+    "rank": "rank",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+
+def parse_issue_fields(fields: str | None) -> list[str] | None:
+    """Parse a fields parameter; None means the endpoint's full representation"""
+    if fields is None:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",")))
+    names = [name for name in names if name]
+    if not names:
+        raise HTTPException(
+            status_code=400, detail="fields must name at least one field"
+        )
+    unknown = [name for name in names if name not in ISSUE_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return names
+
+
+def load_issue_fields(query: Query, names: list[str]) -> Query:
+    """Load only the columns behind the requested fields"""
+    columns = [getattr(Issue, ISSUE_FIELDS[name]) for name in names]
+    return query.options(load_only(*columns, raiseload=True))
+
+
+def issue_fields_response(
+    issues: list[Issue], names: list[str], response: Response
+) -> JSONResponse:
+    """
+    Serialize issues with only the requested fields.
+    Headers already set on the injected response (e.g. the next cursor) are
+    carried over, since returning a response directly bypasses them.
+    """
+    content = [
+        {name: getattr(issue, ISSUE_FIELDS[name]) for name in names} for issue in issues
+    ]
+    return JSONResponse(jsonable_encoder(content), headers=dict(response.headers))
@@ -0,0 +1,229 @@
+"""
+In-memory result sets for saved filters.
+
+A cached filter holds one sort key per matching issue, kept in the filter's
+ORDER BY order, so a page of results is a slice of a list. Committed issue
+changes are applied incrementally: the changed rows are read once and each
+cached filter's predicate is evaluated against them in Python instead of
+re-running its query. Project keys are resolved to ids when a filter is
+cached, so a committed project change drops the filters that name a key.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from app.core.changes import (
+    DELETED,
+    PROJECT,
+    subscribe_changes,
+    subscribe_issue_changes,
+)
+from app.core.config import settings
+from app.core.jql import (
+    ROW_COLUMNS,
+    compile_where,
+    evaluate,
+    parse_jql,
+    project_keys,
+    sort_key,
+)
+from app.models.issue import Issue
+from app.models.project import Project
+
+
+class _CachedResult:
+    """The ordered matches of one filter; entries are (*sort key, issue id)"""
+
+    __slots__ = ("jql", "query", "project_ids", "entries", "entry_by_id")
+
+    def __init__(self, jql: str, project_ids: dict[str, int | None]):
+        self.jql = jql
+        self.query = parse_jql(jql)
+        self.project_ids = project_ids
+        self.entries: list[tuple] = []
+        self.entry_by_id: dict[int, tuple] = {}
+
+    def discard(self, issue_id: int) -> None:
+        entry = self.entry_by_id.pop(issue_id, None)
+        if entry is not None:
+            del self.entries[bisect_left(self.entries, entry)]
+
+    def apply(self, row) -> None:
+        """Add, move or remove an issue after evaluating it against the filter"""
+        self.discard(row.id)
+        if evaluate(self.query.where, row, self.project_ids) is True:
+            entry = (*sort_key(self.query.order_by, row), row.id)
+            insort(self.entries, entry)
+            self.entry_by_id[row.id] = entry
+
+    def page(self, skip: int, limit: int) -> tuple[list[int], int]:
+        ids = [entry[-1] for entry in self.entries[skip : skip + limit]]
+        return ids, len(self.entries)
+
+
+class SavedFilterCache:
+    """
+    Cached filter results for one engine, evicted least recently used.
+    Filters matching more than SAVED_FILTER_MAX_IDS issues are not cached;
+    page() returns None for them and the caller runs the query instead.
+    """
+
+    def __init__(self, bind: Engine):
+        self.bind = bind
+        self._lock = threading.Lock()
+        self._results: OrderedDict[int, _CachedResult] = OrderedDict()
+        self._oversized: dict[int, str] = {}
+        # Issues changed while a filter's query runs, applied once it finishes
+        self._warming: dict[int, set[int]] = {}
+        # Bumped by project changes, which may remap the keys being resolved
+        self._projects_version = 0
+
+    def page(
+        self, filter_id: int, jql: str, skip: int, limit: int
+    ) -> tuple[list[int], int] | None:
+        """Return the issue ids on one page and the total number of matches"""
+        with self._lock:
+            result = self._results.get(filter_id)
+            if result is not None and result.jql == jql:
+                self._results.move_to_end(filter_id)
+                return result.page(skip, limit)
+            if self._oversized.get(filter_id) == jql:
+                return None
+
+        result = self._warm(filter_id, jql)
+        if result is None:
+            return None
+        with self._lock:
+            return result.page(skip, limit)
+
+    def invalidate(self, filter_id: int) -> None:
+        with self._lock:
+            self._results.pop(filter_id, None)
+            self._oversized.pop(filter_id, None)
+
+    def apply_changes(self, changes: dict[int, str]) -> None:
+        """Bring every cached result up to date with committed issue changes"""
+        with self._lock:
+            for changed in self._warming.values():
+                changed.update(changes)
+            if not self._results:
+                return
+            rows = self._read_rows(changes)
+            for filter_id, result in list(self._results.items()):
+                _apply_rows(result, changes, rows)
+                if len(result.entries) > settings.SAVED_FILTER_MAX_IDS:
+                    del self._results[filter_id]
+
+    def apply_project_changes(self) -> None:
+        """Drop the results of filters whose project keys may now resolve anew"""
+        with self._lock:
+            self._projects_version += 1
+            for filter_id, result in list(self._results.items()):
+                if result.project_ids:
+                    del self._results[filter_id]
+
+    def _warm(self, filter_id: int, jql: str) -> _CachedResult | None:
+        query = parse_jql(jql)
+        changed: set[int] = set()
+        with self._lock:
+            self._warming[filter_id] = changed
+            projects_version = self._projects_version
+
+        try:
+            with self.bind.connect() as connection:
+                keys = project_keys(query.where)
+                project_ids: dict[str, int | None] = dict.fromkeys(keys)
+                if keys:
+                    project_ids.update(
+                        (row.key, row.id)
+                        for row in connection.execute(
+                            select(Project.key, Project.id).where(Project.key.in_(keys))
+                        )
+                    )
+                rows = connection.execute(
+                    select(*ROW_COLUMNS)
+                    .where(compile_where(query.where))
+                    .limit(settings.SAVED_FILTER_MAX_IDS + 1)
+                ).all()
+        finally:
+            with self._lock:
+                self._warming.pop(filter_id, None)
+
+        with self._lock:
+            if len(rows) > settings.SAVED_FILTER_MAX_IDS:
+                self._oversized[filter_id] = jql
+                return None
+
+            result = _CachedResult(jql, project_ids)
+            for row in rows:
+                entry = (*sort_key(query.order_by, row), row.id)
+                result.entries.append(entry)
+                result.entry_by_id[row.id] = entry
+            result.entries.sort()
+
+            # Rows read by the query may predate changes committed meanwhile
+            if changed:
+                changes = dict.fromkeys(changed, "")
+                _apply_rows(result, changes, self._read_rows(changes))
+            # A project change committed meanwhile; the keys may be stale
+            if project_ids and self._projects_version != projects_version:
+                return result
+            self._results[filter_id] = result
+            self._oversized.pop(filter_id, None)
+            while len(self._results) > settings.SAVED_FILTER_CACHE_SIZE:
+                self._results.popitem(last=False)
+            return result
+
+    def _read_rows(self, changes: dict[int, str]) -> dict:
+        # Called with the lock held, so rows are read and applied in order
+        live_ids = [issue_id for issue_id, kind in changes.items() if kind != DELETED]
+        if not live_ids:
+            return {}
+        with self.bind.connect() as connection:
+            return {
+                row.id: row
+                for row in connection.execute(
+                    select(*ROW_COLUMNS).where(Issue.id.in_(live_ids))
+                )
+            }
+
+
+def _apply_rows(result: _CachedResult, issue_ids, rows: dict) -> None:
+    for issue_id in issue_ids:
+        row = rows.get(issue_id)
+        if row is None:
+            result.discard(issue_id)
+        else:
+            result.apply(row)
+
+
+# One cache per engine, so separate databases never share results
+_caches: WeakKeyDictionary[Engine, SavedFilterCache] = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_filter_cache(bind: Engine) -> SavedFilterCache:
+    with _caches_lock:
+        cache = _caches.get(bind)
+        if cache is None:
+            cache = _caches[bind] = SavedFilterCache(bind)
+        return cache
+
+
+@subscribe_issue_changes
+def _apply_issue_changes(bind, changes: dict[int, str]) -> None:
+    cache = _caches.get(bind)
+    if cache is not None:
+        cache.apply_changes(changes)
+
+
+@subscribe_changes(PROJECT)
+def _apply_project_changes(bind, changes: dict[int, str]) -> None:
+    cache = _caches.get(bind)
+    if cache is not None:
+        cache.apply_project_changes()
@@ -0,0 +1,63 @@
+"""
+Full-text issue search on the issue_search FTS5 index.
+
+User input is never handed to MATCH as-is. It is split into words and each
+word is quoted, so FTS5 operators and column filters typed by a user are
+searched as plain text. All words must match and the last one is a prefix,
+so results keep up with a query that is still being typed.
+"""
+
+import re
+from typing import Any
+
+from sqlalchemy import false, func, literal_column, select
+from sqlalchemy.sql.elements import ColumnClause, ColumnElement
+
+from app.models.issue import Issue
+from app.models.search_index import SEARCH_TABLE, issue_search
+
+# bm25 weights for the title, description and comments columns
+BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
+
+_WORD_RE = re.compile(r"\w+")
+_search_table: ColumnClause[Any] = literal_column(SEARCH_TABLE)
+
+
+def fts_query(text: str) -> str | None:
+    """Build a MATCH expression from user input; None if it has no words"""
+    words = _WORD_RE.findall(text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search_match(match: str) -> ColumnElement[bool]:
+    """The MATCH condition for a query built by fts_query"""
+    return _search_table.op("MATCH")(match)
+
+
+def search_rank() -> ColumnElement[float]:
+    """bm25 relevance of the current match; lower is better"""
+    return func.bm25(_search_table, *BM25_WEIGHTS)
+
+
+def search_snippet() -> ColumnElement[str]:
+    """A short excerpt around the best-matching column with the hits marked"""
+    return func.snippet(
+        _search_table, -1, SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS, SNIPPET_TOKENS
+    )
+
+
+def matching_issues(text: str) -> ColumnElement[bool]:
+    """A filter on Issue for issues whose text or comments match the input"""
+    match = fts_query(text)
+    if match is None:
+        return false()
+    return Issue.id.in_(select(issue_search.c.rowid).where(search_match(match)))
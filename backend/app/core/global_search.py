@@ -0,0 +1,213 @@
+"""
+Globally ranked search across issues, projects and users.
+
+Every type is a stream of rows ordered best first, scored on a shared 0..1
+scale: issues map their bm25 relevance s to s / (1 + s), and projects and
+users score how closely a field matches (exact, prefix, then substring). A
+page is a k-way merge of the streams, ordered by (score DESC, type, id).
+
+A cursor holds the (score, type, id) of the last row on a page. Each stream
+then seeks past it and reads at most limit + 1 rows, so a deep page costs
+the same as the first. Offsets still work, but every stream has to read
+skip + limit rows. Totals come from one count query per type.
+"""
+
+import heapq
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from sqlalchemy import Select, and_, case, func, null, or_, select
+from sqlalchemy.orm import QueryableAttribute, Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.fulltext import fts_query, search_match, search_rank, search_snippet
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.search_index import issue_search
+from app.models.user import User
+
+SEARCH_TYPES = ("issue", "project", "user")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    score: float
+    type: str
+    id: int
+    title: str
+    description: str | None
+    snippet: str | None
+
+    @property
+    def sort_key(self) -> tuple:
+        return (-self.score, SEARCH_TYPES.index(self.type), self.id)
+
+
+@dataclass(frozen=True)
+class _Source:
+    type: str
+    score: ColumnElement[float]
+    id: QueryableAttribute[int]
+    title: QueryableAttribute[str]
+    description: QueryableAttribute[str | None]
+    snippet: ColumnElement[Any]
+    base: Select
+    count: Select
+
+    def _after(self, cursor: tuple[float, str, int]) -> ColumnElement[bool]:
+        score, row_type, row_id = cursor
+        rank, cursor_rank = SEARCH_TYPES.index(self.type), SEARCH_TYPES.index(row_type)
+        if rank > cursor_rank:
+            return self.score <= score
+        if rank < cursor_rank:
+            return self.score < score
+        return or_(self.score < score, and_(self.score == score, self.id > row_id))
+
+    def top(self, cursor: tuple[float, str, int] | None, count: int) -> Select:
+        """The best count rows after the cursor, best first"""
+        statement = self.base.add_columns(
+            self.score.label("score"),
+            self.id.label("id"),
+            self.title.label("title"),
+            self.description.label("description"),
+            self.snippet.label("snippet"),
+        )
+        if cursor is not None:
+            statement = statement.where(self._after(cursor))
+        return statement.order_by(self.score.desc(), self.id).limit(count)
+
+
+def _match_score(
+    *conditions: tuple[ColumnElement[bool], float],
+) -> ColumnElement[float]:
+    return case(*conditions, else_=0.0)
+
+
+def _issue_source(q: str, project_id: int | None) -> _Source | None:
+    match = fts_query(q)
+    if match is None:
+        return None
+    rank = search_rank()
+    conditions = [search_match(match)]
+    if project_id:
+        conditions.append(Issue.project_id == project_id)
+        count = (
+            select(func.count())
+            .select_from(issue_search)
+            .join(Issue, Issue.id == issue_search.c.rowid)
+            .where(*conditions)
+        )
+    else:
+        # Counting matches alone never has to touch the issues table
+        count = select(func.count()).select_from(issue_search).where(*conditions)
+    return _Source(
+        type="issue",
+        # bm25 is negative, better matches more so
+        score=(-rank) / (1.0 - rank),
+        id=Issue.id,
+        title=Issue.title,
+        description=Issue.description,
+        snippet=search_snippet(),
+        base=select()
+        .select_from(issue_search)
+        .join(Issue, Issue.id == issue_search.c.rowid)
+        .where(*conditions),
+        count=count,
+    )
+
+
+def _project_source(q: str) -> _Source:
+    lowered = q.lower()
+    condition = or_(
+        Project.name.icontains(q, autoescape=True),
+        Project.key.icontains(q, autoescape=True),
+        Project.description.icontains(q, autoescape=True),
+    )
+    return _Source(
+        type="project",
+        score=_match_score(
+            (func.lower(Project.key) == lowered, 1.0),
+            (func.lower(Project.name) == lowered, 0.95),
+            (Project.key.istartswith(q, autoescape=True), 0.85),
+            (Project.name.istartswith(q, autoescape=True), 0.8),
+            (Project.name.icontains(q, autoescape=True), 0.6),
+            (Project.key.icontains(q, autoescape=True), 0.55),
+            (Project.description.icontains(q, autoescape=True), 0.3),
+        ),
+        id=Project.id,
+        title=Project.name,
+        description=Project.description,
+        snippet=null(),
+        base=select().select_from(Project).where(condition),
+        count=select(func.count(Project.id)).where(condition),
+    )
+
+
+def _user_source(q: str) -> _Source:
+    lowered = q.lower()
+    condition = or_(
+        User.username.icontains(q, autoescape=True),
+        User.email.icontains(q, autoescape=True),
+        User.full_name.icontains(q, autoescape=True),
+    )
+    return _Source(
+        type="user",
+        score=_match_score(
+            (func.lower(User.username) == lowered, 1.0),
+            (func.lower(User.email) == lowered, 0.95),
+            (User.username.istartswith(q, autoescape=True), 0.85),
+            (User.full_name.istartswith(q, autoescape=True), 0.8),
+            (User.email.istartswith(q, autoescape=True), 0.75),
+            (User.username.icontains(q, autoescape=True), 0.6),
+            (User.full_name.icontains(q, autoescape=True), 0.55),
+            (User.email.icontains(q, autoescape=True), 0.5),
+        ),
+        id=User.id,
+        title=User.username,
+        description=User.full_name,
+        snippet=null(),
+        base=select().select_from(User).where(condition),
+        count=select(func.count(User.id)).where(condition),
+    )
+
+
+def search_all(
+    db: Session,
+    q: str,
+    types: tuple[str, ...],
+    *,
+    project_id: int | None,
+    skip: int,
+    limit: int,
+    cursor: tuple[float, str, int] | None,
+) -> tuple[list[SearchHit], dict[str, int], bool]:
+    """
+    Return one page of hits, the number of matches per type and whether
+    more pages follow. project_id restricts issue results only.
+    """
+    sources = [
+        source
+        for source in (
+            _issue_source(q, project_id),
+            _project_source(q),
+            _user_source(q),
+        )
+        if source is not None and source.type in types
+    ]
+
+    start = 0 if cursor is not None else skip
+    streams = [
+        [
+            SearchHit(type=source.type, **row._mapping)
+            for row in db.execute(source.top(cursor, start + limit + 1))
+        ]
+        for source in sources
+    ]
+    merged = heapq.merge(*streams, key=lambda hit: hit.sort_key)
+    page = list(islice(merged, start, start + limit + 1))
+
+    totals = dict.fromkeys(types, 0)
+    for source in sources:
+        totals[source.type] = db.scalar(source.count)
+    return page[:limit], totals, len(page) > limit
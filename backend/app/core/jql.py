@@ -0,0 +1,662 @@
+"""
+A small JQL-style query language for issues.
+
+    project = WEB AND status IN (TO_DO, IN_PROGRESS) AND assignee = 12
+    ORDER BY priority DESC
+
+Clauses compare a field with a value (=, !=, <, <=, >, >=), a list of values
+([NOT] IN), emptiness (IS [NOT] EMPTY) or, for text fields, a substring
+(~, !~); a date without a time, as in created = 2025-01-05, stands for the
+whole day. They combine with AND, OR, NOT and parentheses. Parsing produces an
+immutable AST that is cached per query string; compiling turns it into a
+parameterized filter and ordering on Issue, and evaluate/sort_key apply the
+same AST to a single row in Python.
+"""
+
+import enum
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import String, and_, case, not_, or_, select, type_coerce
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
+from app.models.project import Project
+
+JQL_CACHE_SIZE = 512
+
+
+class JQLError(ValueError):
+    """Raised for queries that cannot be parsed or would scan every issue"""
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    column: InstrumentedAttribute[Any]
+    kind: str  # "id", "enum", "project", "key", "date" or "text"
+    indexed: bool = False
+    nullable: bool = False
+    enum_type: type[enum.Enum] | None = None
+    # Further columns searched by a text field that spans several
+    extra_columns: tuple[InstrumentedAttribute[Any], ...] = ()
+
+    @property
+    def members(self) -> list[enum.Enum]:
+        """The members of an enum field in rank order, empty for other kinds"""
+        return [] if self.enum_type is None else list(self.enum_type)
+
+
+FIELDS: dict[str, FieldSpec] = {
+    "id": FieldSpec(Issue.id, "id", indexed=True),
+    "key": FieldSpec(Issue.issue_key, "key", indexed=True),
+    "project": FieldSpec(Issue.project_id, "project", indexed=True),
+    "status": FieldSpec(Issue.status, "enum", indexed=True, enum_type=IssueStatus),
+    "priority": FieldSpec(Issue.priority, "enum", enum_type=IssuePriority),
+    "type": FieldSpec(Issue.issue_type, "enum", enum_type=IssueType),
+    "assignee": FieldSpec(Issue.assignee_id, "id", indexed=True, nullable=True),
+    "reporter": FieldSpec(Issue.reporter_id, "id", indexed=True),
+    "sprint": FieldSpec(Issue.sprint_id, "id", indexed=True, nullable=True),
+    "parent": FieldSpec(Issue.parent_issue_id, "id", indexed=True, nullable=True),
+    "created": FieldSpec(Issue.created_at, "date", indexed=True),
+    "updated": FieldSpec(Issue.updated_at, "date"),
+    "title": FieldSpec(Issue.title, "text"),
+    "description": FieldSpec(Issue.description, "text", nullable=True),
+    "text": FieldSpec(Issue.title, "text", extra_columns=(Issue.description,)),
+}
+FIELD_ALIASES = {"issuetype": "type", "summary": "title", "issuekey": "key"}
+
+ORDERABLE_FIELDS = {"id", "key", "status", "priority", "type", "created", "updated"}
+
+# Operators each kind of field accepts
+COMPARISON_OPS = {"=", "!=", "<", "<=", ">", ">="}
+KIND_OPS = {
+    "id": COMPARISON_OPS | {"in", "not in"},
+    "enum": COMPARISON_OPS | {"in", "not in"},
+    "project": {"=", "!=", "in", "not in"},
+    "key": {"=", "!=", "in", "not in"},
+    "date": COMPARISON_OPS,
+    "text": {"~", "!~"},
+}
+# Operators that can be answered from an index on the field
+SEEKABLE_OPS = {"=", "in", "<", "<=", ">", ">=", "is empty"}
+
+
+@dataclass(frozen=True)
+class Clause:
+    field: str
+    op: str
+    values: tuple = ()
+
+
+@dataclass(frozen=True)
+class And:
+    items: tuple
+
+
+@dataclass(frozen=True)
+class Or:
+    items: tuple
+
+
+@dataclass(frozen=True)
+class Not:
+    item: object
+
+
+@dataclass(frozen=True)
+class OrderBy:
+    field: str
+    descending: bool
+
+
+@dataclass(frozen=True)
+class JQLQuery:
+    where: object | None
+    order_by: tuple[OrderBy, ...]
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>!=|<=|>=|!~|=|<|>|~|\(|\)|,)
+      | (?P<word>[A-Za-z0-9_][A-Za-z0-9_\-.:]*)
+    )""",
+    re.VERBOSE,
+)
+KEYWORDS = {
+    "and",
+    "or",
+    "not",
+    "in",
+    "is",
+    "empty",
+    "null",
+    "order",
+    "by",
+    "asc",
+    "desc",
+}
+
+
+def _tokenize(text: str) -> list[tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position or match.lastgroup is None:
+            raise JQLError(f"Unexpected character at position {position}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        start = match.start(kind)
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "word" and value.lower() in KEYWORDS:
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value, start))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.index = 0
+
+    def peek(self, kind: str | None = None, value: str | None = None) -> bool:
+        if self.index >= len(self.tokens):
+            return False
+        token_kind, token_value, _ = self.tokens[self.index]
+        return (kind is None or token_kind == kind) and (
+            value is None or token_value == value
+        )
+
+    def take(self, kind: str | None = None, value: str | None = None) -> str:
+        if not self.peek(kind, value):
+            expected = value or kind or "more input"
+            if self.index >= len(self.tokens):
+                raise JQLError(f"Expected {expected} at end of query")
+            _, found, position = self.tokens[self.index]
+            raise JQLError(f"Expected {expected} at position {position}, got {found!r}")
+        self.index += 1
+        return self.tokens[self.index - 1][1]
+
+    def parse(self) -> JQLQuery:
+        where = None
+        if self.tokens and not self.peek("keyword", "order"):
+            where = self.parse_or()
+        order_by = self.parse_order_by() if self.peek("keyword", "order") else ()
+        if self.index < len(self.tokens):
+            _, found, position = self.tokens[self.index]
+            raise JQLError(f"Unexpected {found!r} at position {position}")
+        return JQLQuery(where=where, order_by=order_by)
+
+    def parse_or(self):
+        items = [self.parse_and()]
+        while self.peek("keyword", "or"):
+            self.take()
+            items.append(self.parse_and())
+        return items[0] if len(items) == 1 else Or(tuple(items))
+
+    def parse_and(self):
+        items = [self.parse_not()]
+        while self.peek("keyword", "and"):
+            self.take()
+            items.append(self.parse_not())
+        return items[0] if len(items) == 1 else And(tuple(items))
+
+    def parse_not(self):
+        if self.peek("keyword", "not"):
+            self.take()
+            return Not(self.parse_not())
+        if self.peek("op", "("):
+            self.take()
+            node = self.parse_or()
+            self.take("op", ")")
+            return node
+        return self.parse_clause()
+
+    def parse_clause(self) -> Clause:
+        name = self.take("word").lower()
+        name = FIELD_ALIASES.get(name, name)
+        spec = FIELDS.get(name)
+        if spec is None:
+            raise JQLError(f"Unknown field {name!r}")
+
+        if self.peek("keyword", "is"):
+            self.take()
+            negated = self.peek("keyword", "not")
+            if negated:
+                self.take()
+            if self.peek("keyword", "null"):
+                self.take()
+            else:
+                self.take("keyword", "empty")
+            if not spec.nullable:
+                raise JQLError(f"Field {name!r} is never empty")
+            return Clause(name, "is not empty" if negated else "is empty")
+
+        if self.peek("keyword", "not") or self.peek("keyword", "in"):
+            op = "not in" if self.take() == "not" else "in"
+            if op == "not in":
+                self.take("keyword", "in")
+            self.take("op", "(")
+            values = [self.parse_value(name, spec)]
+            while self.peek("op", ","):
+                self.take()
+                values.append(self.parse_value(name, spec))
+            self.take("op", ")")
+        else:
+            op = self.take("op")
+            values = [self.parse_value(name, spec)]
+
+        if op not in KIND_OPS[spec.kind]:
+            raise JQLError(f"Operator {op!r} is not supported for {name!r}")
+        return Clause(name, op, tuple(values))
+
+    def parse_value(self, name: str, spec: FieldSpec):
+        if self.peek("string"):
+            raw = self.take()
+        else:
+            raw = self.take("word")
+        return _convert_value(name, spec, raw)
+
+    def parse_order_by(self) -> tuple[OrderBy, ...]:
+        self.take("keyword", "order")
+        self.take("keyword", "by")
+        order_by = []
+        while True:
+            name = self.take("word").lower()
+            name = FIELD_ALIASES.get(name, name)
+            if name not in ORDERABLE_FIELDS:
+                raise JQLError(f"Cannot order by {name!r}")
+            descending = False
+            if self.peek("keyword", "asc") or self.peek("keyword", "desc"):
+                descending = self.take() == "desc"
+            order_by.append(OrderBy(name, descending))
+            if not self.peek("op", ","):
+                return tuple(order_by)
+            self.take()
+
+
+def _convert_value(name: str, spec: FieldSpec, raw: str):
+    if spec.kind == "id":
+        if not raw.isdigit():
+            raise JQLError(f"{name!r} expects a numeric id, got {raw!r}")
+        return int(raw)
+    if spec.kind == "project":
+        return int(raw) if raw.isdigit() else raw.upper()
+    if spec.kind == "key":
+        return raw.upper()
+    if spec.kind == "enum":
+        members = {member.name: member for member in spec.members}
+        try:
+            return members[raw.upper()]
+        except KeyError:
+            allowed = ", ".join(members)
+            raise JQLError(
+                f"Invalid {name} {raw!r}; expected one of {allowed}"
+            ) from None
+    if spec.kind == "date":
+        # A date without a time stands for the whole day
+        try:
+            return date.fromisoformat(raw)
+        except ValueError:
+            pass
+        try:
+            value = datetime.fromisoformat(raw)
+        except ValueError:
+            raise JQLError(f"{name!r} expects an ISO date, got {raw!r}") from None
+        # Timestamps are stored as naive UTC
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value
+    return raw
+
+
+def _is_seekable(node) -> bool:
+    """Whether every row the node can match is reachable through an index"""
+    if isinstance(node, Clause):
+        return FIELDS[node.field].indexed and node.op in SEEKABLE_OPS
+    if isinstance(node, And):
+        return any(_is_seekable(item) for item in node.items)
+    if isinstance(node, Or):
+        return all(_is_seekable(item) for item in node.items)
+    return False
+
+
+@lru_cache(maxsize=JQL_CACHE_SIZE)
+def parse_jql(text: str) -> JQLQuery:
+    """
+    Parse a query into its AST. Results are cached per query string, so
+    repeated queries skip parsing and validation entirely.
+    Raises JQLError for invalid queries and for queries with no indexed
+    condition to start from, which would have to scan every issue.
+    """
+    query = _Parser(text).parse()
+    if query.where is None or not _is_seekable(query.where):
+        indexed = ", ".join(name for name, spec in FIELDS.items() if spec.indexed)
+        raise JQLError(
+            "Query would scan all issues; every OR branch needs a positive "
+            f"condition on one of: {indexed}"
+        )
+    return query
+
+
+def _compile_clause(clause: Clause) -> ColumnElement[bool]:
+    spec = FIELDS[clause.field]
+    values = list(clause.values)
+
+    if spec.kind == "text":
+        condition = or_(
+            *(
+                column.icontains(values[0], autoescape=True)
+                for column in (spec.column, *spec.extra_columns)
+            )
+        )
+        if clause.op == "!~":
+            return not_(condition)
+        return condition
+
+    if clause.op == "is empty":
+        return spec.column.is_(None)
+    if clause.op == "is not empty":
+        return spec.column.is_not(None)
+
+    column = spec.column
+    if spec.kind == "project":
+        # Project keys are resolved by the database, ids are used as given
+        values = [
+            value
+            if isinstance(value, int)
+            else select(Project.id).where(Project.key == value).scalar_subquery()
+            for value in values
+        ]
+    elif spec.kind == "enum" and clause.op in {"<", "<=", ">", ">="}:
+        # Enum members are declared in rank order, e.g. LOW < MEDIUM < HIGH
+        members = spec.members
+        rank = members.index(values[0])
+        selected = {
+            "<": members[:rank],
+            "<=": members[: rank + 1],
+            ">": members[rank + 1 :],
+            ">=": members[rank:],
+        }[clause.op]
+        return column.in_(selected)
+    elif spec.kind == "date":
+        return _compile_date(column, clause.op, values[0])
+
+    value: object = values[0]
+    if clause.op == "=":
+        return column == value
+    if clause.op == "!=":
+        return column != value
+    if clause.op == "in":
+        return column.in_(values)
+    if clause.op == "not in":
+        return column.not_in(values)
+    return {
+        "<": column < value,
+        "<=": column <= value,
+        ">": column > value,
+        ">=": column >= value,
+    }[clause.op]
+
+
+def _day_range(day: date) -> tuple[datetime, datetime]:
+    """The instants of a day, as [start, end)"""
+    start = datetime.combine(day, time())
+    return start, start + timedelta(days=1)
+
+
+def _compile_date(
+    column: InstrumentedAttribute[Any], op: str, value: date
+) -> ColumnElement[bool]:
+    # SQLite keeps timestamps as text: the database default writes whole
+    # seconds and SQLAlchemy appends microseconds, so one instant has two
+    # spellings. Comparing the raw text against both keeps the column's
+    # index usable and agrees with evaluate(), which compares datetimes.
+    raw = type_coerce(column, String)
+    if not isinstance(value, datetime):
+        # Midnight's shortest spelling sorts before its longest
+        start, end = (
+            bound.isoformat(sep=" ", timespec="seconds") for bound in _day_range(value)
+        )
+        during = and_(raw >= start, raw < end)
+        return {
+            "=": during,
+            "!=": not_(during),
+            "<": raw < start,
+            "<=": raw < end,
+            ">": raw >= end,
+            ">=": raw >= start,
+        }[op]
+    longest = value.isoformat(sep=" ", timespec="microseconds")
+    shortest = (
+        longest if value.microsecond else value.isoformat(sep=" ", timespec="seconds")
+    )
+    equal = and_(raw >= shortest, raw <= longest)
+    return {
+        "=": equal,
+        "!=": not_(equal),
+        "<": raw < shortest,
+        "<=": raw <= longest,
+        ">": raw > longest,
+        ">=": raw >= shortest,
+    }[op]
+
+
+def compile_where(node) -> ColumnElement[bool]:
+    """Compile an AST node into a filter on Issue"""
+    if isinstance(node, Clause):
+        return _compile_clause(node)
+    if isinstance(node, And):
+        return and_(*(compile_where(item) for item in node.items))
+    if isinstance(node, Or):
+        return or_(*(compile_where(item) for item in node.items))
+    return not_(compile_where(node.item))
+
+
+def compile_order_by(order_by: tuple[OrderBy, ...]) -> list[ColumnElement[Any]]:
+    """Compile ORDER BY terms, newest first when none are given"""
+    if not order_by:
+        return [Issue.created_at.desc(), Issue.id.desc()]
+
+    terms: list[ColumnElement[Any]] = []
+    for term in order_by:
+        spec = FIELDS[term.field]
+        expressions: list[ColumnElement[Any] | InstrumentedAttribute[Any]]
+        if spec.kind == "enum":
+            ranks = {member: rank for rank, member in enumerate(spec.members)}
+            expressions = [case(ranks, value=spec.column)]
+        elif spec.kind == "key":
+            # Keys sort by project, then numerically within the project
+            expressions = [Issue.project_id, Issue.number]
+        else:
+            expressions = [spec.column]
+        terms.extend(
+            expression.desc() if term.descending else expression.asc()
+            for expression in expressions
+        )
+    # A stable tie-breaker keeps skip/limit pages consistent
+    terms.append(Issue.id.desc() if order_by[-1].descending else Issue.id.asc())
+    return terms
+
+
+# Columns a row needs for evaluate() and sort_key()
+ROW_COLUMNS = (
+    Issue.id,
+    Issue.issue_key,
+    Issue.number,
+    Issue.project_id,
+    Issue.status,
+    Issue.priority,
+    Issue.issue_type,
+    Issue.assignee_id,
+    Issue.reporter_id,
+    Issue.sprint_id,
+    Issue.parent_issue_id,
+    Issue.created_at,
+    Issue.updated_at,
+    Issue.title,
+    Issue.description,
+)
+
+
+def project_keys(node) -> set[str]:
+    """Collect the project keys a query refers to, for resolving to ids"""
+    if isinstance(node, Clause):
+        if FIELDS[node.field].kind == "project":
+            return {value for value in node.values if isinstance(value, str)}
+        return set()
+    if isinstance(node, Not):
+        return project_keys(node.item)
+    return set().union(*(project_keys(item) for item in node.items))
+
+
+def _all(results) -> bool | None:
+    results = list(results)
+    if False in results:
+        return False
+    return None if None in results else True
+
+
+def _any(results) -> bool | None:
+    results = list(results)
+    if True in results:
+        return True
+    return None if None in results else False
+
+
+def _negate(result: bool | None) -> bool | None:
+    return None if result is None else not result
+
+
+def _evaluate_clause(clause: Clause, row, project_ids: dict) -> bool | None:
+    spec = FIELDS[clause.field]
+    values = list(clause.values)
+
+    if spec.kind == "text":
+        needle = values[0].lower()
+        result = _any(
+            None if text is None else needle in text.lower()
+            for text in (
+                getattr(row, column.key)
+                for column in (spec.column, *spec.extra_columns)
+            )
+        )
+        return _negate(result) if clause.op == "!~" else result
+
+    value = getattr(row, spec.column.key)
+    if clause.op == "is empty":
+        return value is None
+    if clause.op == "is not empty":
+        return value is not None
+
+    if spec.kind == "project":
+        values = [
+            candidate if isinstance(candidate, int) else project_ids.get(candidate)
+            for candidate in values
+        ]
+    elif spec.kind == "enum" and clause.op in {"<", "<=", ">", ">="}:
+        members = spec.members
+        rank = members.index(values[0])
+        allowed = {
+            "<": members[:rank],
+            "<=": members[: rank + 1],
+            ">": members[rank + 1 :],
+            ">=": members[rank:],
+        }[clause.op]
+        return None if value is None else value in allowed
+
+    if clause.op in {"in", "not in"}:
+        # SQL semantics: a NULL on either side makes a non-match unknown
+        result = _any(
+            None if value is None or candidate is None else value == candidate
+            for candidate in values
+        )
+        return _negate(result) if clause.op == "not in" else result
+
+    if value is None or values[0] is None:
+        return None
+    matched: bool
+    if spec.kind == "date" and not isinstance(values[0], datetime):
+        start, end = _day_range(values[0])
+        during = start <= value < end
+        matched = {
+            "=": during,
+            "!=": not during,
+            "<": value < start,
+            "<=": value < end,
+            ">": value >= end,
+            ">=": value >= start,
+        }[clause.op]
+    else:
+        matched = {
+            "=": value == values[0],
+            "!=": value != values[0],
+            "<": value < values[0],
+            "<=": value <= values[0],
+            ">": value > values[0],
+            ">=": value >= values[0],
+        }[clause.op]
+    return matched
+
+
+def evaluate(node, row, project_ids: dict[str, int | None]) -> bool | None:
+    """
+    Evaluate an AST node against one issue row using SQL's three-valued
+    logic, so the answer agrees with compile_where: True, False or None for
+    unknown. row has the attributes in ROW_COLUMNS and project_ids maps the
+    query's project keys to ids (None for keys that do not exist).
+    """
+    if isinstance(node, Clause):
+        return _evaluate_clause(node, row, project_ids)
+    if isinstance(node, And):
+        return _all(evaluate(item, row, project_ids) for item in node.items)
+    if isinstance(node, Or):
+        return _any(evaluate(item, row, project_ids) for item in node.items)
+    return _negate(evaluate(node.item, row, project_ids))
+
+
+class _Descending:
+    """Inverts the ordering of a value inside a sort key tuple"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def sort_key(order_by: tuple[OrderBy, ...], row) -> tuple:
+    """
+    Build a key that sorts rows in the same order as compile_order_by,
+    ascending, so sorted lists of keys can be maintained with bisect
+    """
+    if not order_by:
+        return (_Descending(row.created_at), _Descending(row.id))
+
+    key: list[Any] = []
+    for term in order_by:
+        spec = FIELDS[term.field]
+        value = getattr(row, spec.column.key)
+        if spec.kind == "enum":
+            parts = [spec.members.index(value)]
+        elif spec.kind == "key":
+            parts = [row.project_id, row.number]
+        else:
+            parts = [value]
+        key.extend(_Descending(part) if term.descending else part for part in parts)
+    key.append(_Descending(row.id) if order_by[-1].descending else row.id)
+    return tuple(key)
@@ -0,0 +1,120 @@
+"""
+Lexicographic ranks for manually ordered issues.
+
+A rank is a string of base-36 digits read as a fraction, so ranks sort as
+plain strings and there is always another rank between two of them. Ranks
+never end in "0", which keeps that true ("i" and "i0" would be equal).
+
+Moving an item gives it a rank between its new neighbours, so only its own
+row is written. Ranks at either end of a list step by RANK_STEP until that
+end of the range is reached, and ranks between two neighbours halve the
+gap; past the end or into the same gap, a digit is added every few ranks.
+Once a rank is longer than MAX_RANK_LENGTH the ranks around it are due
+for rebalancing: spread_ranks spaces a run of neighbours out evenly over
+the gap around them, and spaced_ranks a whole list.
+"""
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Digits of a freshly spaced rank, and the gap left between neighbours
+RANK_WIDTH = 6
+RANK_STEP = BASE**3
+MAX_RANK_LENGTH = 12
+# Respread ranks are this much shorter than the limit, so that the gaps
+# between them take a few dozen more moves
+_SPREAD_SLACK = 3
+
+
+def _encode(value: int, width: int) -> str:
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def _leading_value(rank: str, width: int = RANK_WIDTH) -> int:
+    """The first width digits of a rank as an integer"""
+    return int(rank[:width].ljust(width, "0"), BASE)
+
+
+def _midpoint(low: str, high: str | None) -> str:
+    """A rank strictly between low and high; None is the top of the range"""
+    if high is not None:
+        # Keep the common prefix, reading missing digits of low as zeros
+        common = 0
+        while common < len(high) and (low[common : common + 1] or "0") == high[common]:
+            common += 1
+        if common:
+            return high[:common] + _midpoint(low[common:], high[common:])
+    low_digit = DIGITS.index(low[0]) if low else 0
+    high_digit = DIGITS.index(high[0]) if high is not None else BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    # Adjacent digits: a longer high has room under its first digit alone
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """
+    A rank that sorts after before and before after. None leaves that side
+    open, e.g. rank_between(last, None) appends to a list.
+    """
+    if before is not None and after is not None:
+        if before >= after:
+            raise ValueError(f"{before!r} does not sort before {after!r}")
+        return _midpoint(before, after)
+    if before is not None:
+        value = _leading_value(before) + RANK_STEP
+        if value < BASE**RANK_WIDTH:
+            return _encode(value, RANK_WIDTH)
+        return _midpoint(before, None)
+    if after is not None:
+        value = _leading_value(after) - RANK_STEP
+        if value > 0:
+            return _encode(value, RANK_WIDTH)
+        return _midpoint("", after)
+    return spaced_ranks(1)[0]
+
+
+def next_ranks(last: str | None, count: int) -> list[str]:
+    """count ascending ranks after last, for appending to a list"""
+    ranks = []
+    for _ in range(count):
+        last = rank_between(last, None)
+        ranks.append(last)
+    return ranks
+
+
+def spaced_ranks(count: int) -> list[str]:
+    """
+    count ascending ranks RANK_STEP apart, centred in the rank space so
+    that both ends of the list have as much room as the list itself.
+    """
+    width = RANK_WIDTH
+    while 2 * count >= BASE**width // RANK_STEP:
+        width += 1
+    slots = BASE**width // RANK_STEP
+    offset = (slots - count) // 2
+    return [_encode((offset + i) * RANK_STEP, width) for i in range(1, count + 1)]
+
+
+def spread_ranks(low: str | None, high: str | None, count: int) -> list[str] | None:
+    """
+    count ascending ranks RANK_STEP or more apart between low and high (None
+    is an open end), as short as that allows; None if they would not be
+    clearly shorter than MAX_RANK_LENGTH, i.e. the gap is too narrow.
+    """
+    if low is None and high is None:
+        return spaced_ranks(count)
+    for width in range(RANK_WIDTH, MAX_RANK_LENGTH - _SPREAD_SLACK + 1):
+        # Truncating low is fine: the first rank is a whole step above it
+        bottom = _leading_value(low, width) if low is not None else 0
+        top = _leading_value(high, width) if high is not None else BASE**width
+        step = (top - bottom) // (count + 1)
+        if step >= RANK_STEP:
+            return [_encode(bottom + i * step, width) for i in range(1, count + 1)]
+    return None
@@ -0,0 +1,149 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import String, literal, tuple_, type_coerce
+from sqlalchemy.orm import Query, QueryableAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+# Mapped attributes (Issue.created_at) and plain SQL expressions both sort
+SortColumn = ColumnElement[Any] | QueryableAttribute[Any]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+ISSUE_ORDER_DESCRIPTION = (
+    "newest: newest first; rank: the manual order set by PATCH /issues/{id}/rank"
+)
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str, types: tuple[type | tuple[type, ...], ...]) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(
+            isinstance(value, expected) and not isinstance(value, bool)
+            for value, expected in zip(values, types, strict=True)
+        )
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def encode_cursor(sort_value: str, row_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    return _encode([sort_value, row_id])
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by encode_cursor"""
+    sort_value, row_id = _decode(cursor, (str, int))
+    return sort_value, row_id
+
+
+def encode_rank_cursor(score: float, row_type: str, row_id: int) -> str:
+    """Encode the position of the last row of a relevance-ranked page"""
+    return _encode([score, row_type, row_id])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, str, int]:
+    """Decode a cursor produced by encode_rank_cursor"""
+    score, row_type, row_id = _decode(cursor, ((int, float), str, int))
+    return float(score), row_type, row_id
+
+
+def set_next_page(request: Request, response: Response, next_cursor: str) -> None:
+    """Advertise the next page in the X-Next-Cursor and Link headers"""
+    next_url = request.url.remove_query_params("skip").include_query_params(
+        cursor=next_cursor
+    )
+    response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+
+def paginate_newest_first(
+    query: Query,
+    *,
+    sort_column: SortColumn,
+    id_column: SortColumn,
+    request: Request,
+    response: Response,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+) -> list:
+    """
+    Return one page of query results ordered by (sort_column, id_column) DESC.
+
+    With a cursor the page starts right after the row it encodes, so fetching
+    any page is a single index seek; without one, skip is applied as before.
+    When the page is full, the next cursor is sent in the X-Next-Cursor and
+    Link response headers.
+    """
+    # Compare against the value exactly as stored: SQLite keeps timestamps
+    # as text, and re-binding a parsed datetime would change its format
+    raw_sort = type_coerce(sort_column, String)
+    query = query.add_columns(raw_sort, id_column).order_by(
+        sort_column.desc(), id_column.desc()
+    )
+
+    if cursor is not None:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(raw_sort, id_column) < tuple_(literal(sort_value), literal(row_id))
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    rows = query.limit(limit).all()
+
+    if len(rows) == limit:
+        *_, last_sort, last_id = rows[-1]
+        set_next_page(request, response, encode_cursor(last_sort, last_id))
+
+    return [row[0] for row in rows]
+
+
+def paginate_ranked(
+    query: Query,
+    *,
+    sort_column: SortColumn,
+    id_column: SortColumn,
+    request: Request,
+    response: Response,
+    skip: int,
+    limit: int,
+    cursor: str | None,
+) -> list:
+    """
+    Return one page of query results in manual order, (sort_column,
+    id_column) ascending, paged like paginate_newest_first. sort_column
+    holds lexicographic ranks (see app.core.lexorank).
+    """
+    query = query.add_columns(sort_column, id_column).order_by(sort_column, id_column)
+
+    if cursor is not None:
+        rank, row_id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(sort_column, id_column) > tuple_(literal(rank), literal(row_id))
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    rows = query.limit(limit).all()
+
+    if len(rows) == limit:
+        *_, last_rank, last_id = rows[-1]
+        set_next_page(request, response, encode_cursor(last_rank, last_id))
+
+    return [row[0] for row in rows]
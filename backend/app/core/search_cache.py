@@ -0,0 +1,148 @@
+"""
+Bounded LRU + TTL cache for search results.
+
+Every entity type (issue, comment, project, user) has a version counter
+that is bumped by each committed change to it. A cached result remembers
+the versions of the types it could match, read before it was computed, and
+is served only while they are unchanged: a write to users never evicts
+issue searches, and a result computed while a write committed is never
+stored as current. The TTL bounds staleness from writes the change hub
+cannot see, such as other processes sharing the database.
+"""
+
+import string
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.engine import Engine
+
+from app.core.changes import COMMENT, ISSUE, PROJECT, USER, subscribe_changes
+from app.core.config import settings
+
+CACHED_ENTITIES = (ISSUE, COMMENT, PROJECT, USER)
+
+# SQLite's LIKE and lower() and the FTS tokenizer all ignore ASCII case
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+T = TypeVar("T")
+
+
+def normalize_query(q: str) -> str:
+    """Fold the case differences that can not change what a search matches"""
+    return q.translate(_ASCII_LOWER)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    versions: tuple[int, ...]
+    expires_at: float
+
+
+class SearchCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._versions = dict.fromkeys(CACHED_ENTITIES, 0)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get_or_compute(
+        self, key: Hashable, entities: tuple[str, ...], compute: Callable[[], T]
+    ) -> T:
+        """
+        The cached result for key, or compute() cached under it. entities
+        are the types whose writes could change the result.
+        """
+        with self._lock:
+            versions = self._versions_of(entities)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.versions != versions:
+                    self._invalidations += 1
+                    del self._entries[key]
+                elif entry.expires_at <= time.monotonic():
+                    self._expirations += 1
+                    del self._entries[key]
+                else:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    # Keys are never shared between result types
+                    cached: T = entry.value
+                    return cached
+            self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            # A write committed while computing; the result may predate it
+            if self._versions_of(entities) != versions:
+                return value
+            self._entries[key] = _Entry(value, versions, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def bump(self, entity: str) -> None:
+        """Invalidate every result that depends on entity"""
+        with self._lock:
+            self._versions[entity] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "versions": dict(self._versions),
+            }
+
+    def _versions_of(self, entities: tuple[str, ...]) -> tuple[int, ...]:
+        return tuple(self._versions[entity] for entity in entities)
+
+
+# One cache per engine, so separate databases never share results
+_caches: WeakKeyDictionary[Engine, SearchCache] = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_search_cache(bind: Engine) -> SearchCache:
+    with _caches_lock:
+        cache = _caches.get(bind)
+        if cache is None:
+            cache = _caches[bind] = SearchCache(
+                settings.SEARCH_CACHE_SIZE, settings.SEARCH_CACHE_TTL
+            )
+        return cache
+
+
+def _bump_on_change(entity: str):
+    def bump(bind, changes: dict[int, str]) -> None:
+        cache = _caches.get(bind)
+        if cache is not None:
+            cache.bump(entity)
+
+    return bump
+
+
+for _entity in CACHED_ENTITIES:
+    subscribe_changes(_entity)(_bump_on_change(_entity))
@@ -0,0 +1,385 @@
+"""
+In-memory typeahead over users, projects and issue keys.
+
+Names are indexed as normalized terms: every field, plus each word of a
+multi-word name. A sorted list of the terms answers prefix queries with a
+binary search, and a trigram index over the same terms finds near misses
+such as swapped letters. Issue keys are kept as sorted issue numbers per key
+prefix, so "WEB-12" is a bisect for WEB-12, then WEB-120..129,
+WEB-1200..1299 and so on, without holding a string per issue.
+
+The index of an engine is loaded once, at startup or on first use, and then
+follows committed changes. Inactive users are not suggested.
+"""
+
+import heapq
+import re
+import threading
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Engine
+
+from app.core.changes import DELETED, ISSUE, PROJECT, USER, subscribe_changes
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.user import User
+
+SUGGEST_TYPES = (USER, PROJECT, ISSUE)
+
+# Scores are 0..1; any prefix match outranks any fuzzy one
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.5  # plus up to 0.4 for how much of the term is typed
+FUZZY_SCORE = 0.5  # times the share of the query's trigrams the term has
+FUZZY_MIN_LENGTH = 3
+FUZZY_MIN_SIMILARITY = 0.5
+# Bounds the work for one or two letter queries that prefix most terms
+MAX_PREFIX_TERMS = 200
+
+# Rows of the named entities: id, label, detail, then any other searched field
+_NAME_ROWS: dict[str, Select] = {
+    USER: select(User.id, User.username, User.full_name, User.email).where(
+        User.is_active.is_(True)
+    ),
+    PROJECT: select(Project.id, Project.name, Project.key),
+}
+
+_ISSUE_KEY_RE = re.compile(r"([^\W\d_]\w*)-(\d*)")
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    type: str
+    id: int
+    label: str
+    detail: str | None
+    score: float
+
+
+@dataclass(frozen=True)
+class _Entry:
+    label: str
+    detail: str | None
+    terms: frozenset[str]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _terms(*fields: str | None) -> frozenset[str]:
+    terms = set()
+    for field in fields:
+        if field:
+            normalized = _normalize(field)
+            terms.add(normalized)
+            terms.update(normalized.split())
+    terms.discard("")
+    return frozenset(terms)
+
+
+def _trigrams(term: str) -> set[str]:
+    # Padding the start gives the first letters the most weight
+    padded = f"  {term}"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _prefix_score(query: str, term: str) -> float:
+    if query == term:
+        return EXACT_SCORE
+    return PREFIX_SCORE + 0.4 * len(query) / len(term)
+
+
+class _IssueKeys:
+    """The issue numbers under one key prefix, ascending, with their ids"""
+
+    __slots__ = ("prefix", "numbers", "ids")
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.numbers = array("q")
+        self.ids = array("q")
+
+    def add(self, number: int, issue_id: int) -> None:
+        index = bisect_left(self.numbers, number)
+        if index < len(self.numbers) and self.numbers[index] == number:
+            self.ids[index] = issue_id
+        else:
+            self.numbers.insert(index, number)
+            self.ids.insert(index, issue_id)
+
+    def discard(self, number: int, issue_id: int) -> None:
+        index = bisect_left(self.numbers, number)
+        # The number may have been taken over by another issue since
+        if index < len(self.numbers) and self.ids[index] == issue_id:
+            del self.numbers[index]
+            del self.ids[index]
+
+    def matching(self, digits: str, limit: int) -> list[tuple[int, int]]:
+        """
+        (number, issue id) of keys whose number starts with digits, shortest
+        first; with no digits, the newest issues.
+        """
+        numbers, ids = self.numbers, self.ids
+        if not digits:
+            start = max(len(numbers) - limit, 0)
+            return [(numbers[i], ids[i]) for i in reversed(range(start, len(numbers)))]
+        if digits.startswith("0") or not numbers:
+            return []
+        matches: list[tuple[int, int]] = []
+        low, width = int(digits), 1
+        while low <= numbers[-1] and len(matches) < limit:
+            start = bisect_left(numbers, low)
+            end = min(bisect_left(numbers, low + width), start + limit - len(matches))
+            matches.extend((numbers[i], ids[i]) for i in range(start, end))
+            low, width = low * 10, width * 10
+        return matches
+
+
+class TypeaheadIndex:
+    def __init__(self, bind: Engine):
+        self._bind = bind
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._entries: dict[tuple[str, int], _Entry] = {}
+        self._owners: dict[str, set[tuple[str, int]]] = {}
+        self._terms: list[str] = []
+        self._trigrams: dict[str, set[str]] = {}
+        self._issue_keys: dict[str, _IssueKeys] = {}
+        # Where each issue's number is kept, so deletes need no search
+        self._issue_numbers: dict[int, tuple[_IssueKeys, int]] = {}
+
+    def load(self) -> None:
+        """Read every user, project and issue key, unless already loaded"""
+        with self._lock:
+            if self._loaded:
+                return
+            with self._bind.connect() as conn:
+                for entity, statement in _NAME_ROWS.items():
+                    for row in conn.execute(statement):
+                        self._add_entry(entity, *row)
+                keys = None
+                rows = conn.execute(
+                    select(Issue.id, Issue.number, Issue.issue_key).order_by(
+                        Issue.project_id, Issue.number
+                    )
+                )
+                for issue_id, number, issue_key in rows:
+                    prefix = issue_key.rpartition("-")[0]
+                    if keys is None or keys.prefix != prefix:
+                        keys = self._keys_of(prefix)
+                    # Rows arrive in number order, so appending keeps it
+                    keys.numbers.append(number)
+                    keys.ids.append(issue_id)
+                    self._issue_numbers[issue_id] = (keys, number)
+            self._terms = sorted(self._owners)
+            self._loaded = True
+
+    def suggest(self, q: str, types: tuple[str, ...], limit: int) -> list[Suggestion]:
+        """The best limit matches of q among the given types, best first"""
+        query = _normalize(q)
+        if not query:
+            return []
+        with self._lock:
+            scores: dict[tuple[str, int], float] = {}
+            if USER in types or PROJECT in types:
+                self._match_names(query, types, limit, scores)
+            best = heapq.nsmallest(
+                limit,
+                scores.items(),
+                key=lambda item: (
+                    -item[1],
+                    SUGGEST_TYPES.index(item[0][0]),
+                    self._entries[item[0]].label.casefold(),
+                ),
+            )
+            suggestions = [
+                Suggestion(
+                    type=entity,
+                    id=row_id,
+                    label=self._entries[entity, row_id].label,
+                    detail=self._entries[entity, row_id].detail,
+                    score=score,
+                )
+                for (entity, row_id), score in best
+            ]
+            if ISSUE in types:
+                suggestions += self._match_issue_keys(query, limit)
+        # Stable, so ties keep label order and issue keys keep number order
+        suggestions.sort(
+            key=lambda suggestion: (
+                -suggestion.score,
+                SUGGEST_TYPES.index(suggestion.type),
+            )
+        )
+        return suggestions[:limit]
+
+    def apply_changes(self, entity: str, changes: dict[int, str]) -> None:
+        with self._lock:
+            # Loading reads the current rows anyway
+            if not self._loaded:
+                return
+            with self._bind.connect() as conn:
+                if entity == ISSUE:
+                    self._apply_issue_changes(conn, changes)
+                else:
+                    self._apply_name_changes(conn, entity, changes)
+
+    def _apply_name_changes(self, conn, entity: str, changes: dict[int, str]) -> None:
+        for row_id in changes:
+            self._remove_entry(entity, row_id)
+        kept = [row_id for row_id, kind in changes.items() if kind != DELETED]
+        if kept:
+            statement = _NAME_ROWS[entity]
+            id_column = statement.selected_columns[0]
+            for row in conn.execute(statement.where(id_column.in_(kept))):
+                self._add_entry(entity, *row)
+
+    def _apply_issue_changes(self, conn, changes: dict[int, str]) -> None:
+        # Issue keys never change, so only creates and deletes matter
+        deleted = [issue_id for issue_id, kind in changes.items() if kind == DELETED]
+        for issue_id in deleted:
+            location = self._issue_numbers.pop(issue_id, None)
+            if location is not None:
+                keys, number = location
+                keys.discard(number, issue_id)
+        created = [issue_id for issue_id, kind in changes.items() if kind != DELETED]
+        if created:
+            rows = conn.execute(
+                select(Issue.id, Issue.number, Issue.issue_key).where(
+                    Issue.id.in_(created)
+                )
+            )
+            for issue_id, number, issue_key in rows:
+                keys = self._keys_of(issue_key.rpartition("-")[0])
+                keys.add(number, issue_id)
+                self._issue_numbers[issue_id] = (keys, number)
+
+    def _keys_of(self, prefix: str) -> _IssueKeys:
+        keys = self._issue_keys.get(prefix.casefold())
+        if keys is None:
+            keys = self._issue_keys[prefix.casefold()] = _IssueKeys(prefix)
+        return keys
+
+    def _add_entry(
+        self, entity: str, row_id: int, label: str, detail: str | None, *fields
+    ) -> None:
+        entry = _Entry(label, detail, _terms(label, detail, *fields))
+        self._entries[entity, row_id] = entry
+        for term in entry.terms:
+            owners = self._owners.get(term)
+            if owners is None:
+                owners = self._owners[term] = set()
+                for trigram in _trigrams(term):
+                    self._trigrams.setdefault(trigram, set()).add(term)
+                # While loading, the terms are sorted once at the end
+                if self._loaded:
+                    insort(self._terms, term)
+            owners.add((entity, row_id))
+
+    def _remove_entry(self, entity: str, row_id: int) -> None:
+        entry = self._entries.pop((entity, row_id), None)
+        if entry is None:
+            return
+        for term in entry.terms:
+            owners = self._owners[term]
+            owners.discard((entity, row_id))
+            if owners:
+                continue
+            del self._owners[term]
+            del self._terms[bisect_left(self._terms, term)]
+            for trigram in _trigrams(term):
+                terms = self._trigrams[trigram]
+                terms.discard(term)
+                if not terms:
+                    del self._trigrams[trigram]
+
+    def _match_names(
+        self,
+        query: str,
+        types: tuple[str, ...],
+        limit: int,
+        scores: dict[tuple[str, int], float],
+    ) -> None:
+        start = bisect_left(self._terms, query)
+        for term in self._terms[start : start + MAX_PREFIX_TERMS]:
+            if not term.startswith(query):
+                break
+            self._credit(term, _prefix_score(query, term), types, scores)
+
+        # Fuzzy matches only fill in behind the prefix matches
+        if len(query) < FUZZY_MIN_LENGTH or len(scores) >= limit:
+            return
+        trigrams = _trigrams(query)
+        shared: Counter[str] = Counter()
+        for trigram in trigrams:
+            shared.update(self._trigrams.get(trigram, ()))
+        for term, count in shared.items():
+            similarity = count / len(trigrams)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                self._credit(term, FUZZY_SCORE * similarity, types, scores)
+
+    def _credit(
+        self,
+        term: str,
+        score: float,
+        types: tuple[str, ...],
+        scores: dict[tuple[str, int], float],
+    ) -> None:
+        for owner in self._owners[term]:
+            if owner[0] in types and score > scores.get(owner, 0.0):
+                scores[owner] = score
+
+    def _match_issue_keys(self, query: str, limit: int) -> list[Suggestion]:
+        match = _ISSUE_KEY_RE.fullmatch(query)
+        if match is None:
+            return []
+        prefix, digits = match.groups()
+        keys = self._issue_keys.get(prefix)
+        if keys is None:
+            return []
+        suggestions = []
+        for number, issue_id in keys.matching(digits, limit):
+            key = f"{keys.prefix}-{number}"
+            suggestions.append(
+                Suggestion(
+                    type=ISSUE,
+                    id=issue_id,
+                    label=key,
+                    detail=None,
+                    score=_prefix_score(query, key.casefold()),
+                )
+            )
+        return suggestions
+
+
+# One index per engine, so separate databases never share suggestions
+_indexes: WeakKeyDictionary[Engine, TypeaheadIndex] = WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_typeahead(bind: Engine) -> TypeaheadIndex:
+    """The engine's typeahead index, loaded on first use"""
+    with _indexes_lock:
+        index = _indexes.get(bind)
+        if index is None:
+            index = _indexes[bind] = TypeaheadIndex(bind)
+    index.load()
+    return index
+
+
+def _follow_changes(entity: str):
+    def apply(bind, changes: dict[int, str]) -> None:
+        index = _indexes.get(bind)
+        if index is not None:
+            index.apply_changes(entity, changes)
+
+    return apply
+
+
+for _entity in SUGGEST_TYPES:
+    subscribe_changes(_entity)(_follow_changes(_entity))
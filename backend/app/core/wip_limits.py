@@ -0,0 +1,107 @@
+"""
+Work in progress limits of board columns.
+
+An issue moves into a column when its status changes to one the column
+shows from one it does not, or when it is created with a status the column
+shows (a move from no status). A move must not leave a column holding more
+issues than its wip_limit, on any board of the issue's project. Moves are
+checked after they are flushed: the count triggers have then updated the
+project's counters, and the transaction holds SQLite's write lock, so no
+concurrent move can slip in between the check and the commit. A move may
+override the limit, in which case it succeeds with a warning header.
+"""
+
+import json
+from collections import defaultdict
+from collections.abc import Iterable
+
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.board import Board, BoardColumn, BoardColumnStatus
+from app.models.issue import IssueStatus
+from app.models.issue_counts import issue_status_counts
+
+WIP_WARNING_HEADER = "X-WIP-Warning"
+WIP_OVERRIDE_DESCRIPTION = (
+    "Apply moves that take a column past its WIP limit; the columns are "
+    "then listed in the X-WIP-Warning header instead of failing with 409"
+)
+
+# (project_id, old status, new status) of one issue; old is None on create
+Move = tuple[int, IssueStatus | None, IssueStatus]
+
+
+def wip_limit_violations(db: Session, moves: Iterable[Move]) -> list[dict]:
+    """The limited columns that flushed moves took past their limit"""
+    entering = defaultdict(list)
+    for project_id, old, new in moves:
+        if old != new:
+            entering[project_id].append((old, new))
+    if not entering:
+        return []
+
+    rows = db.execute(
+        select(
+            Board.project_id,
+            Board.id,
+            BoardColumn.id,
+            BoardColumn.name,
+            BoardColumn.wip_limit,
+            BoardColumnStatus.status,
+        )
+        .join(BoardColumn, BoardColumn.board_id == Board.id)
+        .join(BoardColumnStatus, BoardColumnStatus.column_id == BoardColumn.id)
+        .where(Board.project_id.in_(entering), BoardColumn.wip_limit.is_not(None))
+        .order_by(Board.id, BoardColumn.position, BoardColumn.id)
+    )
+    columns: dict[int, tuple[int, dict, set[IssueStatus]]] = {}
+    for project_id, board_id, column_id, name, wip_limit, status in rows:
+        if column_id not in columns:
+            column = {
+                "board_id": board_id,
+                "column_id": column_id,
+                "column": name,
+                "wip_limit": wip_limit,
+            }
+            columns[column_id] = (project_id, column, set())
+        columns[column_id][2].add(status)
+
+    violations = []
+    counts: dict[int, dict[IssueStatus, int]] = {}
+    for project_id, column, statuses in columns.values():
+        if not any(
+            new in statuses and old not in statuses for old, new in entering[project_id]
+        ):
+            continue
+        if project_id not in counts:
+            counts[project_id] = issue_status_counts(db, project_id)
+        count = sum(counts[project_id][status] for status in statuses)
+        if count > column["wip_limit"]:
+            violations.append({**column, "count": count})
+    return violations
+
+
+def enforce_wip_limits(
+    db: Session, response: Response, moves: Iterable[Move], override: bool
+) -> None:
+    """
+    Reject flushed moves that take a column past its WIP limit with 409,
+    rolling them back, or with override let them through with a warning.
+    """
+    violations = wip_limit_violations(db, moves)
+    if not violations:
+        return
+    if override:
+        response.headers[WIP_WARNING_HEADER] = json.dumps(
+            violations, separators=(",", ":")
+        )
+        return
+    db.rollback()
+    columns = ", ".join(
+        f"'{v['column']}' ({v['count']}/{v['wip_limit']})" for v in violations
+    )
+    raise HTTPException(
+        status_code=409, detail=f"Move exceeds the WIP limit of {columns}"
+    )
@@ -1,15 +1,76 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the configured SQLite engine profile to a new connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT}")
+    cursor.execute(f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}")
+    cursor.close()
+
+
+def create_db_engine(database_url: str) -> Engine:
+    """
+    Create an engine using the connection pool and pragmas from settings.
+    File-based SQLite databases get a sized QueuePool and WAL journaling so
+    readers keep working while a writer commits.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+
+    if url.database in (None, "", ":memory:"):
+        # Each connection to an in-memory database is a separate database,
+        # so all sessions have to share a single connection
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(
+            url,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": settings.SQLITE_BUSY_TIMEOUT / 1000,
+            },
+            poolclass=QueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+engine = create_db_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def get_engine(db: Session) -> Engine:
+    """The engine behind a session, also when it is bound to a connection"""
+    bind = db.get_bind()
+    return bind if isinstance(bind, Engine) else bind.engine
+
+
 def get_db():
     """Dependency for getting database session"""
     db = SessionLocal()
@@ -1,20 +1,37 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.v1 import api_router
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.typeahead import get_typeahead
+from app.db.base import engine
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm in-memory indexes before serving requests"""
+    if settings.TYPEAHEAD_WARM_ON_STARTUP:
+        try:
+            get_typeahead(engine)
+        except SQLAlchemyError as e:
+            logger.warning("Typeahead index not loaded, retrying on first use: %s", e)
+    yield
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Configure CORS
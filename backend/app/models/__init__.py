@@ -3,10 +3,14 @@
 
 from app.db.base import Base
 
-from .board import Board, BoardColumn, BoardType
+from .board import Board, BoardColumn, BoardColumnStatus, BoardType
 from .issue import Comment, Issue, IssuePriority, IssueStatus, IssueType
+from .issue_counts import IssueStatusCount
+from .issue_history import IssueEvent
 from .notification import Notification, NotificationType
 from .project import Project, ProjectMember, ProjectRole
+from .saved_filter import SavedFilter
+from .search_index import issue_search
 from .sprint import Sprint, SprintStatus
 from .status import Status, StatusCategory
 from .user import User
@@ -24,6 +28,10 @@ __all__ = [
     "IssueType",
     "IssueStatus",
     "IssuePriority",
+    "IssueEvent",
+    "IssueStatusCount",
+    "SavedFilter",
+    "issue_search",
     "Sprint",
     "SprintStatus",
     "Status",
@@ -31,12 +39,10 @@ __all__ = [
     "Workflow",
     "WorkflowStatus",
     "WorkflowTransition",
-<<<<<<< HEAD
-=======
     "Notification",
     "NotificationType",
->>>>>>> 0d1b8a3f19b6ca0b3844335a4bcd48b3ae632223
     "Board",
     "BoardColumn",
+    "BoardColumnStatus",
     "BoardType",
 ]
@@ -8,6 +8,8 @@ from sqlalchemy.sql import func
 
 from app.db.base import Base
 
+from .issue import IssueStatus
+
 if TYPE_CHECKING:
     from .project import Project
 
@@ -37,13 +39,6 @@ class Board(Base):
 
     project: Mapped["Project"] = relationship("Project", back_populates="boards")
     columns: Mapped[list["BoardColumn"]] = relationship(
-<<<<<<< HEAD
-        "BoardColumn", back_populates="board", cascade="all, delete-orphan", order_by="BoardColumn.position"
-    )
-
-    def __repr__(self):
-        return f"<Board(id={self.id}, name='{self.name}', board_type='{self.board_type}')>"
-=======
         "BoardColumn",
         back_populates="board",
         cascade="all, delete-orphan",
@@ -54,7 +49,6 @@ class Board(Base):
         return (
             f"<Board(id={self.id}, name='{self.name}', board_type='{self.board_type}')>"
         )
->>>>>>> 0d1b8a3f19b6ca0b3844335a4bcd48b3ae632223
 
 
 class BoardColumn(Base):
@@ -64,6 +58,8 @@ class BoardColumn(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Most issues the column should hold at once; None is no limit
+    wip_limit: Mapped[int | None] = mapped_column(Integer)
     board_id: Mapped[int] = mapped_column(ForeignKey("boards.id"), nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -74,10 +70,37 @@ class BoardColumn(Base):
     )
 
     board: Mapped["Board"] = relationship("Board", back_populates="columns")
+    status_mappings: Mapped[list["BoardColumnStatus"]] = relationship(
+        "BoardColumnStatus",
+        back_populates="column",
+        cascade="all, delete-orphan",
+    )
+
+    @property
+    def statuses(self) -> list[IssueStatus]:
+        """The issue statuses shown in this column"""
+        return sorted(
+            (mapping.status for mapping in self.status_mappings),
+            key=list(IssueStatus).index,
+        )
 
     def __repr__(self):
         return f"<BoardColumn(id={self.id}, name='{self.name}', board_id={self.board_id}, position={self.position})>"
-<<<<<<< HEAD
 
-=======
->>>>>>> 0d1b8a3f19b6ca0b3844335a4bcd48b3ae632223
+
+class BoardColumnStatus(Base):
+    """An issue status shown in a board column; a status may map to several"""
+
+    __tablename__ = "board_column_statuses"
+
+    column_id: Mapped[int] = mapped_column(
+        ForeignKey("board_columns.id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[IssueStatus] = mapped_column(Enum(IssueStatus), primary_key=True)
+
+    column: Mapped["BoardColumn"] = relationship(
+        "BoardColumn", back_populates="status_mappings"
+    )
+
+    def __repr__(self):
+        return f"<BoardColumnStatus(column_id={self.column_id}, status={self.status})>"
@@ -6,16 +6,24 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
+    Integer,
     String,
     Text,
+    event,
+    select,
+    text,
+    update,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from app.core.lexorank import next_ranks
 from app.db.base import Base
 
+from .project import Project
+
 if TYPE_CHECKING:
-    from .project import Project
     from .sprint import Sprint
     from .user import User
 
@@ -43,10 +51,39 @@ class IssuePriority(str, enum.Enum):
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_created_at", "created_at"),
+        Index("ix_issues_project_id_created_at", "project_id", "created_at"),
+        # Board columns: newest issues of one status in a project
+        Index(
+            "ix_issues_project_id_status_created_at",
+            "project_id",
+            "status",
+            "created_at",
+        ),
+        Index("ix_issues_assignee_id_created_at", "assignee_id", "created_at"),
+        Index("ix_issues_reporter_id_created_at", "reporter_id", "created_at"),
+        Index("ix_issues_sprint_id_created_at", "sprint_id", "created_at"),
+        Index("ix_issues_sprint_id_status", "sprint_id", "status"),
+        Index("ix_issues_status_created_at", "status", "created_at"),
+        Index("ix_issues_parent_issue_id", "parent_issue_id"),
+        # Manual order of a project's backlog and of each sprint
+        Index("ix_issues_project_id_rank", "project_id", "rank"),
+        Index("ix_issues_sprint_id_rank", "sprint_id", "rank"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Sequential number within the project and the stored "PROJ-12" key,
+    # both allocated from Project.issue_seq when the row is inserted
+    number: Mapped[int] = mapped_column(Integer, nullable=False)
+    issue_key: Mapped[str] = mapped_column(
+        String(30), unique=True, index=True, nullable=False
+    )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
+    # Position in the project's manual order (see app.core.lexorank); new
+    # issues are ranked last when they are flushed
+    rank: Mapped[str] = mapped_column(String(64), nullable=False)
 
     status: Mapped[IssueStatus] = mapped_column(
         Enum(IssueStatus), default=IssueStatus.TO_DO, nullable=False
@@ -64,6 +101,15 @@ class Issue(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    # Bumped by every UPDATE, including set-based ones, so that together with
+    # updated_at (one-second resolution) it identifies a row state for ETags
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        onupdate=text("version + 1"),
+        nullable=False,
+    )
 
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
     reporter_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -98,8 +144,66 @@ class Issue(Base):
         return f"<Issue(id={self.id}, title='{self.title}', status='{self.status}')>"
 
 
+def allocate_issue_numbers(connection, project_id: int, count: int = 1):
+    """
+    Reserve the next count issue numbers of a project.
+    Returns the project key and the first reserved number. The increment runs
+    in the caller's transaction, so concurrent inserts never share a number.
+    """
+    project_key, last_number = connection.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(issue_seq=Project.issue_seq + count)
+        .returning(Project.key, Project.issue_seq)
+    ).one()
+    return project_key, last_number - count + 1
+
+
+@event.listens_for(Issue, "before_insert")
+def _assign_issue_key(mapper, connection, target: Issue):
+    """Give every new issue the next number and key of its project"""
+    if target.issue_key is not None:
+        return
+    project_key, number = allocate_issue_numbers(connection, target.project_id)
+    target.number = number
+    target.issue_key = f"{project_key}-{number}"
+
+
+def allocate_issue_ranks(connection, project_id: int, count: int = 1) -> list[str]:
+    """Ranks for count new issues, after the last ranked issue of a project"""
+    last = connection.execute(
+        select(Issue.rank)
+        .where(Issue.project_id == project_id)
+        .order_by(Issue.rank.desc())
+        .limit(1)
+    ).scalar()
+    return next_ranks(last, count)
+
+
+@event.listens_for(Session, "before_flush")
+def _rank_new_issues(session, flush_context, instances):
+    """
+    Rank new issues last in their project. This runs once per flush rather
+    than per row, so issues flushed together get distinct ranks.
+    """
+    unranked = {}
+    for obj in session.new:
+        if isinstance(obj, Issue) and obj.rank is None and obj.project_id is not None:
+            unranked.setdefault(obj.project_id, []).append(obj)
+    if not unranked:
+        return
+    connection = session.connection()
+    for project_id, issues in unranked.items():
+        ranks = allocate_issue_ranks(connection, project_id, len(issues))
+        for issue, rank in zip(issues, ranks, strict=True):
+            issue.rank = rank
+
+
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_issue_id_created_at", "issue_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     body: Mapped[str] = mapped_column(Text, nullable=False)
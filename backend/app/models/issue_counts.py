@@ -0,0 +1,101 @@
+"""
+Per-project issue counts by status, for board headers and WIP limits.
+
+Triggers keep issue_status_counts in step with every write path, including
+Core bulk inserts and updates that bypass ORM events: an insert counts the
+issue in, a delete counts it out, and a change of status or project moves
+it from one count to the other. Reading a project's counts is then a
+primary key range lookup of at most one row per status, instead of a
+COUNT(*) over its issues. As with the search index, the same DDL runs from
+create_all (tests, fresh databases) and from the migration that adds the
+table.
+"""
+
+from sqlalchemy import DDL, Enum, ForeignKey, Integer, event, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+from .issue import IssueStatus
+
+
+class IssueStatusCount(Base):
+    """The number of a project's issues in one status"""
+
+    __tablename__ = "issue_status_counts"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[IssueStatus] = mapped_column(Enum(IssueStatus), primary_key=True)
+    issue_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<IssueStatusCount(project_id={self.project_id}, "
+            f"status={self.status}, issue_count={self.issue_count})>"
+        )
+
+
+def issue_status_counts(connection, project_id: int) -> dict[IssueStatus, int]:
+    """A project's issue count for every status, zero included"""
+    counts = dict.fromkeys(IssueStatus, 0)
+    rows = connection.execute(
+        select(IssueStatusCount.status, IssueStatusCount.issue_count).where(
+            IssueStatusCount.project_id == project_id
+        )
+    )
+    for status, count in rows:
+        counts[status] = count
+    return counts
+
+
+_COUNT_IN = """
+    INSERT INTO issue_status_counts (project_id, status, issue_count)
+    VALUES (new.project_id, new.status, 1)
+    ON CONFLICT (project_id, status) DO UPDATE SET issue_count = issue_count + 1;
+"""
+_COUNT_OUT = """
+    UPDATE issue_status_counts SET issue_count = issue_count - 1
+    WHERE project_id = old.project_id AND status = old.status;
+"""
+
+CREATE_STATEMENTS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS issues_count_insert AFTER INSERT ON issues
+    BEGIN {_COUNT_IN} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS issues_count_update
+    AFTER UPDATE OF status, project_id ON issues
+    WHEN old.status IS NOT new.status OR old.project_id IS NOT new.project_id
+    BEGIN {_COUNT_OUT} {_COUNT_IN} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS issues_count_delete AFTER DELETE ON issues
+    BEGIN {_COUNT_OUT} END
+    """,
+    # Foreign keys are not enforced, so the cascade is a trigger too
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_count_delete AFTER DELETE ON projects
+    BEGIN
+        DELETE FROM issue_status_counts WHERE project_id = old.id;
+    END
+    """,
+)
+
+DROP_STATEMENTS = (
+    "DROP TRIGGER IF EXISTS projects_count_delete",
+    "DROP TRIGGER IF EXISTS issues_count_delete",
+    "DROP TRIGGER IF EXISTS issues_count_update",
+    "DROP TRIGGER IF EXISTS issues_count_insert",
+)
+
+for _statement in CREATE_STATEMENTS:
+    event.listen(
+        Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+for _statement in DROP_STATEMENTS:
+    event.listen(
+        Base.metadata, "before_drop", DDL(_statement).execute_if(dialect="sqlite")
+    )
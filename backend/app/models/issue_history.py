@@ -0,0 +1,126 @@
+import enum
+import json
+from datetime import datetime
+
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Text, event, insert, inspect
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+from .issue import Issue
+
+# Issue fields whose changes are written to the history
+TRACKED_FIELDS = (
+    "title",
+    "description",
+    "status",
+    "priority",
+    "issue_type",
+    "assignee_id",
+    "sprint_id",
+    "parent_issue_id",
+)
+
+_PENDING_EVENTS_KEY = "pending_issue_events"
+
+
+class IssueEvent(Base):
+    """
+    One append-only history entry per issue mutation.
+    changes holds every changed field as compact JSON: {"field": [old, new]}.
+    """
+
+    __tablename__ = "issue_events"
+    __table_args__ = (Index("ix_issue_events_issue_id_ts", "issue_id", "ts"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    issue_id: Mapped[int] = mapped_column(
+        ForeignKey("issues.id", ondelete="CASCADE"), nullable=False
+    )
+    ts: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    changes: Mapped[str] = mapped_column(Text, nullable=False)
+
+    def __repr__(self):
+        return f"<IssueEvent(id={self.id}, issue_id={self.issue_id})>"
+
+
+# Foreign keys are not enforced, so the cascade to an issue's history is a
+# trigger; otherwise a reused issue id would inherit the deleted one's events
+CREATE_STATEMENT = """
+    CREATE TRIGGER IF NOT EXISTS issues_events_delete AFTER DELETE ON issues
+    BEGIN
+        DELETE FROM issue_events WHERE issue_id = old.id;
+    END
+"""
+DROP_STATEMENT = "DROP TRIGGER IF EXISTS issues_events_delete"
+
+event.listen(
+    Base.metadata, "after_create", DDL(CREATE_STATEMENT).execute_if(dialect="sqlite")
+)
+event.listen(
+    Base.metadata, "before_drop", DDL(DROP_STATEMENT).execute_if(dialect="sqlite")
+)
+
+
+def _plain(value):
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def encode_changes(changes: dict) -> str:
+    """Encode {field: (old, new)} into the stored JSON form"""
+    return json.dumps(
+        {field: [_plain(old), _plain(new)] for field, (old, new) in changes.items()},
+        separators=(",", ":"),
+    )
+
+
+def decode_changes(raw: str) -> list[dict]:
+    """Decode stored changes into one dict per changed field"""
+    return [
+        {"field": field, "old_value": old, "new_value": new}
+        for field, (old, new) in json.loads(raw).items()
+    ]
+
+
+def record_issue_events(connection, events: list[tuple[int, dict]]) -> None:
+    """Append (issue_id, {field: (old, new)}) events with a single executemany"""
+    if events:
+        connection.execute(
+            insert(IssueEvent.__table__),
+            [
+                {"issue_id": issue_id, "changes": encode_changes(changes)}
+                for issue_id, changes in events
+            ],
+        )
+
+
+@event.listens_for(Session, "before_flush")
+def _buffer_issue_changes(session, flush_context, instances):
+    """Collect the tracked field changes of every modified issue"""
+    pending = session.info.setdefault(_PENDING_EVENTS_KEY, [])
+    for obj in session.dirty:
+        if not isinstance(obj, Issue):
+            continue
+        attrs = inspect(obj).attrs
+        changes = {}
+        for field in TRACKED_FIELDS:
+            history = attrs[field].history
+            if not history.has_changes():
+                continue
+            old = history.deleted[0] if history.deleted else None
+            new = history.added[0] if history.added else None
+            if old != new:
+                changes[field] = (old, new)
+        if changes:
+            pending.append((obj.id, changes))
+
+
+@event.listens_for(Session, "after_flush")
+def _write_issue_changes(session, flush_context):
+    """Write buffered history in the same transaction as the flush"""
+    pending = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if pending:
+        record_issue_events(session.connection(), pending)
@@ -1,7 +1,7 @@
 import enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, String, Text
+from sqlalchemy import Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -44,6 +44,10 @@ class Project(Base):
         String(10), unique=True, index=True, nullable=False
     )
     description: Mapped[str | None] = mapped_column(Text)
+    # Last issue number handed out in this project, see Issue.number
+    issue_seq: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
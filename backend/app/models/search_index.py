@@ -0,0 +1,113 @@
+"""
+The issue_search FTS5 index over issue titles, descriptions and comments.
+
+One row per issue, keyed by rowid = issues.id; the comments column holds
+the issue's comment bodies concatenated. Triggers keep it in sync with
+every write path, including Core bulk inserts that bypass ORM events. The
+same DDL runs from create_all (tests, fresh databases) and from the
+migration that adds the index.
+"""
+
+from sqlalchemy import DDL, column, event, table
+
+from app.db.base import Base
+
+SEARCH_TABLE = "issue_search"
+
+# FTS5 keeps its data in shadow tables that migrations must leave alone
+SEARCH_TABLE_NAMES = frozenset(
+    [SEARCH_TABLE]
+    + [
+        f"{SEARCH_TABLE}_{suffix}"
+        for suffix in ("data", "idx", "content", "docsize", "config")
+    ]
+)
+
+issue_search = table(
+    SEARCH_TABLE,
+    column("rowid"),
+    column("title"),
+    column("description"),
+    column("comments"),
+)
+
+_COMMENTS_OF = (
+    "(SELECT coalesce(group_concat(body, ' '), '') FROM comments "
+    "WHERE issue_id = {ref}.issue_id)"
+)
+
+CREATE_STATEMENTS = (
+    # Prefix indexes make 2 and 3 character prefix queries index lookups
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        title, description, comments,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS issues_search_insert AFTER INSERT ON issues
+    BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, title, description, comments)
+        VALUES (new.id, new.title, coalesce(new.description, ''), '');
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS issues_search_update
+    AFTER UPDATE OF title, description ON issues
+    BEGIN
+        UPDATE {SEARCH_TABLE}
+        SET title = new.title, description = coalesce(new.description, '')
+        WHERE rowid = new.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS issues_search_delete AFTER DELETE ON issues
+    BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS comments_search_insert AFTER INSERT ON comments
+    BEGIN
+        UPDATE {SEARCH_TABLE} SET comments = {_COMMENTS_OF.format(ref="new")}
+        WHERE rowid = new.issue_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS comments_search_update
+    AFTER UPDATE OF body, issue_id ON comments
+    BEGIN
+        UPDATE {SEARCH_TABLE} SET comments = {_COMMENTS_OF.format(ref="old")}
+        WHERE rowid = old.issue_id;
+        UPDATE {SEARCH_TABLE} SET comments = {_COMMENTS_OF.format(ref="new")}
+        WHERE rowid = new.issue_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS comments_search_delete AFTER DELETE ON comments
+    BEGIN
+        UPDATE {SEARCH_TABLE} SET comments = {_COMMENTS_OF.format(ref="old")}
+        WHERE rowid = old.issue_id;
+    END
+    """,
+)
+
+DROP_STATEMENTS = (
+    "DROP TRIGGER IF EXISTS comments_search_delete",
+    "DROP TRIGGER IF EXISTS comments_search_update",
+    "DROP TRIGGER IF EXISTS comments_search_insert",
+    "DROP TRIGGER IF EXISTS issues_search_delete",
+    "DROP TRIGGER IF EXISTS issues_search_update",
+    "DROP TRIGGER IF EXISTS issues_search_insert",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+)
+
+for _statement in CREATE_STATEMENTS:
+    event.listen(
+        Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+for _statement in DROP_STATEMENTS:
+    event.listen(
+        Base.metadata, "before_drop", DDL(_statement).execute_if(dialect="sqlite")
+    )
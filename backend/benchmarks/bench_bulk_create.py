@@ -0,0 +1,138 @@
+"""
+Bulk issue creation benchmark.
+
+Imports the same backlog twice into a fresh SQLite database: once through
+``POST /issues/`` with one request per issue, and once through
+``POST /issues/bulk`` as a single JSON array and as an NDJSON body. Reports
+wall time, throughput and the number of SQL statements each path ran.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_bulk_create --issues 20000
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="scrumflow-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.db.base import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Project, User  # noqa: E402
+
+
+def seed() -> None:
+    """Create the schema with a user and one project per import path"""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "username": "bench",
+                    "email": "bench@example.com",
+                    "hashed_password": "x",
+                }
+            ],
+        )
+        conn.execute(
+            insert(Project),
+            [
+                {"name": "Single", "key": "SINGLE", "owner_id": 1},
+                {"name": "Array", "key": "ARRAY", "owner_id": 1},
+                {"name": "NDJSON", "key": "NDJSON", "owner_id": 1},
+            ],
+        )
+
+
+def backlog(project_id: int, issue_count: int) -> list[dict]:
+    return [
+        {
+            "title": f"Imported issue {i}",
+            "description": f"Imported from the legacy tracker, item {i}",
+            "issue_type": "TASK",
+            "priority": "MEDIUM",
+            "project_id": project_id,
+            "reporter_id": 1,
+            "assignee_id": 1 if i % 2 else None,
+        }
+        for i in range(issue_count)
+    ]
+
+
+class StatementCounter:
+    """Count the statements sent to the database while active"""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+def run_single(client: TestClient, items: list[dict]) -> None:
+    for item in items:
+        client.post("/api/v1/issues/", json=item).raise_for_status()
+
+
+def run_array(client: TestClient, items: list[dict]) -> None:
+    response = client.post("/api/v1/issues/bulk", json=items)
+    response.raise_for_status()
+    assert response.json()["failed"] == 0
+
+
+def run_ndjson(client: TestClient, items: list[dict]) -> None:
+    body = "".join(json.dumps(item) + "\n" for item in items)
+    response = client.post(
+        "/api/v1/issues/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    response.raise_for_status()
+    assert response.json()["failed"] == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--issues", type=int, default=20_000)
+    args = parser.parse_args()
+
+    # The test client logs every request, which would dominate the single path
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    seed()
+    client = TestClient(app)
+    paths = [
+        ("single", run_single, 1),
+        ("bulk array", run_array, 2),
+        ("bulk ndjson", run_ndjson, 3),
+    ]
+    for label, run, project_id in paths:
+        items = backlog(project_id, args.issues)
+        with StatementCounter() as statements:
+            start = time.perf_counter()
+            run(client, items)
+            elapsed = time.perf_counter() - start
+        print(
+            f"{label:>12}: {elapsed:8.2f}s "
+            f"{args.issues / elapsed:10.0f} issues/s "
+            f"{statements.count:8} statements"
+        )
+
+
+if __name__ == "__main__":
+    main()
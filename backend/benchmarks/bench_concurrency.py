@@ -0,0 +1,186 @@
+"""
+Concurrency benchmark for the issue/board/sprint/search/notification routers.
+
+Runs a mixed load of slow list/search requests and fast single-issue reads
+against a seeded SQLite database and reports latency percentiles for the
+fast requests. The "blocking" mode wraps every endpoint in an ``async def``
+that calls it directly, which is how the routers used to run: each
+synchronous query then blocks the event loop for every other request.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_concurrency --issues 50000 --requests 400
+"""
+
+import argparse
+import asyncio
+import functools
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+_tmpdir = tempfile.mkdtemp(prefix="scrumflow-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.api.v1 import api_router  # noqa: E402
+from app.db.base import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Board, Issue, Project, Sprint, User  # noqa: E402
+
+
+def seed(issue_count: int) -> None:
+    """Create the schema and fill it with one project worth of issues"""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "username": "bench",
+                    "email": "bench@example.com",
+                    "hashed_password": "x",
+                }
+            ],
+        )
+        conn.execute(
+            insert(Project),
+            [
+                {
+                    "name": "Bench",
+                    "key": "BENCH",
+                    "owner_id": 1,
+                    "issue_seq": issue_count,
+                }
+            ],
+        )
+        conn.execute(
+            insert(Sprint),
+            [
+                {
+                    "name": "Sprint 1",
+                    "project_id": 1,
+                    "start_date": datetime(2025, 1, 1),
+                    "end_date": datetime(2025, 1, 15),
+                }
+            ],
+        )
+        conn.execute(insert(Board), [{"name": "Board", "project_id": 1}])
+        conn.execute(
+            insert(Issue),
+            [
+                {
+                    "number": i + 1,
+                    "issue_key": f"BENCH-{i + 1}",
+                    "rank": f"{i + 1:07d}i",
+                    "title": f"Issue {i}",
+                    "description": f"Benchmark issue number {i} " * 8,
+                    "project_id": 1,
+                    "reporter_id": 1,
+                    "sprint_id": 1 if i % 3 == 0 else None,
+                }
+                for i in range(issue_count)
+            ],
+        )
+
+
+def _as_blocking(endpoint):
+    """Wrap a sync endpoint so FastAPI runs it on the event loop"""
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        return endpoint(*args, **kwargs)
+
+    return wrapper
+
+
+def build_blocking_app() -> FastAPI:
+    """Rebuild the API with every endpoint running on the event loop"""
+    blocking_app = FastAPI()
+    for route in api_router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        blocking_app.add_api_route(
+            f"/api/v1{route.path}",
+            _as_blocking(route.endpoint),
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+        )
+    return blocking_app
+
+
+async def run_load(
+    target: FastAPI, total_requests: int, concurrency: int
+) -> dict[str, list[float]]:
+    """Fire a mixed workload and collect per-kind latencies in milliseconds"""
+    slow_paths = [
+        "/api/v1/issues/?search=number%209999&limit=100",
+        "/api/v1/boards/1/issues?limit=100",
+        "/api/v1/sprints/1/stats",
+        "/api/v1/search/issues?q=number%2042",
+    ]
+    latencies: dict[str, list[float]] = {"fast": [], "slow": []}
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=target)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(i: int) -> None:
+            if i % 4 == 0:
+                kind, path = "slow", slow_paths[(i // 4) % len(slow_paths)]
+            else:
+                kind, path = "fast", f"/api/v1/issues/{i % 100 + 1}"
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies[kind].append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+        await asyncio.gather(*(one(i) for i in range(total_requests)))
+
+    return latencies
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def report(label: str, latencies: dict[str, list[float]]) -> None:
+    for kind, values in latencies.items():
+        print(
+            f"{label:>10} {kind:>5}: n={len(values):<5} "
+            f"p50={statistics.median(values):8.2f}ms "
+            f"p99={_percentile(values, 99):8.2f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--issues", type=int, default=50_000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    seed(args.issues)
+    threadpool = asyncio.run(run_load(app, args.requests, args.concurrency))
+    blocking = asyncio.run(
+        run_load(build_blocking_app(), args.requests, args.concurrency)
+    )
+
+    report("blocking", blocking)
+    report("threadpool", threadpool)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Full-text search benchmark.
+
+Seeds a fresh SQLite database with synthetic issues whose words follow a
+Zipf distribution, then runs the same searches two ways: the previous
+``ilike('%q%')`` filter on title and description, and the FTS5 index with
+bm25 ranking used by ``/search/issues``, plus the unranked index lookup
+behind ``get_issues?search=``. Reports the median latency of one 20-row
+page for rare, common and prefix queries.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_fulltext_search --issues 1000000
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="scrumflow-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from sqlalchemy import insert, or_  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.api.v1.search import _ranked_issues  # noqa: E402
+from app.core.fulltext import matching_issues  # noqa: E402
+from app.db.base import Base, engine  # noqa: E402
+from app.models import Issue, Project, User  # noqa: E402
+
+SYLLABLES = "ka lo mi ne ru sa ti vo ze qua dri pe bu fa go hy".split()
+VOCABULARY_SIZE = 20_000
+BATCH_SIZE = 10_000
+PAGE_SIZE = 20
+
+
+def vocabulary(rng: random.Random) -> list[str]:
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    # Sort first: set order depends on string hashing, which varies per run
+    words = sorted(words)
+    rng.shuffle(words)
+    return words
+
+
+def seed(issue_count: int, words: list[str], rng: random.Random) -> None:
+    """Create the schema and insert issues; triggers fill the FTS index"""
+    Base.metadata.create_all(bind=engine)
+    cum_weights = list(
+        itertools.accumulate(1 / rank for rank in range(1, len(words) + 1))
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "username": "bench",
+                    "email": "bench@example.com",
+                    "hashed_password": "x",
+                }
+            ],
+        )
+        conn.execute(
+            insert(Project), [{"name": "Bench", "key": "BENCH", "owner_id": 1}]
+        )
+
+    for start in range(0, issue_count, BATCH_SIZE):
+        count = min(BATCH_SIZE, issue_count - start)
+        rows = []
+        for offset in range(count):
+            number = start + offset + 1
+            rows.append(
+                {
+                    "number": number,
+                    "issue_key": f"BENCH-{number}",
+                    "rank": f"{number:07d}i",
+                    "title": " ".join(rng.choices(words, cum_weights=cum_weights, k=6)),
+                    "description": " ".join(
+                        rng.choices(words, cum_weights=cum_weights, k=30)
+                    ),
+                    "status": "TO_DO",
+                    "priority": "MEDIUM",
+                    "issue_type": "TASK",
+                    "project_id": 1,
+                    "reporter_id": 1,
+                }
+            )
+        with engine.begin() as conn:
+            conn.execute(insert(Issue.__table__), rows)
+
+
+def like_page(db: Session, q: str) -> list:
+    """The search path before the FTS index"""
+    return (
+        db.query(Issue)
+        .filter(or_(Issue.title.ilike(f"%{q}%"), Issue.description.ilike(f"%{q}%")))
+        .limit(PAGE_SIZE)
+        .all()
+    )
+
+
+def fts_filter_page(db: Session, q: str) -> list:
+    """The unranked index lookup used by the search parameter of get_issues"""
+    return db.query(Issue).filter(matching_issues(q)).limit(PAGE_SIZE).all()
+
+
+def fts_ranked_page(db: Session, q: str) -> list:
+    """The bm25-ranked path of /search/issues; every match has to be scored"""
+    return _ranked_issues(db, q).limit(PAGE_SIZE).all()
+
+
+def median_ms(run, db: Session, q: str, repeats: int) -> tuple[float, int]:
+    timings = []
+    for _ in range(repeats):
+        db.expunge_all()
+        start = time.perf_counter()
+        rows = run(db, q)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--issues", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    words = vocabulary(rng)
+    start = time.perf_counter()
+    seed(args.issues, words, rng)
+    print(
+        f"seeded {args.issues} issues in {time.perf_counter() - start:.1f}s",
+        flush=True,
+    )
+
+    queries = [
+        ("common word", words[0]),
+        ("mid word", words[500]),
+        ("rare word", words[-1]),
+        ("two words", f"{words[3]} {words[40]}"),
+        ("prefix", words[100][:4]),
+        ("no match", "xyzzy"),
+    ]
+    with Session(engine) as db:
+        for label, q in queries:
+            like_ms, rows = median_ms(like_page, db, q, args.repeats)
+            filter_ms, _ = median_ms(fts_filter_page, db, q, args.repeats)
+            ranked_ms, _ = median_ms(fts_ranked_page, db, q, args.repeats)
+            print(
+                f"{label:>12} {q!r:>20} ({rows:2} rows): like {like_ms:8.1f}ms"
+                f"  fts {filter_ms:8.1f}ms  fts ranked {ranked_ms:8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Backlog reordering benchmark.
+
+Seeds a fresh SQLite database with one project whose backlog holds the
+given number of issues, then drags random issues to random places through
+``PATCH /issues/{id}/rank``, half of them into the same spot near the top
+to force ranks to grow. Reports the median and 99th percentile latency per
+move, the issue rows written per move including the rebalances that the
+growing ranks set off, and the longest rank seen.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_rank --issues 10000 --moves 1000
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="scrumflow-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, insert, select  # noqa: E402
+
+from app.core.lexorank import spaced_ranks  # noqa: E402
+from app.db.base import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Issue, Project, User  # noqa: E402
+
+
+def seed(issue_count: int) -> None:
+    """Create the schema with one user, one project and its backlog"""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "username": "bench",
+                    "email": "bench@example.com",
+                    "hashed_password": "x",
+                }
+            ],
+        )
+        conn.execute(
+            insert(Project), [{"name": "Bench", "key": "BENCH", "owner_id": 1}]
+        )
+        conn.execute(
+            insert(Issue.__table__),
+            [
+                {
+                    "number": i + 1,
+                    "issue_key": f"BENCH-{i + 1}",
+                    "rank": rank,
+                    "title": f"Backlog item {i}",
+                    "status": "TO_DO",
+                    "priority": "MEDIUM",
+                    "issue_type": "TASK",
+                    "project_id": 1,
+                    "reporter_id": 1,
+                }
+                for i, rank in enumerate(spaced_ranks(issue_count))
+            ],
+        )
+
+
+class RowCounter:
+    """Count the issue rows written by UPDATE statements while active"""
+
+    def __init__(self) -> None:
+        self.rows = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("UPDATE ISSUES"):
+            self.rows += len(parameters) if many else 1
+
+    def __enter__(self) -> "RowCounter":
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--issues", type=int, default=10_000)
+    parser.add_argument("--moves", type=int, default=1_000)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    rng = random.Random(42)
+    seed(args.issues)
+    client = TestClient(app)
+
+    timings = []
+    longest = 0
+    with RowCounter() as written:
+        for move in range(args.moves):
+            with engine.connect() as conn:
+                ranked = conn.scalars(
+                    select(Issue.id).order_by(Issue.rank, Issue.id)
+                ).all()
+            # Every other move lands right below the first issue
+            position = 1 if move % 2 else rng.randrange(1, len(ranked))
+            after_id, before_id = ranked[position - 1], ranked[position]
+            moved = rng.choice(ranked)
+            if moved in (after_id, before_id):
+                continue
+            start = time.perf_counter()
+            response = client.patch(
+                f"/api/v1/issues/{moved}/rank",
+                json={"after_id": after_id, "before_id": before_id},
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+            longest = max(longest, len(response.json()["rank"]))
+
+    timings.sort()
+    print(f"{len(timings)} moves in a backlog of {args.issues}")
+    print(
+        f"  per move  median {statistics.median(timings):7.3f}ms  "
+        f"p99 {timings[int(len(timings) * 0.99)]:7.3f}ms"
+    )
+    print(
+        f"  rows written per move (rebalances included) {written.rows / len(timings):.2f}"
+    )
+    print(f"  longest rank {longest}")
+
+
+if __name__ == "__main__":
+    main()
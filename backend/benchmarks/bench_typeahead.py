@@ -0,0 +1,160 @@
+"""
+Typeahead benchmark.
+
+Seeds a fresh SQLite database with synthetic users, projects and issues,
+then answers the same keystrokes two ways: the ``ilike('%q%')`` scans behind
+``/search/users`` and ``/search/projects``, and the in-memory index behind
+``/search/suggest``. Reports the time to load the index and the median and
+99th percentile latency per keystroke.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_typeahead --users 10000 --issues 1000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="scrumflow-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir}/bench.db"
+
+from sqlalchemy import insert, or_  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.typeahead import SUGGEST_TYPES, get_typeahead  # noqa: E402
+from app.db.base import Base, engine  # noqa: E402
+from app.models import Issue, Project, User  # noqa: E402
+
+FIRST_NAMES = "ada alan barbara claude donald edsger frances grace ken linus".split()
+LAST_NAMES = "lovelace turing liskov shannon knuth dijkstra allen hopper".split()
+BATCH_SIZE = 10_000
+PAGE_SIZE = 10
+
+
+def random_word(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def seed(
+    user_count: int, project_count: int, issue_count: int, rng: random.Random
+) -> list[str]:
+    """Create the schema and rows; returns the usernames"""
+    Base.metadata.create_all(bind=engine)
+    usernames = [f"{random_word(rng, 6)}{i}" for i in range(user_count)]
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {
+                    "username": username,
+                    "email": f"{username}@example.com",
+                    "full_name": f"{rng.choice(FIRST_NAMES).title()} "
+                    f"{rng.choice(LAST_NAMES).title()}",
+                    "hashed_password": "x",
+                }
+                for username in usernames
+            ],
+        )
+        conn.execute(
+            insert(Project),
+            [
+                {
+                    "name": f"Project {random_word(rng, 8)}",
+                    "key": f"P{i}",
+                    "owner_id": 1,
+                }
+                for i in range(project_count)
+            ],
+        )
+
+    for start in range(0, issue_count, BATCH_SIZE):
+        rows = []
+        for offset in range(min(BATCH_SIZE, issue_count - start)):
+            project = (start + offset) % project_count
+            number = (start + offset) // project_count + 1
+            rows.append(
+                {
+                    "number": number,
+                    "issue_key": f"P{project}-{number}",
+                    "rank": f"{number:07d}i",
+                    "title": "Issue",
+                    "status": "TO_DO",
+                    "priority": "MEDIUM",
+                    "issue_type": "TASK",
+                    "project_id": project + 1,
+                    "reporter_id": 1,
+                }
+            )
+        with engine.begin() as conn:
+            conn.execute(insert(Issue.__table__), rows)
+    return usernames
+
+
+def ilike_lookup(db: Session, q: str) -> int:
+    """The /search/users and /search/projects queries for one keystroke"""
+    users = (
+        db.query(User)
+        .filter(
+            or_(
+                User.username.ilike(f"%{q}%"),
+                User.email.ilike(f"%{q}%"),
+                User.full_name.ilike(f"%{q}%"),
+            )
+        )
+        .limit(PAGE_SIZE)
+        .all()
+    )
+    projects = (
+        db.query(Project)
+        .filter(or_(Project.name.ilike(f"%{q}%"), Project.key.ilike(f"%{q}%")))
+        .limit(PAGE_SIZE)
+        .all()
+    )
+    return len(users) + len(projects)
+
+
+def timings_ms(run, queries: list[str]) -> tuple[float, float]:
+    timings = []
+    for q in queries:
+        start = time.perf_counter()
+        run(q)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--projects", type=int, default=1_000)
+    parser.add_argument("--issues", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    start = time.perf_counter()
+    usernames = seed(args.users, args.projects, args.issues, rng)
+    print(f"seeded in {time.perf_counter() - start:.1f}s", flush=True)
+
+    start = time.perf_counter()
+    index = get_typeahead(engine)
+    print(f"index loaded in {time.perf_counter() - start:.2f}s", flush=True)
+
+    # Every keystroke of a few names, typos and issue keys
+    typed = [*rng.sample(usernames, 20), "lovleace", "djikstra", "P17-12", "P3-"]
+    queries = [word[:end] for word in typed for end in range(1, len(word) + 1)]
+
+    with Session(engine) as db:
+        like = timings_ms(lambda q: ilike_lookup(db, q), queries)
+    index_ms = timings_ms(lambda q: index.suggest(q, SUGGEST_TYPES, PAGE_SIZE), queries)
+    print(f"{len(queries)} keystrokes")
+    print(f"  ilike scans  median {like[0]:7.3f}ms  p99 {like[1]:7.3f}ms")
+    print(f"  typeahead    median {index_ms[0]:7.3f}ms  p99 {index_ms[1]:7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
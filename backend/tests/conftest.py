@@ -5,10 +5,10 @@ from datetime import datetime, timedelta
 import pytest
 from fastapi.testclient import TestClient
 from passlib.context import CryptContext
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.db.base import Base, get_db
+from app.core.config import settings
+from app.db.base import Base, create_db_engine, get_db
 from app.main import app
 from app.models.board import Board, BoardType
 from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
@@ -18,15 +18,17 @@ from app.models.status import Status, StatusCategory
 from app.models.user import User
 from app.models.workflow import Workflow
 
-# Use in-memory database for better test isolation
+# Use in-memory database for better test isolation; the engine shares one
+# connection, so requests served on other threads see the same database
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Startup would otherwise load the typeahead from the application database
+settings.TYPEAHEAD_WARM_ON_STARTUP = False
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -57,10 +59,15 @@ def override_get_db(db_session):
 @pytest.fixture(scope="function")
 def client(override_get_db):
     """Create a test client with database override"""
+    # Restore the override of modules that install their own at import time
+    previous = app.dependency_overrides.get(get_db)
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
+    if previous is None:
+        app.dependency_overrides.pop(get_db, None)
+    else:
+        app.dependency_overrides[get_db] = previous
 
 
 @pytest.fixture(scope="function")
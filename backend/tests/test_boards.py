@@ -1,14 +1,23 @@
 """Tests for boards API endpoints"""
 
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from app.core.board_events import get_board_event_hub
+from app.core.config import settings
 from app.db.base import Base, get_db
 from app.main import app
 from app.models.board import Board, BoardType
 from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
 from app.models.project import Project
+from app.models.sprint import Sprint
 from app.models.user import User
 
 # Create a test database
@@ -369,6 +378,97 @@ def test_get_board_columns():
     assert positions == sorted(positions)
 
 
+def test_create_board_column_statuses():
+    """Test that a column shows the status its name spells, or those given"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    board = setup_test_board(project.id)
+
+    response = client.post(f"/api/v1/boards/{board.id}/columns", json={"name": "Done"})
+    assert response.status_code == 201
+    assert response.json()["statuses"] == ["DONE"]
+
+    response = client.post(
+        f"/api/v1/boards/{board.id}/columns",
+        json={"name": "Doing", "statuses": ["IN_REVIEW", "IN_PROGRESS"]},
+    )
+    assert response.status_code == 201
+    assert response.json()["statuses"] == ["IN_PROGRESS", "IN_REVIEW"]
+
+    response = client.post(f"/api/v1/boards/{board.id}/columns", json={"name": "Later"})
+    assert response.json()["statuses"] == []
+
+    response = client.get(f"/api/v1/boards/{board.id}/columns")
+    assert [column["statuses"] for column in response.json()] == [
+        ["DONE"],
+        ["IN_PROGRESS", "IN_REVIEW"],
+        [],
+    ]
+
+
+def test_update_board_column():
+    """Test renaming a column and replacing its statuses"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    board = setup_test_board(project.id)
+    column = client.post(
+        f"/api/v1/boards/{board.id}/columns", json={"name": "To Do"}
+    ).json()
+
+    response = client.put(
+        f"/api/v1/boards/{board.id}/columns/{column['id']}",
+        json={"name": "Backlog", "statuses": ["DONE", "TO_DO"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Backlog"
+    assert data["statuses"] == ["TO_DO", "DONE"]
+
+    response = client.put(
+        f"/api/v1/boards/{board.id}/columns/{column['id']}", json={"position": 5}
+    )
+    assert response.json()["position"] == 5
+    assert response.json()["statuses"] == ["TO_DO", "DONE"]
+
+
+def test_update_board_column_not_found():
+    """Test updating a column of another board"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    board = setup_test_board(project.id)
+    other = setup_test_board(project.id)
+    column = client.post(
+        f"/api/v1/boards/{other.id}/columns", json={"name": "To Do"}
+    ).json()
+
+    response = client.put(
+        f"/api/v1/boards/{board.id}/columns/{column['id']}", json={"name": "X"}
+    )
+    assert response.status_code == 404
+
+
+def test_delete_board_column():
+    """Test deleting a column"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    board = setup_test_board(project.id)
+    column = client.post(
+        f"/api/v1/boards/{board.id}/columns", json={"name": "To Do"}
+    ).json()
+    client.get(f"/api/v1/boards/{board.id}/issues?column_id={column['id']}")
+
+    response = client.delete(f"/api/v1/boards/{board.id}/columns/{column['id']}")
+    assert response.status_code == 204
+
+    response = client.get(f"/api/v1/boards/{board.id}/columns")
+    assert response.json() == []
+    response = client.get(f"/api/v1/boards/{board.id}/issues?column_id={column['id']}")
+    assert response.status_code == 404
+
+    response = client.delete(f"/api/v1/boards/{board.id}/columns/{column['id']}")
+    assert response.status_code == 404
+
+
 def test_get_board_columns_invalid_board():
     """Test getting columns for non-existent board"""
     response = client.get("/api/v1/boards/99999/columns")
@@ -515,3 +615,618 @@ def test_get_board_issues_pagination():
         assert len(data2) <= 2
     finally:
         db.close()
+
+
+def test_get_board_issues_sparse_fields():
+    """Test requesting only the fields a board card needs"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    board = setup_test_board(project.id)
+
+    db = TestingSessionLocal()
+    try:
+        db.add(
+            Issue(
+                title="Card Issue",
+                description="Not shown on cards",
+                status=IssueStatus.TO_DO,
+                priority=IssuePriority.MEDIUM,
+                issue_type=IssueType.TASK,
+                project_id=project.id,
+                reporter_id=user.id,
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/v1/boards/{board.id}/issues?fields=id,key,title,status,assignee_id"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data
+    assert all(
+        set(issue) == {"id", "key", "title", "status", "assignee_id"} for issue in data
+    )
+
+
+def test_get_board_issues_conditional():
+    """Test that board polls get 304 until an issue of the board changes"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    board = setup_test_board(project.id)
+
+    response = client.get(f"/api/v1/boards/{board.id}/issues")
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        f"/api/v1/boards/{board.id}/issues", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    # A different page is a different representation
+    response = client.get(
+        f"/api/v1/boards/{board.id}/issues?limit=1", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+    db = TestingSessionLocal()
+    try:
+        db.add(
+            Issue(
+                title="New Board Issue",
+                status=IssueStatus.TO_DO,
+                priority=IssuePriority.LOW,
+                issue_type=IssueType.TASK,
+                project_id=project.id,
+                reporter_id=user.id,
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/v1/boards/{board.id}/issues", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def setup_snapshot_board(key, column_names):
+    """Create a project with a board and the named columns, in order"""
+    user = setup_test_user()
+    db = TestingSessionLocal()
+    try:
+        project = Project(name=f"Snapshot {key}", key=key, owner_id=user.id)
+        db.add(project)
+        db.commit()
+        project_id = project.id
+    finally:
+        db.close()
+    board = setup_test_board(project_id)
+    for position, name in enumerate(column_names, start=1):
+        client.post(
+            f"/api/v1/boards/{board.id}/columns",
+            json={"name": name, "position": position},
+        )
+    return user, project_id, board
+
+
+def add_board_issues(user, project_id, statuses):
+    db = TestingSessionLocal()
+    try:
+        issues = [
+            Issue(
+                title=f"Snapshot issue {i}",
+                status=status,
+                priority=IssuePriority.MEDIUM,
+                issue_type=IssueType.TASK,
+                project_id=project_id,
+                reporter_id=user.id,
+            )
+            for i, status in enumerate(statuses)
+        ]
+        db.add_all(issues)
+        db.commit()
+        return [issue.id for issue in issues]
+    finally:
+        db.close()
+
+
+def test_get_board_snapshot():
+    """Test that a snapshot groups the newest issues under each column"""
+    user, project_id, board = setup_snapshot_board(
+        "SNAP", ["To Do", "In Progress", "Done", "Parked"]
+    )
+    ids = add_board_issues(
+        user,
+        project_id,
+        [
+            IssueStatus.TO_DO,
+            IssueStatus.TO_DO,
+            IssueStatus.TO_DO,
+            IssueStatus.IN_PROGRESS,
+            IssueStatus.DONE,
+        ],
+    )
+
+    response = client.get(f"/api/v1/boards/{board.id}/snapshot?limit=2")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == board.id
+    assert data["project_id"] == project_id
+    columns = data["columns"]
+    assert [column["name"] for column in columns] == [
+        "To Do",
+        "In Progress",
+        "Done",
+        "Parked",
+    ]
+    assert [column["statuses"] for column in columns] == [
+        ["TO_DO"],
+        ["IN_PROGRESS"],
+        ["DONE"],
+        [],
+    ]
+    assert [column["total"] for column in columns] == [3, 1, 1, 0]
+    # Newest first, cut to the limit
+    assert [issue["id"] for issue in columns[0]["issues"]] == [ids[2], ids[1]]
+    assert [issue["id"] for issue in columns[1]["issues"]] == [ids[3]]
+    assert columns[3]["issues"] == []
+
+
+def test_get_board_issues_column_statuses():
+    """Test that a column lists the issues of every status mapped to it"""
+    user, project_id, board = setup_snapshot_board("COLS", [])
+    column = client.post(
+        f"/api/v1/boards/{board.id}/columns",
+        json={"name": "Active", "statuses": ["IN_PROGRESS", "IN_REVIEW"]},
+    ).json()
+    ids = add_board_issues(
+        user,
+        project_id,
+        [IssueStatus.TO_DO, IssueStatus.IN_PROGRESS, IssueStatus.IN_REVIEW],
+    )
+    url = f"/api/v1/boards/{board.id}/issues?column_id={column['id']}"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert [issue["id"] for issue in response.json()] == [ids[2], ids[1]]
+    etag = response.headers["ETag"]
+
+    # Editing the column replaces the cached statuses and the column's ETag
+    client.put(
+        f"/api/v1/boards/{board.id}/columns/{column['id']}",
+        json={"statuses": ["TO_DO"]},
+    )
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [issue["id"] for issue in response.json()] == [ids[0]]
+
+    client.put(
+        f"/api/v1/boards/{board.id}/columns/{column['id']}", json={"statuses": []}
+    )
+    assert client.get(url).json() == []
+
+    snapshot = client.get(f"/api/v1/boards/{board.id}/snapshot").json()
+    assert snapshot["columns"][0]["statuses"] == []
+    assert snapshot["columns"][0]["total"] == 0
+
+
+def test_get_board_snapshot_constant_query_count():
+    """Test that a snapshot costs the same queries for any number of columns"""
+
+    def count_statements(board_id):
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = client.get(f"/api/v1/boards/{board_id}/snapshot")
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        assert response.status_code == 200
+        return len(statements)
+
+    user, project_id, small = setup_snapshot_board("SNAPS", ["To Do", "Done"])
+    add_board_issues(user, project_id, [IssueStatus.TO_DO, IssueStatus.DONE])
+    user, project_id, large = setup_snapshot_board(
+        "SNAPL",
+        ["To Do", "In Progress", "In Review", "Blocked", "Done", "Parked"],
+    )
+    add_board_issues(user, project_id, list(IssueStatus))
+
+    assert count_statements(small.id) == count_statements(large.id)
+
+
+def test_get_board_snapshot_conditional():
+    """Test that snapshot polls get 304 until the board or its issues change"""
+    user, project_id, board = setup_snapshot_board("SNAPC", ["To Do"])
+    response = client.get(f"/api/v1/boards/{board.id}/snapshot")
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        f"/api/v1/boards/{board.id}/snapshot", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    client.post(f"/api/v1/boards/{board.id}/columns", json={"name": "Done"})
+    response = client.get(
+        f"/api/v1/boards/{board.id}/snapshot", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert [column["name"] for column in response.json()["columns"]] == [
+        "To Do",
+        "Done",
+    ]
+    etag = response.headers["ETag"]
+
+    add_board_issues(user, project_id, [IssueStatus.DONE])
+    response = client.get(
+        f"/api/v1/boards/{board.id}/snapshot", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["columns"][1]["total"] == 1
+
+
+def test_get_board_snapshot_not_found():
+    """Test getting a snapshot of a non-existent board"""
+    response = client.get("/api/v1/boards/99999/snapshot")
+    assert response.status_code == 404
+
+
+def issue_payload(user, project_id, title):
+    return {
+        "title": title,
+        "issue_type": "TASK",
+        "priority": "MEDIUM",
+        "project_id": project_id,
+        "reporter_id": user.id,
+    }
+
+
+async def next_event(subscription):
+    item = await subscription.get(5)
+    assert item is not None
+    return item[1]
+
+
+async def test_board_events_from_issue_and_sprint_routes():
+    """Test that issue and sprint mutations publish compact diffs"""
+    user, project_id, _ = setup_snapshot_board("EVENTS", [])
+    db = TestingSessionLocal()
+    try:
+        sprint = Sprint(
+            name="Events sprint",
+            project_id=project_id,
+            start_date=datetime.now(),
+            end_date=datetime.now() + timedelta(days=14),
+        )
+        db.add(sprint)
+        db.commit()
+        sprint_id = sprint.id
+    finally:
+        db.close()
+
+    hub = get_board_event_hub(engine)
+    subscription = hub.subscribe(project_id)
+    try:
+        created = await asyncio.to_thread(
+            client.post,
+            "/api/v1/issues/",
+            json=issue_payload(user, project_id, "Live issue"),
+        )
+        issue = created.json()
+        event = await next_event(subscription)
+        assert event["op"] == "created"
+        assert event["id"] == issue["id"]
+        assert event["issue"]["issue_key"] == issue["key"]
+        assert event["issue"]["status"] == "TO_DO"
+        assert event["issue"]["rank"] == issue["rank"]
+
+        url = f"/api/v1/issues/{issue['id']}"
+        await asyncio.to_thread(
+            client.patch, f"{url}/status", json={"status": "IN_PROGRESS"}
+        )
+        assert await next_event(subscription) == {
+            "op": "updated",
+            "id": issue["id"],
+            "changes": {"status": "IN_PROGRESS"},
+        }
+
+        await asyncio.to_thread(
+            client.patch, f"{url}/assign", json={"assignee_id": user.id}
+        )
+        event = await next_event(subscription)
+        assert event["changes"] == {"assignee_id": user.id}
+
+        # Fields a board does not show are not pushed
+        await asyncio.to_thread(
+            client.patch, f"{url}/priority", json={"priority": "HIGH"}
+        )
+        await asyncio.to_thread(
+            client.post, f"/api/v1/sprints/{sprint_id}/issues/{issue['id']}"
+        )
+        event = await next_event(subscription)
+        assert event["changes"] == {"sprint_id": sprint_id}
+
+        await asyncio.to_thread(
+            client.patch,
+            "/api/v1/issues/bulk",
+            json={"ids": [issue["id"]], "patch": {"status": "DONE"}},
+        )
+        event = await next_event(subscription)
+        assert event["changes"] == {"status": "DONE"}
+
+        await asyncio.to_thread(client.delete, url)
+        assert await next_event(subscription) == {"op": "deleted", "id": issue["id"]}
+        assert await subscription.get(0.05) is None
+    finally:
+        hub.unsubscribe(subscription)
+    assert hub.subscriber_count(project_id) == 0
+
+
+async def test_board_events_bulk_create_and_rank():
+    """Test that bulk creates and rank moves are pushed"""
+    user, project_id, _ = setup_snapshot_board("EVBULK", [])
+    hub = get_board_event_hub(engine)
+    subscription = hub.subscribe(project_id)
+    try:
+        response = await asyncio.to_thread(
+            client.post,
+            "/api/v1/issues/bulk",
+            json=[issue_payload(user, project_id, f"Bulk {i}") for i in range(2)],
+        )
+        ids = [result["id"] for result in response.json()["results"]]
+        events = [await next_event(subscription) for _ in ids]
+        assert [event["id"] for event in events] == ids
+        assert {event["op"] for event in events} == {"created"}
+        assert events[0]["issue"]["status"] == "TO_DO"
+
+        moved = await asyncio.to_thread(
+            client.patch, f"/api/v1/issues/{ids[1]}/rank", json={"before_id": ids[0]}
+        )
+        assert await next_event(subscription) == {
+            "op": "updated",
+            "id": ids[1],
+            "changes": {"rank": moved.json()["rank"]},
+        }
+    finally:
+        hub.unsubscribe(subscription)
+
+
+async def test_board_events_slow_subscriber_reset(monkeypatch):
+    """Test that a full queue is replaced by a single reset event"""
+    hub = get_board_event_hub(engine)
+    monkeypatch.setattr(hub, "queue_size", 2)
+    subscription = hub.subscribe(424242)
+    other = hub.subscribe(424243)
+    try:
+        for issue_id in range(3):
+            hub.publish(424242, {"op": "deleted", "id": issue_id})
+        assert (await next_event(subscription))["op"] == "reset"
+        assert await subscription.get(0.05) is None
+        # Events of other projects are not delivered
+        assert await other.get(0.05) is None
+    finally:
+        hub.unsubscribe(subscription)
+        hub.unsubscribe(other)
+
+
+def test_stream_board_events(monkeypatch):
+    """Test that the SSE endpoint streams events until it times out"""
+    user, project_id, board = setup_snapshot_board("EVSTREAM", [])
+    issue_id = add_board_issues(user, project_id, [IssueStatus.TO_DO])[0]
+    monkeypatch.setattr(settings, "BOARD_EVENTS_STREAM_TIMEOUT", 1.0)
+    monkeypatch.setattr(settings, "BOARD_EVENTS_KEEPALIVE", 0.5)
+    hub = get_board_event_hub(engine)
+    subscribed = threading.Event()
+
+    def move_issue():
+        deadline = time.monotonic() + 5
+        while not hub.subscriber_count(project_id):
+            if time.monotonic() > deadline:
+                return
+            time.sleep(0.01)
+        subscribed.set()
+        client.patch(f"/api/v1/issues/{issue_id}/status", json={"status": "DONE"})
+
+    # A daemon thread with a deadline fails the test instead of hanging the run
+    mover = threading.Thread(target=move_issue, daemon=True)
+    mover.start()
+    response = client.get(f"/api/v1/boards/{board.id}/events")
+    mover.join(timeout=5)
+
+    assert subscribed.is_set(), "the event stream never subscribed to the hub"
+    assert not mover.is_alive()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.split("\n\n")
+    assert frames[0].startswith("retry: ")
+    events = [frame for frame in frames if "event: issue" in frame]
+    assert len(events) == 1
+    data = json.loads(events[0].split("data: ", 1)[1])
+    assert data == {"op": "updated", "id": issue_id, "changes": {"status": "DONE"}}
+    assert hub.subscriber_count(project_id) == 0
+
+
+def test_stream_board_events_not_found():
+    """Test streaming events of a non-existent board"""
+    response = client.get("/api/v1/boards/99999/events")
+    assert response.status_code == 404
+
+
+def test_board_column_wip_limit():
+    """Test setting, changing and removing a column's WIP limit"""
+    _, _, board = setup_snapshot_board("WIPCOL", [])
+    url = f"/api/v1/boards/{board.id}/columns"
+    response = client.post(url, json={"name": "In Progress", "wip_limit": 3})
+    assert response.status_code == 201
+    column = response.json()
+    assert column["wip_limit"] == 3
+
+    response = client.put(f"{url}/{column['id']}", json={"name": "Doing"})
+    assert response.json()["wip_limit"] == 3
+    response = client.put(f"{url}/{column['id']}", json={"wip_limit": 5})
+    assert response.json()["wip_limit"] == 5
+    response = client.put(f"{url}/{column['id']}", json={"wip_limit": None})
+    assert response.json()["wip_limit"] is None
+
+    response = client.put(f"{url}/{column['id']}", json={"wip_limit": 0})
+    assert response.status_code == 400
+    response = client.post(url, json={"name": "Done", "wip_limit": -1})
+    assert response.status_code == 400
+
+
+def test_get_board_counts():
+    """Test that header counts follow creates, moves, bulk moves and deletes"""
+    user, project_id, board = setup_snapshot_board(
+        "COUNTS", ["To Do", "In Progress", "Done"]
+    )
+    ids = add_board_issues(
+        user, project_id, [IssueStatus.TO_DO, IssueStatus.TO_DO, IssueStatus.DONE]
+    )
+    client.post(
+        f"/api/v1/boards/{board.id}/columns",
+        json={"name": "Active", "statuses": ["IN_PROGRESS", "IN_REVIEW"]},
+    )
+
+    def counts():
+        response = client.get(f"/api/v1/boards/{board.id}/counts")
+        assert response.status_code == 200
+        data = response.json()
+        return data["statuses"], [column["count"] for column in data["columns"]]
+
+    assert counts() == (
+        {"TO_DO": 2, "IN_PROGRESS": 0, "IN_REVIEW": 0, "DONE": 1},
+        [2, 0, 1, 0],
+    )
+
+    client.patch(f"/api/v1/issues/{ids[0]}/status", json={"status": "IN_REVIEW"})
+    client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": ids[1:], "patch": {"status": "IN_PROGRESS"}},
+    )
+    assert counts() == (
+        {"TO_DO": 0, "IN_PROGRESS": 2, "IN_REVIEW": 1, "DONE": 0},
+        [0, 2, 0, 3],
+    )
+
+    client.delete(f"/api/v1/issues/{ids[0]}")
+    assert counts()[0]["IN_REVIEW"] == 0
+
+    response = client.get("/api/v1/boards/99999/counts")
+    assert response.status_code == 404
+
+
+def test_wip_limit_rejects_moves():
+    """Test that moves past a column's WIP limit fail unless overridden"""
+    user, project_id, board = setup_snapshot_board("WIPMOVE", ["To Do"])
+    ids = add_board_issues(user, project_id, [IssueStatus.TO_DO] * 3)
+    column = client.post(
+        f"/api/v1/boards/{board.id}/columns",
+        json={
+            "name": "Active",
+            "statuses": ["IN_PROGRESS", "IN_REVIEW"],
+            "wip_limit": 1,
+        },
+    ).json()
+
+    response = client.patch(
+        f"/api/v1/issues/{ids[0]}/status", json={"status": "IN_PROGRESS"}
+    )
+    assert response.status_code == 200
+
+    # A move within the column does not enter it again
+    response = client.patch(
+        f"/api/v1/issues/{ids[0]}/status", json={"status": "IN_REVIEW"}
+    )
+    assert response.status_code == 200
+
+    response = client.patch(
+        f"/api/v1/issues/{ids[1]}/status", json={"status": "IN_PROGRESS"}
+    )
+    assert response.status_code == 409
+    assert "Active" in response.json()["detail"]
+    response = client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": ids[1:], "patch": {"status": "IN_PROGRESS"}},
+    )
+    assert response.status_code == 409
+    assert client.get(f"/api/v1/issues/{ids[1]}").json()["status"] == "TO_DO"
+
+    response = client.patch(
+        f"/api/v1/issues/{ids[1]}/status?override_wip_limit=true",
+        json={"status": "IN_PROGRESS"},
+    )
+    assert response.status_code == 200
+    warning = json.loads(response.headers["X-WIP-Warning"])
+    assert warning == [
+        {
+            "board_id": board.id,
+            "column_id": column["id"],
+            "column": "Active",
+            "wip_limit": 1,
+            "count": 2,
+        }
+    ]
+    data = client.get(f"/api/v1/boards/{board.id}/counts").json()
+    assert data["columns"][1] == {
+        "id": column["id"],
+        "name": "Active",
+        "count": 2,
+        "wip_limit": 1,
+        "over_limit": True,
+    }
+
+    # Moving out of an over-limit column is always allowed
+    response = client.patch(f"/api/v1/issues/{ids[1]}/status", json={"status": "DONE"})
+    assert response.status_code == 200
+
+
+def test_wip_limit_rejects_creates():
+    """Test that creates past a column's WIP limit fail unless overridden"""
+    user, project_id, board = setup_snapshot_board("WIPNEW", [])
+    client.post(
+        f"/api/v1/boards/{board.id}/columns",
+        json={"name": "Backlog", "statuses": ["TO_DO"], "wip_limit": 1},
+    )
+
+    response = client.post(
+        "/api/v1/issues/", json=issue_payload(user, project_id, "First")
+    )
+    assert response.status_code == 201
+    response = client.post(
+        "/api/v1/issues/", json=issue_payload(user, project_id, "Second")
+    )
+    assert response.status_code == 409
+    assert "Backlog" in response.json()["detail"]
+
+    response = client.post(
+        "/api/v1/issues/bulk",
+        json=[issue_payload(user, project_id, f"Bulk {i}") for i in range(2)],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 0
+    assert data["failed"] == 2
+    assert "Backlog" in data["results"][0]["detail"]
+    assert len(client.get(f"/api/v1/issues/?project_id={project_id}").json()) == 1
+
+    response = client.post(
+        "/api/v1/issues/?override_wip_limit=true",
+        json=issue_payload(user, project_id, "Second"),
+    )
+    assert response.status_code == 201
+    assert json.loads(response.headers["X-WIP-Warning"])[0]["count"] == 2
+    response = client.post(
+        "/api/v1/issues/bulk?override_wip_limit=true",
+        json=[issue_payload(user, project_id, f"Bulk {i}") for i in range(2)],
+    )
+    assert response.json()["created"] == 2
+    assert json.loads(response.headers["X-WIP-Warning"])[0]["count"] == 4
@@ -0,0 +1,66 @@
+"""Tests for the database engine profile"""
+
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.core.config import settings
+from app.db.base import create_db_engine
+
+
+def test_file_engine_uses_sized_queue_pool(tmp_path):
+    """Test that file databases get a QueuePool sized from settings"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    try:
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == settings.DB_POOL_SIZE
+    finally:
+        engine.dispose()
+
+
+def test_file_engine_applies_pragmas(tmp_path):
+    """Test that every new connection gets the configured pragmas"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    try:
+        with engine.connect() as conn:
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+            synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+            cache_size = conn.execute(text("PRAGMA cache_size")).scalar()
+            busy_timeout = conn.execute(text("PRAGMA busy_timeout")).scalar()
+            temp_store = conn.execute(text("PRAGMA temp_store")).scalar()
+
+        assert journal_mode == settings.SQLITE_JOURNAL_MODE.lower()
+        assert synchronous == 1  # NORMAL
+        assert cache_size == settings.SQLITE_CACHE_SIZE
+        assert busy_timeout == settings.SQLITE_BUSY_TIMEOUT
+        assert temp_store == 2  # MEMORY
+    finally:
+        engine.dispose()
+
+
+def test_readers_not_blocked_by_open_write(tmp_path):
+    """Test that a reader still sees committed data while a write is pending"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(text("INSERT INTO items (id) VALUES (2)"))
+
+            count = reader.execute(text("SELECT COUNT(*) FROM items")).scalar()
+            assert count == 1
+
+            writer.execute(text("COMMIT"))
+    finally:
+        engine.dispose()
+
+
+def test_memory_engine_shares_single_connection():
+    """Test that in-memory databases use a StaticPool"""
+    engine = create_db_engine("sqlite:///:memory:")
+    try:
+        assert isinstance(engine.pool, StaticPool)
+    finally:
+        engine.dispose()
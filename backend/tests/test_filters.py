@@ -0,0 +1,220 @@
+"""Tests for saved filter API endpoints"""
+
+from urllib.parse import quote
+
+from app.core.config import settings
+from app.core.filter_cache import get_filter_cache
+from app.db.base import get_engine
+from app.models.project import Project
+from app.models.user import User
+
+
+def setup_test_project(db, key):
+    """Create a user and a project, returning their ids"""
+    user = db.query(User).filter(User.username == "filteruser").first()
+    if not user:
+        user = User(
+            username="filteruser",
+            email="filter@example.com",
+            hashed_password="hashed_password_here",
+            full_name="Filter User",
+        )
+        db.add(user)
+        db.commit()
+    project = Project(name=f"Filter Project {key}", key=key, owner_id=user.id)
+    db.add(project)
+    db.commit()
+    return user.id, project.id
+
+
+def create_issue(client, user_id, project_id, title, priority="MEDIUM"):
+    response = client.post(
+        "/api/v1/issues/",
+        json={
+            "title": title,
+            "issue_type": "BUG",
+            "priority": priority,
+            "project_id": project_id,
+            "reporter_id": user_id,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def create_filter(client, user_id, jql, name="My filter"):
+    response = client.post(
+        "/api/v1/filters/", json={"name": name, "jql": jql, "owner_id": user_id}
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def filter_ids(client, filter_id, skip=0, limit=100):
+    response = client.get(
+        f"/api/v1/filters/{filter_id}/issues?skip={skip}&limit={limit}"
+    )
+    assert response.status_code == 200
+    return [issue["id"] for issue in response.json()], int(
+        response.headers["X-Total-Count"]
+    )
+
+
+def jql_ids(client, jql):
+    response = client.get(f"/api/v1/search/jql?q={quote(jql)}&limit=100")
+    assert response.status_code == 200
+    return [issue["id"] for issue in response.json()]
+
+
+def test_filter_crud(client, db_session):
+    """Test creating, listing, updating and deleting a saved filter"""
+    user_id, _ = setup_test_project(db_session, "FCRUD")
+    filter_id = create_filter(client, user_id, "project = FCRUD AND status = TO_DO")
+
+    response = client.get(f"/api/v1/filters/?owner_id={user_id}")
+    assert response.status_code == 200
+    assert filter_id in [saved["id"] for saved in response.json()]
+
+    response = client.put(
+        f"/api/v1/filters/{filter_id}",
+        json={"name": "Open work", "jql": "project = FCRUD AND status != DONE"},
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Open work"
+    assert response.json()["jql"] == "project = FCRUD AND status != DONE"
+
+    response = client.delete(f"/api/v1/filters/{filter_id}")
+    assert response.status_code == 204
+    response = client.get(f"/api/v1/filters/{filter_id}")
+    assert response.status_code == 404
+
+
+def test_filter_rejects_invalid_input(client, db_session):
+    """Test that invalid queries and unknown owners are rejected"""
+    user_id, _ = setup_test_project(db_session, "FBAD")
+
+    response = client.post(
+        "/api/v1/filters/",
+        json={"name": "Scan", "jql": "priority = HIGH", "owner_id": user_id},
+    )
+    assert response.status_code == 400
+    assert "scan" in response.json()["detail"]
+
+    response = client.post(
+        "/api/v1/filters/",
+        json={"name": "Nobody", "jql": "project = FBAD", "owner_id": 99999},
+    )
+    assert response.status_code == 404
+
+    response = client.get("/api/v1/filters/99999/issues")
+    assert response.status_code == 404
+
+
+def test_filter_issues_paging(client, db_session):
+    """Test that pages are slices of the filter's ordered results"""
+    user_id, project_id = setup_test_project(db_session, "FPAGE")
+    for i, priority in enumerate(["LOW", "CRITICAL", "MEDIUM", "HIGH", "LOW"]):
+        create_issue(client, user_id, project_id, f"Paged issue {i}", priority)
+    jql = "project = FPAGE ORDER BY priority DESC"
+    filter_id = create_filter(client, user_id, jql)
+
+    first, total = filter_ids(client, filter_id, skip=0, limit=2)
+    second, _ = filter_ids(client, filter_id, skip=2, limit=2)
+    last, _ = filter_ids(client, filter_id, skip=4, limit=2)
+    assert total == 5
+    assert first + second + last == jql_ids(client, jql)
+
+
+def test_filter_results_follow_issue_changes(client, db_session):
+    """Test that creates, updates and deletes are applied to cached results"""
+    user_id, project_id = setup_test_project(db_session, "FLIVE")
+    jql = "project = FLIVE AND status IN (TO_DO, IN_PROGRESS) ORDER BY created"
+    filter_id = create_filter(client, user_id, jql)
+    kept = create_issue(client, user_id, project_id, "Open issue")
+    closed = create_issue(client, user_id, project_id, "Soon closed issue")
+
+    ids, total = filter_ids(client, filter_id)
+    assert ids == [kept, closed]
+    cached = get_filter_cache(get_engine(db_session))._results[filter_id]
+
+    added = create_issue(client, user_id, project_id, "New issue")
+    client.patch(f"/api/v1/issues/{closed}/status", json={"status": "DONE"})
+    client.delete(f"/api/v1/issues/{kept}")
+    bulk = client.post(
+        "/api/v1/issues/bulk",
+        json=[
+            {
+                "title": f"Bulk issue {i}",
+                "issue_type": "TASK",
+                "priority": "LOW",
+                "project_id": project_id,
+                "reporter_id": user_id,
+            }
+            for i in range(3)
+        ],
+    ).json()["results"]
+    bulk_ids = [result["id"] for result in bulk]
+    client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": bulk_ids[:1], "patch": {"status": "DONE"}},
+    )
+
+    ids, total = filter_ids(client, filter_id)
+    assert ids == [added, *bulk_ids[1:]]
+    assert ids == jql_ids(client, jql)
+    assert total == 3
+    # The cached result was updated in place rather than rebuilt
+    assert get_filter_cache(get_engine(db_session))._results[filter_id] is cached
+
+
+def test_filter_query_change_rebuilds_results(client, db_session):
+    """Test that changing a filter's query replaces its cached results"""
+    user_id, project_id = setup_test_project(db_session, "FEDIT")
+    low = create_issue(client, user_id, project_id, "Low issue", "LOW")
+    high = create_issue(client, user_id, project_id, "High issue", "HIGH")
+    filter_id = create_filter(client, user_id, "project = FEDIT AND priority = LOW")
+    assert filter_ids(client, filter_id)[0] == [low]
+
+    client.put(
+        f"/api/v1/filters/{filter_id}",
+        json={"jql": "project = FEDIT AND priority = HIGH"},
+    )
+    assert filter_ids(client, filter_id)[0] == [high]
+
+
+def test_filter_too_large_to_cache(client, db_session, monkeypatch):
+    """Test that filters over the cache limit are paged with the query"""
+    monkeypatch.setattr(settings, "SAVED_FILTER_MAX_IDS", 2)
+    user_id, project_id = setup_test_project(db_session, "FHUGE")
+    for i in range(3):
+        create_issue(client, user_id, project_id, f"Huge issue {i}")
+    jql = "project = FHUGE"
+    filter_id = create_filter(client, user_id, jql)
+
+    ids, total = filter_ids(client, filter_id)
+    assert total == 3
+    assert ids == jql_ids(client, jql)
+    assert filter_id not in get_filter_cache(get_engine(db_session))._results
+
+
+def test_filter_results_follow_project_changes(client, db_session):
+    """Test that a project key is resolved again once projects change"""
+    user_id, _ = setup_test_project(db_session, "FOWNER")
+    filter_id = create_filter(client, user_id, "project = FLATER")
+    assert filter_ids(client, filter_id) == ([], 0)
+
+    project = client.post(
+        "/api/v1/projects/",
+        json={"name": "Later", "key": "FLATER", "owner_id": user_id},
+    ).json()
+    first = create_issue(client, user_id, project["id"], "Later issue")
+    assert filter_ids(client, filter_id) == ([first], 1)
+
+    # A project recreated under the same key gets a new id
+    client.delete(f"/api/v1/issues/{first}")
+    client.delete(f"/api/v1/projects/{project['id']}")
+    setup_test_project(db_session, "FREUSE")
+    user_id, project_id = setup_test_project(db_session, "FLATER")
+    assert project_id != project["id"]
+    second = create_issue(client, user_id, project_id, "Recreated issue")
+    assert filter_ids(client, filter_id) == ([second], 1)
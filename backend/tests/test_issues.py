@@ -1,7 +1,9 @@
 """Tests for issues API endpoints"""
 
+import json
+
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.db.base import Base, get_db
@@ -109,7 +111,7 @@ def test_create_issue():
     assert data["status"] == "TO_DO"  # Default status
     assert "id" in data
     assert "key" in data
-    assert data["key"] == f"{project.key}-{data['id']}"
+    assert data["key"].startswith(f"{project.key}-")
     assert "created_at" in data
     assert "updated_at" in data
 
@@ -175,7 +177,7 @@ def test_get_issue_by_id():
         data = response.json()
         assert data["id"] == issue.id
         assert data["title"] == issue.title
-        assert data["key"] == f"{project.key}-{issue.id}"
+        assert data["key"] == issue.issue_key
     finally:
         db.close()
 
@@ -208,7 +210,7 @@ def test_get_issue_by_key():
         db.commit()
         db.refresh(issue)
 
-        issue_key = f"{project.key}-{issue.id}"
+        issue_key = issue.issue_key
         response = client.get(f"/api/v1/issues/key/{issue_key}")
         assert response.status_code == 200
         data = response.json()
@@ -218,6 +220,46 @@ def test_get_issue_by_key():
         db.close()
 
 
+def test_issue_keys_are_sequential_per_project():
+    """Test that each project numbers its issues independently"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+
+    db = TestingSessionLocal()
+    try:
+        other_project = Project(
+            name="Numbering Project",
+            key="NUMTEST",
+            description="Second project for issue numbering",
+            owner_id=user.id,
+        )
+        db.add(other_project)
+        db.commit()
+        db.refresh(other_project)
+        other_project_id = other_project.id
+    finally:
+        db.close()
+
+    keys = []
+    for project_id in (project.id, other_project_id, project.id):
+        response = client.post(
+            "/api/v1/issues/",
+            json={
+                "title": "Numbered Issue",
+                "issue_type": "TASK",
+                "priority": "LOW",
+                "project_id": project_id,
+                "reporter_id": user.id,
+            },
+        )
+        assert response.status_code == 201
+        keys.append(response.json()["key"])
+
+    first_number = int(keys[0].rsplit("-", 1)[1])
+    assert keys[1] == "NUMTEST-1"
+    assert keys[2] == f"{project.key}-{first_number + 1}"
+
+
 def test_get_issue_by_key_invalid_format():
     """Test getting an issue with invalid key format"""
     response = client.get("/api/v1/issues/key/INVALID")
@@ -355,7 +397,10 @@ def test_get_issues_search():
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
-        assert any("bug" in i["title"].lower() or "bug" in (i.get("description") or "").lower() for i in data)
+        assert any(
+            "bug" in i["title"].lower() or "bug" in (i.get("description") or "").lower()
+            for i in data
+        )
     finally:
         db.close()
 
@@ -707,3 +752,851 @@ def test_get_issues_pagination():
     finally:
         db.close()
 
+
+def test_get_issues_cursor_pagination():
+    """Test walking every page of a project with cursors"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+
+    db = TestingSessionLocal()
+    try:
+        for i in range(5):
+            db.add(
+                Issue(
+                    title=f"Cursor Issue {i}",
+                    status=IssueStatus.TO_DO,
+                    priority=IssuePriority.MEDIUM,
+                    issue_type=IssueType.TASK,
+                    project_id=project.id,
+                    reporter_id=user.id,
+                )
+            )
+        db.commit()
+        expected_ids = [
+            issue.id
+            for issue in db.query(Issue)
+            .filter(Issue.project_id == project.id)
+            .order_by(Issue.created_at.desc(), Issue.id.desc())
+        ]
+    finally:
+        db.close()
+
+    seen_ids = []
+    url = f"/api/v1/issues/?project_id={project.id}&limit=2"
+    while True:
+        response = client.get(url)
+        assert response.status_code == 200
+        seen_ids.extend(issue["id"] for issue in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        assert 'rel="next"' in response.headers["Link"]
+        url = f"/api/v1/issues/?project_id={project.id}&limit=2&cursor={next_cursor}"
+
+    assert seen_ids == expected_ids
+
+
+def test_get_issues_invalid_cursor():
+    """Test that a malformed cursor is rejected"""
+    response = client.get("/api/v1/issues/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_get_issues_constant_query_count():
+    """Test that listing issues does not issue one query per row"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+
+    db = TestingSessionLocal()
+    try:
+        for i in range(6):
+            db.add(
+                Issue(
+                    title=f"Query Count Issue {i}",
+                    status=IssueStatus.TO_DO,
+                    priority=IssuePriority.MEDIUM,
+                    issue_type=IssueType.TASK,
+                    project_id=project.id,
+                    reporter_id=user.id,
+                )
+            )
+        db.commit()
+    finally:
+        db.close()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        response = client.get(f"/api/v1/issues/?project_id={project.id}&limit=1")
+        assert response.status_code == 200
+        single_row_count = len(statements)
+
+        statements.clear()
+        response = client.get(f"/api/v1/issues/?project_id={project.id}&limit=6")
+        assert response.status_code == 200
+        assert len(response.json()) == 6
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) == single_row_count == 1
+
+
+def test_create_issues_bulk():
+    """Test creating a batch of issues from a JSON array"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+
+    items = [
+        {
+            "title": f"Bulk Issue {i}",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        }
+        for i in range(3)
+    ]
+    response = client.post("/api/v1/issues/bulk", json=items)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3
+    assert data["failed"] == 0
+    assert [result["index"] for result in data["results"]] == [0, 1, 2]
+
+    numbers = [int(result["key"].rsplit("-", 1)[1]) for result in data["results"]]
+    assert numbers == list(range(numbers[0], numbers[0] + 3))
+
+    issue = client.get(f"/api/v1/issues/{data['results'][0]['id']}").json()
+    assert issue["title"] == "Bulk Issue 0"
+    assert issue["status"] == "TO_DO"
+    assert issue["key"] == data["results"][0]["key"]
+
+
+def test_create_issues_bulk_reports_item_errors():
+    """Test that invalid items are reported without blocking valid ones"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    valid = {
+        "title": "Bulk Valid Issue",
+        "issue_type": "BUG",
+        "priority": "HIGH",
+        "project_id": project.id,
+        "reporter_id": user.id,
+    }
+    items = [
+        valid,
+        {**valid, "project_id": 99999},
+        {**valid, "assignee_id": 99999},
+        {**valid, "parent_issue_id": 99999},
+        {"title": "Missing fields"},
+        valid,
+    ]
+
+    response = client.post("/api/v1/issues/bulk", json=items)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 4
+
+    results = data["results"]
+    assert results[0]["status"] == "created"
+    assert results[1]["detail"] == "Project not found"
+    assert results[2]["detail"] == "Assignee not found"
+    assert results[3]["detail"] == "Parent issue not found"
+    assert results[4]["status"] == "error"
+    assert "priority" in results[4]["detail"]
+    assert results[5]["status"] == "created"
+
+
+def test_create_issues_bulk_ndjson(monkeypatch):
+    """Test creating issues from an NDJSON body across several chunks"""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", 2)
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+
+    lines = [
+        json.dumps(
+            {
+                "title": f"NDJSON Issue {i}",
+                "issue_type": "STORY",
+                "priority": "MEDIUM",
+                "project_id": project.id,
+                "reporter_id": user.id,
+            }
+        )
+        for i in range(5)
+    ]
+    response = client.post(
+        "/api/v1/issues/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 5
+    assert len({result["key"] for result in data["results"]}) == 5
+
+
+def test_create_issues_bulk_invalid_body(monkeypatch):
+    """Test that malformed or oversized bulk bodies are rejected"""
+    from app.core.config import settings
+
+    response = client.post("/api/v1/issues/bulk", json={"title": "not a list"})
+    assert response.status_code == 400
+
+    response = client.post(
+        "/api/v1/issues/bulk",
+        content='{"title": "ok"}\n{broken\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 400
+    assert "line 2" in response.json()["detail"]
+
+    monkeypatch.setattr(settings, "BULK_MAX_ITEMS", 2)
+    response = client.post("/api/v1/issues/bulk", json=[{}, {}, {}])
+    assert response.status_code == 413
+
+
+def test_update_issues_bulk_by_ids():
+    """Test moving a list of issues to a new status in one request"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    items = [
+        {
+            "title": f"Bulk Update Issue {i}",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        }
+        for i in range(3)
+    ]
+    created = client.post("/api/v1/issues/bulk", json=items).json()["results"]
+    ids = [result["id"] for result in created]
+
+    response = client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": ids[:2], "patch": {"status": "DONE"}, "return_rows": True},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["updated"] == 2
+    assert [issue["id"] for issue in data["issues"]] == ids[:2]
+    assert all(issue["status"] == "DONE" for issue in data["issues"])
+
+    untouched = client.get(f"/api/v1/issues/{ids[2]}").json()
+    assert untouched["status"] == "TO_DO"
+
+
+def test_update_issues_bulk_by_filter():
+    """Test reassigning and then unassigning everything matching a filter"""
+    db = TestingSessionLocal()
+    try:
+        leaver = User(
+            username="bulkleaver",
+            email="bulkleaver@example.com",
+            hashed_password="hashed_password_here",
+        )
+        db.add(leaver)
+        db.commit()
+        leaver_id = leaver.id
+    finally:
+        db.close()
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    items = [
+        {
+            "title": f"Leaver Issue {i}",
+            "issue_type": "BUG",
+            "priority": "HIGH",
+            "project_id": project.id,
+            "reporter_id": user.id,
+            "assignee_id": leaver_id,
+        }
+        for i in range(4)
+    ]
+    client.post("/api/v1/issues/bulk", json=items)
+
+    response = client.patch(
+        "/api/v1/issues/bulk",
+        json={"filter": {"assignee_id": leaver_id}, "patch": {"assignee_id": user.id}},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"updated": 4, "issues": None}
+
+    response = client.get(f"/api/v1/issues/?assignee_id={leaver_id}")
+    assert response.json() == []
+
+    response = client.patch(
+        "/api/v1/issues/bulk",
+        json={
+            "filter": {"assignee_id": user.id, "priority": "HIGH"},
+            "patch": {"assignee_id": None},
+            "return_rows": True,
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] >= 4
+    assert all(issue["assignee_id"] is None for issue in response.json()["issues"])
+
+
+def test_update_issues_bulk_invalid_requests():
+    """Test that ambiguous, empty or invalid bulk patches are rejected"""
+    response = client.patch(
+        "/api/v1/issues/bulk",
+        json={"ids": [1], "filter": {"status": "DONE"}, "patch": {"status": "DONE"}},
+    )
+    assert response.status_code == 400
+
+    response = client.patch(
+        "/api/v1/issues/bulk", json={"filter": {}, "patch": {"status": "DONE"}}
+    )
+    assert response.status_code == 400
+
+    response = client.patch("/api/v1/issues/bulk", json={"ids": [1], "patch": {}})
+    assert response.status_code == 400
+
+    response = client.patch(
+        "/api/v1/issues/bulk", json={"ids": [1], "patch": {"status": None}}
+    )
+    assert response.status_code == 400
+
+    response = client.patch(
+        "/api/v1/issues/bulk", json={"ids": [1], "patch": {"assignee_id": 99999}}
+    )
+    assert response.status_code == 404
+
+
+def test_get_issue_history():
+    """Test that every field change is recorded, newest first"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    issue = client.post(
+        "/api/v1/issues/",
+        json={
+            "title": "History Issue",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        },
+    ).json()
+    issue_id = issue["id"]
+
+    response = client.get(f"/api/v1/issues/{issue_id}/history")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    client.put(f"/api/v1/issues/{issue_id}", json={"title": "History Renamed"})
+    client.patch(f"/api/v1/issues/{issue_id}/status", json={"status": "IN_PROGRESS"})
+    client.patch(f"/api/v1/issues/{issue_id}/assign", json={"assignee_id": user.id})
+    client.patch(f"/api/v1/issues/{issue_id}/priority", json={"priority": "HIGH"})
+    # Setting a field to its current value is not a change
+    client.patch(f"/api/v1/issues/{issue_id}/priority", json={"priority": "HIGH"})
+
+    response = client.get(f"/api/v1/issues/{issue_id}/history")
+    assert response.status_code == 200
+    history = response.json()
+    assert [event["changes"] for event in history] == [
+        [{"field": "priority", "old_value": "LOW", "new_value": "HIGH"}],
+        [{"field": "assignee_id", "old_value": None, "new_value": user.id}],
+        [{"field": "status", "old_value": "TO_DO", "new_value": "IN_PROGRESS"}],
+        [
+            {
+                "field": "title",
+                "old_value": "History Issue",
+                "new_value": "History Renamed",
+            }
+        ],
+    ]
+
+    response = client.get(f"/api/v1/issues/{issue_id}/history?limit=3")
+    assert len(response.json()) == 3
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/api/v1/issues/{issue_id}/history?cursor={cursor}")
+    assert [event["id"] for event in response.json()] == [history[3]["id"]]
+
+
+def test_get_issue_history_records_bulk_updates():
+    """Test that bulk updates record history for the issues they change"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    items = [
+        {
+            "title": f"Bulk History Issue {i}",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        }
+        for i in range(2)
+    ]
+    ids = [
+        result["id"]
+        for result in client.post("/api/v1/issues/bulk", json=items).json()["results"]
+    ]
+    client.patch(f"/api/v1/issues/{ids[0]}/status", json={"status": "DONE"})
+
+    client.patch("/api/v1/issues/bulk", json={"ids": ids, "patch": {"status": "DONE"}})
+
+    first = client.get(f"/api/v1/issues/{ids[0]}/history").json()
+    second = client.get(f"/api/v1/issues/{ids[1]}/history").json()
+    assert len(first) == 1
+    assert second[0]["changes"] == [
+        {"field": "status", "old_value": "TO_DO", "new_value": "DONE"}
+    ]
+
+
+def test_get_issue_history_deleted_with_issue():
+    """Test that an issue's history is deleted with it, not inherited"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    payload = {
+        "title": "Deleted History Issue",
+        "issue_type": "TASK",
+        "priority": "LOW",
+        "project_id": project.id,
+        "reporter_id": user.id,
+    }
+    issue_id = client.post("/api/v1/issues/", json=payload).json()["id"]
+    client.patch(f"/api/v1/issues/{issue_id}/status", json={"status": "DONE"})
+    assert len(client.get(f"/api/v1/issues/{issue_id}/history").json()) == 1
+
+    client.delete(f"/api/v1/issues/{issue_id}")
+    # SQLite hands the id of the deleted last row to the next insert
+    reused = client.post("/api/v1/issues/", json=payload).json()
+    assert reused["id"] == issue_id
+    assert client.get(f"/api/v1/issues/{issue_id}/history").json() == []
+
+
+def test_get_issue_history_not_found():
+    """Test getting history of a non-existent issue"""
+    response = client.get("/api/v1/issues/99999/history")
+    assert response.status_code == 404
+
+
+def test_get_issues_sparse_fields():
+    """Test that fields limits both the response and the selected columns"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    client.post(
+        "/api/v1/issues/",
+        json={
+            "title": "Sparse Issue",
+            "description": "A long description the sidebar never shows",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        },
+    )
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(
+            f"/api/v1/issues/?project_id={project.id}&limit=1"
+            "&fields=id,key,title,status,assignee_id"
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert response.headers["X-Next-Cursor"]
+    issue = response.json()[0]
+    assert set(issue) == {"id", "key", "title", "status", "assignee_id"}
+    assert issue["key"].startswith(f"{project.key}-")
+    assert len(statements) == 1
+    assert "description" not in statements[0]
+
+
+def test_get_issues_invalid_fields():
+    """Test that unknown or empty field lists are rejected"""
+    response = client.get("/api/v1/issues/?fields=id,secret")
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+    response = client.get("/api/v1/issues/?fields=,")
+    assert response.status_code == 400
+
+
+def test_get_issues_facets():
+    """Test that facet counts cover every match, not just the page"""
+    user = setup_test_user()
+    db = TestingSessionLocal()
+    try:
+        project = Project(name="Facet Project", key="FACETS", owner_id=user.id)
+        db.add(project)
+        db.commit()
+        project_id = project.id
+    finally:
+        db.close()
+    for issue_type, priority, assignee_id in [
+        ("BUG", "HIGH", user.id),
+        ("BUG", "LOW", None),
+        ("TASK", "HIGH", user.id),
+    ]:
+        client.post(
+            "/api/v1/issues/",
+            json={
+                "title": "Faceted issue",
+                "issue_type": issue_type,
+                "priority": priority,
+                "project_id": project_id,
+                "reporter_id": user.id,
+                "assignee_id": assignee_id,
+            },
+        )
+
+    response = client.get(
+        f"/api/v1/issues/?project_id={project_id}&limit=1"
+        "&facets=priority,issue_type,assignee_id,status&fields=id"
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    facets = json.loads(response.headers["X-Facets"])
+    assert facets["priority"] == {"LOW": 1, "MEDIUM": 0, "HIGH": 2, "CRITICAL": 0}
+    assert facets["issue_type"]["BUG"] == 2
+    assert facets["issue_type"]["TASK"] == 1
+    assert facets["assignee_id"] == {str(user.id): 2, "none": 1}
+    assert sum(facets["status"].values()) == 3
+
+    response = client.get(
+        f"/api/v1/issues/?project_id={project_id}&priority=HIGH&facets=issue_type"
+    )
+    facets = json.loads(response.headers["X-Facets"])
+    assert facets == {"issue_type": {"TASK": 1, "BUG": 1, "STORY": 0, "EPIC": 0}}
+
+    response = client.get("/api/v1/issues/")
+    assert "X-Facets" not in response.headers
+    response = client.get("/api/v1/issues/?facets=status,reporter_id")
+    assert response.status_code == 400
+    assert "reporter_id" in response.json()["detail"]
+
+
+def test_get_issues_facets_capped(monkeypatch):
+    """Test that facets keep the largest values and sum the rest as other"""
+    from app.core.config import settings
+
+    user = setup_test_user()
+    db = TestingSessionLocal()
+    try:
+        project = Project(name="Facet Cap Project", key="FACETCAP", owner_id=user.id)
+        db.add(project)
+        db.commit()
+        project_id = project.id
+    finally:
+        db.close()
+    for assignee_id in [user.id, user.id, None]:
+        client.post(
+            "/api/v1/issues/",
+            json={
+                "title": "Capped facet issue",
+                "issue_type": "TASK",
+                "priority": "MEDIUM",
+                "project_id": project_id,
+                "reporter_id": user.id,
+                "assignee_id": assignee_id,
+            },
+        )
+    monkeypatch.setattr(settings, "FACET_MAX_BUCKETS", 1)
+
+    response = client.get(
+        f"/api/v1/issues/?project_id={project_id}&facets=assignee_id,priority"
+    )
+    assert response.status_code == 200
+    facets = json.loads(response.headers["X-Facets"])
+    assert facets["assignee_id"] == {str(user.id): 2, "other": 1}
+    assert facets["priority"] == {"MEDIUM": 3, "other": 0}
+
+
+def test_get_issue_conditional():
+    """Test ETag and Last-Modified revalidation of a single issue"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    issue_id = client.post(
+        "/api/v1/issues/",
+        json={
+            "title": "Conditional Issue",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        },
+    ).json()["id"]
+
+    response = client.get(f"/api/v1/issues/{issue_id}")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(
+            f"/api/v1/issues/{issue_id}", headers={"If-None-Match": etag}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 1
+    assert "description" not in statements[0]
+
+    response = client.get(
+        f"/api/v1/issues/{issue_id}", headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    # A change within the same second still produces a new tag
+    client.patch(f"/api/v1/issues/{issue_id}/priority", json={"priority": "HIGH"})
+    response = client.get(f"/api/v1/issues/{issue_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["priority"] == "HIGH"
+
+
+def test_bulk_update_changes_issue_etag():
+    """Test that set-based updates bump row versions too"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    issue_id = client.post(
+        "/api/v1/issues/",
+        json={
+            "title": "Bulk ETag Issue",
+            "issue_type": "TASK",
+            "priority": "LOW",
+            "project_id": project.id,
+            "reporter_id": user.id,
+        },
+    ).json()["id"]
+    etag = client.get(f"/api/v1/issues/{issue_id}").headers["ETag"]
+
+    client.patch(
+        "/api/v1/issues/bulk", json={"ids": [issue_id], "patch": {"status": "DONE"}}
+    )
+
+    response = client.get(f"/api/v1/issues/{issue_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_get_issue_tree():
+    """Test fetching an epic with nested stories and sub-tasks"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+
+    def create(title, issue_type, parent_id=None):
+        return client.post(
+            "/api/v1/issues/",
+            json={
+                "title": title,
+                "issue_type": issue_type,
+                "priority": "MEDIUM",
+                "project_id": project.id,
+                "reporter_id": user.id,
+                "parent_issue_id": parent_id,
+            },
+        ).json()["id"]
+
+    epic = create("Tree Epic", "EPIC")
+    story_a = create("Tree Story A", "STORY", epic)
+    story_b = create("Tree Story B", "STORY", epic)
+    task = create("Tree Task", "TASK", story_a)
+    client.patch(f"/api/v1/issues/{task}/status", json={"status": "DONE"})
+
+    response = client.get(f"/api/v1/issues/{epic}/tree")
+    assert response.status_code == 200
+    nodes = response.json()
+    assert [node["id"] for node in nodes] == [epic, story_a, task, story_b]
+    assert [node["depth"] for node in nodes] == [0, 1, 2, 1]
+    assert nodes[2]["path"] == [epic, story_a, task]
+    assert nodes[0]["status_counts"] == {
+        "TO_DO": 3,
+        "IN_PROGRESS": 0,
+        "IN_REVIEW": 0,
+        "DONE": 1,
+    }
+    assert nodes[1]["status_counts"]["DONE"] == 1
+    assert nodes[3]["status_counts"]["TO_DO"] == 1
+
+    response = client.get(f"/api/v1/issues/{epic}/tree?max_depth=1")
+    assert [node["id"] for node in response.json()] == [epic, story_a, story_b]
+
+    response = client.get(f"/api/v1/issues/{story_a}/tree")
+    assert [node["depth"] for node in response.json()] == [0, 1]
+
+
+def test_get_issue_tree_not_found():
+    """Test fetching the tree of a non-existent issue"""
+    response = client.get("/api/v1/issues/99999/tree")
+    assert response.status_code == 404
+
+
+def setup_ranked_issues(key, count):
+    """Create a project with count issues; returns the project and issue ids"""
+    user = setup_test_user()
+    db = TestingSessionLocal()
+    try:
+        project = Project(name=f"Rank {key}", key=key, owner_id=user.id)
+        db.add(project)
+        db.commit()
+        project_id = project.id
+    finally:
+        db.close()
+
+    issue_ids = []
+    for i in range(count):
+        response = client.post(
+            "/api/v1/issues/",
+            json={
+                "title": f"Ranked Issue {i}",
+                "issue_type": "TASK",
+                "priority": "LOW",
+                "project_id": project_id,
+                "reporter_id": user.id,
+            },
+        )
+        issue_ids.append(response.json()["id"])
+    return project_id, issue_ids
+
+
+def ranked_ids(project_id):
+    issues = client.get(f"/api/v1/issues/?project_id={project_id}").json()
+    return [issue["id"] for issue in sorted(issues, key=lambda i: (i["rank"], i["id"]))]
+
+
+def test_new_issues_are_ranked_last():
+    """Test that issues are ranked in creation order, bulk ones included"""
+    project_id, issue_ids = setup_ranked_issues("RANKNEW", 2)
+    user = setup_test_user()
+    response = client.post(
+        "/api/v1/issues/bulk",
+        json=[
+            {
+                "title": f"Bulk Ranked {i}",
+                "issue_type": "TASK",
+                "priority": "LOW",
+                "project_id": project_id,
+                "reporter_id": user.id,
+            }
+            for i in range(2)
+        ],
+    )
+    issue_ids += [result["id"] for result in response.json()["results"]]
+
+    assert ranked_ids(project_id) == issue_ids
+
+
+def test_rank_issue():
+    """Test moving an issue between, before and after its neighbours"""
+    project_id, (a, b, c, d) = setup_ranked_issues("RANKMOVE", 4)
+
+    response = client.patch(
+        f"/api/v1/issues/{d}/rank", json={"after_id": a, "before_id": b}
+    )
+    assert response.status_code == 200
+    assert ranked_ids(project_id) == [a, d, b, c]
+
+    # One neighbour: right next to it
+    client.patch(f"/api/v1/issues/{c}/rank", json={"before_id": a})
+    assert ranked_ids(project_id) == [c, a, d, b]
+    client.patch(f"/api/v1/issues/{c}/rank", json={"after_id": a})
+    assert ranked_ids(project_id) == [a, c, d, b]
+    client.patch(f"/api/v1/issues/{a}/rank", json={"after_id": b})
+    assert ranked_ids(project_id) == [c, d, b, a]
+
+
+def test_rank_issue_writes_one_row():
+    """Test that a move updates only the moved issue"""
+    project_id, issue_ids = setup_ranked_issues("RANKONE", 5)
+    updates = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            updates.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.patch(
+            f"/api/v1/issues/{issue_ids[4]}/rank",
+            json={"after_id": issue_ids[0], "before_id": issue_ids[1]},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert response.status_code == 200
+    assert len(updates) == 1
+    assert issue_ids[4] in updates[0][1]
+
+
+def test_rank_issue_rebalances_long_ranks():
+    """Test that repeated moves into one gap trigger a rebalance"""
+    project_id, (a, b, c) = setup_ranked_issues("RANKLONG", 3)
+
+    # Each move halves the gap between a and the issue moved before it
+    longest = 0
+    for _ in range(60):
+        order = ranked_ids(project_id)
+        moved = order[2]
+        response = client.patch(
+            f"/api/v1/issues/{moved}/rank", json={"after_id": a, "before_id": order[1]}
+        )
+        assert response.status_code == 200
+        longest = max(longest, len(response.json()["rank"]))
+        assert ranked_ids(project_id) == [a, moved, order[1]]
+
+    # Ranks grew past the limit and were spread out again
+    assert longest > 12
+    issues = client.get(f"/api/v1/issues/?project_id={project_id}").json()
+    assert max(len(issue["rank"]) for issue in issues) <= 12
+
+
+def test_rank_issue_separates_shared_ranks():
+    """Test that neighbours sharing a rank are spread out, not rejected"""
+    project_id, (a, b, c) = setup_ranked_issues("RANKDUP", 3)
+    db = TestingSessionLocal()
+    try:
+        rank = db.get(Issue, a).rank
+        db.get(Issue, b).rank = rank
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.patch(
+        f"/api/v1/issues/{c}/rank", json={"after_id": a, "before_id": b}
+    )
+    assert response.status_code == 200
+    assert ranked_ids(project_id) == [a, c, b]
+
+
+def test_rank_issue_invalid_requests():
+    """Test rank moves that name no, unknown or foreign neighbours"""
+    project_id, (a, b, c) = setup_ranked_issues("RANKBAD", 3)
+    _, (other,) = setup_ranked_issues("RANKOTHER", 1)
+
+    assert client.patch(f"/api/v1/issues/{a}/rank", json={}).status_code == 400
+    response = client.patch(f"/api/v1/issues/{a}/rank", json={"after_id": a})
+    assert response.status_code == 400
+    response = client.patch(f"/api/v1/issues/{a}/rank", json={"after_id": other})
+    assert response.status_code == 400
+    response = client.patch(f"/api/v1/issues/{a}/rank", json={"after_id": 99999})
+    assert response.status_code == 404
+    response = client.patch("/api/v1/issues/99999/rank", json={"after_id": a})
+    assert response.status_code == 404
+    # Neighbours given in the wrong order
+    response = client.patch(
+        f"/api/v1/issues/{a}/rank", json={"after_id": c, "before_id": b}
+    )
+    assert response.status_code == 400
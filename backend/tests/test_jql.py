@@ -0,0 +1,242 @@
+"""Tests for the JQL parser and compiler"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select, update
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import StaticPool
+
+from app.core.jql import (
+    ROW_COLUMNS,
+    And,
+    Clause,
+    JQLError,
+    Not,
+    Or,
+    OrderBy,
+    compile_order_by,
+    compile_where,
+    evaluate,
+    parse_jql,
+    project_keys,
+    sort_key,
+)
+from app.db.base import Base
+from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
+from app.models.project import Project
+from app.models.user import User
+
+
+def compiled_sql(jql):
+    query = parse_jql(jql)
+    statement = (
+        select(Issue.id)
+        .where(compile_where(query.where))
+        .order_by(*compile_order_by(query.order_by))
+    )
+    return str(statement.compile(dialect=sqlite.dialect()))
+
+
+def test_parse_precedence():
+    """Test that AND binds tighter than OR and NOT applies to one clause"""
+    query = parse_jql(
+        "project = web AND status IN (to_do, IN_PROGRESS) OR assignee = 12 "
+        "AND NOT priority = LOW ORDER BY priority DESC, created"
+    )
+    assert query.where == Or(
+        (
+            And(
+                (
+                    Clause("project", "=", ("WEB",)),
+                    Clause(
+                        "status", "in", (IssueStatus.TO_DO, IssueStatus.IN_PROGRESS)
+                    ),
+                )
+            ),
+            And(
+                (
+                    Clause("assignee", "=", (12,)),
+                    Not(Clause("priority", "=", (IssuePriority.LOW,))),
+                )
+            ),
+        )
+    )
+    assert query.order_by == (OrderBy("priority", True), OrderBy("created", False))
+
+
+def test_parse_is_cached():
+    """Test that the same query string reuses its parsed AST"""
+    jql = "sprint = 3 AND assignee IS EMPTY"
+    assert parse_jql(jql) is parse_jql(jql)
+
+
+def test_compile_is_parameterized():
+    """Test that values are bound as parameters, not spliced into SQL"""
+    sql = compiled_sql('project = 1 AND title ~ "\'; DROP TABLE issues; --"')
+    assert "DROP TABLE" not in sql
+    assert "issues.project_id = ?" in sql
+
+
+def test_compile_ranges_and_ordering():
+    """Test rank-ordered enum ranges and ORDER BY with a tie-breaker"""
+    sql = compiled_sql(
+        "created >= 2025-01-01 AND priority >= HIGH ORDER BY priority DESC"
+    )
+    assert "issues.created_at >= ?" in sql
+    assert "issues.priority IN" in sql
+    assert sql.rstrip().endswith("issues.id DESC")
+
+
+@pytest.mark.parametrize(
+    "jql",
+    [
+        "",
+        "ORDER BY created",
+        "priority = HIGH",
+        "title ~ crash",
+        "status != DONE",
+        "NOT project = 1",
+        "project = 1 OR priority = HIGH",
+        "assignee IS NOT EMPTY",
+    ],
+)
+def test_rejects_full_scans(jql):
+    """Test that queries without an indexed starting point are rejected"""
+    with pytest.raises(JQLError, match="scan"):
+        parse_jql(jql)
+
+
+@pytest.mark.parametrize(
+    ("jql", "message"),
+    [
+        ("colour = red", "Unknown field"),
+        ("status = STUCK", "Invalid status"),
+        ("assignee = bob", "numeric id"),
+        ("reporter IS EMPTY", "never empty"),
+        ("title = crash", "not supported"),
+        ("project = 1 AND (status = DONE", r"Expected \)"),
+        ("project = 1 status = DONE", "Unexpected"),
+        ("project = 1 ORDER BY title", "Cannot order"),
+        ("project = 1 AND created > yesterday", "ISO date"),
+    ],
+)
+def test_rejects_invalid_queries(jql, message):
+    """Test that malformed queries report what is wrong"""
+    with pytest.raises(JQLError, match=message):
+        parse_jql(jql)
+
+
+@pytest.fixture(scope="module")
+def issue_rows():
+    """An in-memory database with issues covering NULLs and every status"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User.__table__),
+            [{"id": 1, "username": "a", "email": "a@x", "hashed_password": "h"}],
+        )
+        connection.execute(
+            insert(Project.__table__),
+            [
+                {"id": 1, "name": "Web", "key": "WEB", "owner_id": 1},
+                {"id": 2, "name": "Api", "key": "API", "owner_id": 1},
+            ],
+        )
+        connection.execute(
+            insert(Issue.__table__),
+            [
+                {
+                    "id": i + 1,
+                    "number": i + 1,
+                    "issue_key": f"{'WEB' if i % 2 else 'API'}-{i + 1}",
+                    "rank": f"{i + 1:07d}i",
+                    "project_id": 1 if i % 2 else 2,
+                    "title": f"Crash number {i}" if i % 3 else f"Feature {i}",
+                    "description": None if i % 4 == 0 else f"Steps {i}",
+                    "status": list(IssueStatus)[i % 4],
+                    "priority": list(IssuePriority)[i % 4],
+                    "issue_type": IssueType.BUG,
+                    "assignee_id": None if i % 3 == 0 else 1,
+                    "reporter_id": 1,
+                    "created_at": datetime(2025, 1, 1 + i, 6 * (i % 3)),
+                }
+                for i in range(12)
+            ],
+        )
+        # Timestamps written by the database default carry no microseconds
+        connection.execute(
+            update(Issue.__table__)
+            .where(Issue.id % 2 == 0)
+            .values(created_at=func.datetime(Issue.created_at))
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "jql",
+    [
+        "project = WEB AND status IN (TO_DO, IN_PROGRESS)",
+        "project IN (WEB, NOPE) OR assignee IS EMPTY",
+        "project NOT IN (WEB, NOPE) AND id > 0",
+        "assignee != 1 AND project = 1",
+        "assignee NOT IN (2) AND created >= 2025-01-05",
+        "created = 2025-01-03 OR created = 2025-01-04T00:00:00",
+        "created != 2025-01-04 AND project = WEB",
+        "created > 2025-01-03 AND created <= 2025-01-06",
+        "created < 2025-01-04 OR created >= 2025-01-11T00:00:00.5",
+        "created = 2025-01-04T06:00:00 OR created = 2025-01-09T00:00:00",
+        "created < 2025-01-03T06:00:00 OR created >= 2025-01-12T12:00:00",
+        "project = API AND NOT text ~ steps",
+        "project = WEB AND description !~ 3 ORDER BY priority DESC",
+        "status < DONE AND priority >= HIGH ORDER BY key DESC",
+    ],
+)
+def test_evaluate_agrees_with_sql(issue_rows, jql):
+    """Test that evaluating rows in Python matches the compiled query"""
+    query = parse_jql(jql)
+    with issue_rows.connect() as connection:
+        expected = connection.scalars(
+            select(Issue.id)
+            .where(compile_where(query.where))
+            .order_by(*compile_order_by(query.order_by))
+        ).all()
+        project_ids = dict.fromkeys(project_keys(query.where))
+        project_ids.update(
+            connection.execute(
+                select(Project.key, Project.id).where(
+                    Project.key.in_(list(project_ids))
+                )
+            ).all()
+        )
+        rows = connection.execute(select(*ROW_COLUMNS)).all()
+
+    matches = [row for row in rows if evaluate(query.where, row, project_ids)]
+    matches.sort(key=lambda row: sort_key(query.order_by, row))
+    assert [row.id for row in matches] == expected
+
+
+def test_date_matches_whole_day(issue_rows):
+    """Test that a date without a time compares as the whole day"""
+    with issue_rows.connect() as connection:
+        rows = connection.execute(select(*ROW_COLUMNS)).all()
+
+        def matching(jql):
+            where = parse_jql(jql).where
+            found = connection.scalars(
+                select(Issue.id).where(compile_where(where)).order_by(Issue.id)
+            ).all()
+            assert found == [row.id for row in rows if evaluate(where, row, {})]
+            return found
+
+        # Issue 3 was created at noon, issue 2 at 06:00
+        assert matching("created = 2025-01-03 AND id > 0") == [3]
+        assert 3 not in matching("created != 2025-01-03 AND id > 0")
+        assert matching("created <= 2025-01-02 AND id > 0") == [1, 2]
+        assert matching("created > 2025-01-02 AND id < 4") == [3]
@@ -1,5 +1,9 @@
 """Tests for projects API endpoints"""
 
+import csv
+import io
+import json
+
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -202,3 +206,79 @@ def test_get_project_stats():
     assert "open_issues" in data
     assert "done_issues" in data
     assert "total_members" in data
+
+
+def test_get_project_issues_sparse_fields():
+    """Test requesting a subset of issue fields for a project"""
+    user = setup_test_user()
+    project_data = {
+        "name": "Sparse Project",
+        "key": "SPARSE",
+        "owner_id": user.id,
+    }
+    project_id = client.post("/api/v1/projects/", json=project_data).json()["id"]
+    client.post(
+        "/api/v1/issues/",
+        json={
+            "title": "Project Sparse Issue",
+            "description": "Long text",
+            "issue_type": "BUG",
+            "priority": "HIGH",
+            "project_id": project_id,
+            "reporter_id": user.id,
+        },
+    )
+
+    response = client.get(f"/api/v1/projects/{project_id}/issues?fields=key,title")
+    assert response.status_code == 200
+    assert response.json() == [{"key": "SPARSE-1", "title": "Project Sparse Issue"}]
+
+
+def test_export_project_issues(monkeypatch):
+    """Test streaming a project's issues as NDJSON and CSV"""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    user = setup_test_user()
+    project_data = {"name": "Export Project", "key": "EXPORT", "owner_id": user.id}
+    project_id = client.post("/api/v1/projects/", json=project_data).json()["id"]
+    for i in range(5):
+        client.post(
+            "/api/v1/issues/",
+            json={
+                "title": f"Export Issue {i}",
+                "description": "Line one\nline two, with a comma",
+                "issue_type": "TASK",
+                "priority": "LOW",
+                "project_id": project_id,
+                "reporter_id": user.id,
+            },
+        )
+
+    response = client.get(f"/api/v1/projects/{project_id}/issues/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "EXPORT-issues.ndjson" in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["key"] for row in rows] == [f"EXPORT-{i}" for i in range(1, 6)]
+    assert rows[0]["status"] == "TO_DO"
+    assert rows[0]["description"] == "Line one\nline two, with a comma"
+
+    response = client.get(
+        f"/api/v1/projects/{project_id}/issues/export?format=csv&fields=key,description"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["key", "description"]
+    assert rows[1] == ["EXPORT-1", "Line one\nline two, with a comma"]
+    assert len(rows) == 6
+
+
+def test_export_project_issues_errors():
+    """Test exporting from a missing project or in an unknown format"""
+    response = client.get("/api/v1/projects/99999/issues/export")
+    assert response.status_code == 404
+
+    response = client.get("/api/v1/projects/99999/issues/export?format=xml")
+    assert response.status_code == 422
@@ -0,0 +1,396 @@
+"""Regression tests that hot routes are served from indexes, not table scans"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.parse import quote
+
+import pytest
+from sqlalchemy import event
+
+from app.db.base import get_engine
+from app.models.issue import Comment, Issue, IssuePriority, IssueStatus, IssueType
+from app.models.notification import Notification, NotificationType
+from app.models.project import Project
+from app.models.sprint import Sprint
+from app.models.user import User
+
+INDEXED_TABLES = (
+    "issues",
+    "comments",
+    "notifications",
+    "issue_events",
+    "issue_status_counts",
+)
+
+
+@pytest.fixture
+def engine(db_session):
+    """The engine the test client's requests run their queries on"""
+    return get_engine(db_session)
+
+
+def setup_test_data(db):
+    """Create one row in every table the hot routes read"""
+    user = db.query(User).filter(User.username == "plantestuser").first()
+    if not user:
+        user = User(
+            username="plantestuser",
+            email="plantest@example.com",
+            hashed_password="hashed",
+            full_name="Plan Test User",
+        )
+        db.add(user)
+        db.commit()
+
+    project = db.query(Project).filter(Project.key == "PLAN").first()
+    if not project:
+        project = Project(name="Plan Project", key="PLAN", owner_id=user.id)
+        db.add(project)
+        db.commit()
+
+    sprint = Sprint(
+        name="Plan Sprint",
+        project_id=project.id,
+        start_date=datetime.now(),
+        end_date=datetime.now() + timedelta(days=14),
+    )
+    db.add(sprint)
+    db.commit()
+
+    issue = Issue(
+        title="Plan Issue",
+        status=IssueStatus.TO_DO,
+        priority=IssuePriority.MEDIUM,
+        issue_type=IssueType.TASK,
+        project_id=project.id,
+        reporter_id=user.id,
+        assignee_id=user.id,
+        sprint_id=sprint.id,
+    )
+    db.add(issue)
+    db.commit()
+
+    db.add(Comment(body="Plan comment", issue_id=issue.id, author_id=user.id))
+    db.add(
+        Notification(
+            type=NotificationType.DIRECT,
+            title="Plan notification",
+            description="Plan notification",
+            author="plantestuser",
+            user_id=user.id,
+        )
+    )
+    db.commit()
+    return {
+        "user_id": user.id,
+        "project_id": project.id,
+        "sprint_id": sprint.id,
+        "issue_id": issue.id,
+    }
+
+
+@contextmanager
+def capture_selects(engine):
+    """Collect every query sent to the database with its parameters"""
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def assert_index_only_plan(client, engine, path, allow_sort=False):
+    """
+    Request a path and check the query plan of every query it ran.
+    With allow_sort, sorting the rows found through an index is accepted.
+    """
+    with capture_selects(engine) as statements:
+        response = client.get(path)
+    assert response.status_code == 200
+    assert statements
+
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            for row in plan:
+                detail = row[-1]
+                for table in INDEXED_TABLES:
+                    full_scan = detail.startswith(f"SCAN {table}") and (
+                        "USING" not in detail
+                    )
+                    assert not full_scan, f"{path}: {detail}\n{statement}"
+                if not allow_sort:
+                    assert "USE TEMP B-TREE" not in detail, f"{path}: {detail}"
+
+
+def test_get_issues_plans(client, db_session, engine):
+    """Test that issue listing filters and sorting use indexes"""
+    data = setup_test_data(db_session)
+    assert_index_only_plan(client, engine, "/api/v1/issues/")
+    assert_index_only_plan(
+        client, engine, f"/api/v1/issues/?project_id={data['project_id']}"
+    )
+    assert_index_only_plan(
+        client, engine, f"/api/v1/issues/?assignee_id={data['user_id']}"
+    )
+    assert_index_only_plan(
+        client, engine, f"/api/v1/issues/?sprint_id={data['sprint_id']}"
+    )
+    assert_index_only_plan(client, engine, "/api/v1/issues/?status=IN_PROGRESS")
+
+
+def test_get_notifications_plans(client, db_session, engine):
+    """Test that notification listing and unread counts use indexes"""
+    data = setup_test_data(db_session)
+    assert_index_only_plan(
+        client, engine, f"/api/v1/notifications/?user_id={data['user_id']}"
+    )
+    assert_index_only_plan(
+        client,
+        engine,
+        f"/api/v1/notifications/?user_id={data['user_id']}&unread_only=true",
+    )
+    assert_index_only_plan(
+        client, engine, f"/api/v1/notifications/unread/count?user_id={data['user_id']}"
+    )
+
+
+def test_get_comments_plans(client, db_session, engine):
+    """Test that comments are fetched by issue through an index"""
+    data = setup_test_data(db_session)
+    assert_index_only_plan(
+        client, engine, f"/api/v1/issues/{data['issue_id']}/comments"
+    )
+    assert_index_only_plan(
+        client, engine, f"/api/v1/comments/?issue_id={data['issue_id']}"
+    )
+
+
+def test_sprint_plans(client, db_session, engine):
+    """Test that sprint issue lists and stats use indexes"""
+    data = setup_test_data(db_session)
+    assert_index_only_plan(
+        client, engine, f"/api/v1/sprints/{data['sprint_id']}/issues"
+    )
+    assert_index_only_plan(
+        client, engine, f"/api/v1/sprints/{data['sprint_id']}/issues?order=rank"
+    )
+    assert_index_only_plan(client, engine, f"/api/v1/sprints/{data['sprint_id']}/stats")
+
+
+def test_cursor_pagination_plans(client, db_session, engine):
+    """Test that following a cursor seeks the index instead of skipping rows"""
+    data = setup_test_data(db_session)
+    for _ in range(3):
+        setup_test_data(db_session)
+
+    response = client.get(f"/api/v1/issues/?project_id={data['project_id']}&limit=2")
+    cursor = response.headers["X-Next-Cursor"]
+
+    assert_index_only_plan(
+        client,
+        engine,
+        f"/api/v1/issues/?project_id={data['project_id']}&limit=2&cursor={cursor}",
+    )
+    assert_index_only_plan(client, engine, f"/api/v1/issues/?limit=2&cursor={cursor}")
+    assert_index_only_plan(
+        client,
+        engine,
+        f"/api/v1/users/{data['user_id']}/issues?assigned=false&cursor={cursor}",
+    )
+
+
+def test_issue_key_lookup_plan(client, db_session, engine):
+    """Test that resolving an issue key is a single index probe"""
+    data = setup_test_data(db_session)
+    issue_key = client.get(f"/api/v1/issues/{data['issue_id']}").json()["key"]
+
+    with capture_selects(engine) as statements:
+        response = client.get(f"/api/v1/issues/key/{issue_key}")
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+    assert_index_only_plan(client, engine, f"/api/v1/issues/key/{issue_key}")
+
+
+def test_issue_history_plans(client, db_session, engine):
+    """Test that history pages are read in index order"""
+    data = setup_test_data(db_session)
+    client.patch(f"/api/v1/issues/{data['issue_id']}/status", json={"status": "DONE"})
+    client.patch(
+        f"/api/v1/issues/{data['issue_id']}/priority", json={"priority": "LOW"}
+    )
+
+    response = client.get(f"/api/v1/issues/{data['issue_id']}/history?limit=1")
+    cursor = response.headers["X-Next-Cursor"]
+
+    assert_index_only_plan(client, engine, f"/api/v1/issues/{data['issue_id']}/history")
+    assert_index_only_plan(
+        client,
+        engine,
+        f"/api/v1/issues/{data['issue_id']}/history?limit=1&cursor={cursor}",
+    )
+
+
+def test_export_plan(client, db_session, engine):
+    """Test that the streamed export walks an index in order without sorting"""
+    data = setup_test_data(db_session)
+    assert_index_only_plan(
+        client, engine, f"/api/v1/projects/{data['project_id']}/issues/export"
+    )
+
+
+def test_issue_tree_plan(client, db_session, engine):
+    """Test that each level of the subtree is found through the parent index"""
+    data = setup_test_data(db_session)
+    assert_index_only_plan(client, engine, f"/api/v1/issues/{data['issue_id']}/tree")
+
+
+def test_jql_plans(client, db_session, engine):
+    """Test that accepted JQL queries start from an index"""
+    data = setup_test_data(db_session)
+    for jql in (
+        "project = PLAN AND title ~ plan",
+        f"assignee = {data['user_id']} OR sprint = {data['sprint_id']}",
+        "status IN (TO_DO, DONE) AND priority = MEDIUM",
+        f"parent = {data['issue_id']}",
+        "created >= 2020-01-01 AND created < 2100-01-01",
+    ):
+        assert_index_only_plan(
+            client, engine, f"/api/v1/search/jql?q={quote(jql)}", allow_sort=True
+        )
+
+
+def test_full_text_search_plans(client, db_session, engine):
+    """Test that text search reads the FTS index instead of scanning issues"""
+    setup_test_data(db_session)
+    assert_index_only_plan(
+        client, engine, "/api/v1/search/issues?q=plan", allow_sort=True
+    )
+    assert_index_only_plan(
+        client, engine, "/api/v1/search/?q=plan&type=issue", allow_sort=True
+    )
+    assert_index_only_plan(
+        client, engine, "/api/v1/issues/?search=plan", allow_sort=True
+    )
+
+
+def test_facet_plans(client, db_session, engine):
+    """Test that facet counts aggregate matches found through an index"""
+    data = setup_test_data(db_session)
+    facets = "status,priority,issue_type,assignee_id"
+    assert_index_only_plan(
+        client,
+        engine,
+        f"/api/v1/issues/?project_id={data['project_id']}&facets={facets}",
+        allow_sort=True,
+    )
+    assert_index_only_plan(
+        client, engine, f"/api/v1/search/issues?q=plan&facets={facets}", allow_sort=True
+    )
+
+
+def test_board_snapshot_plan(client, db_session, engine):
+    """Test that each board column reads its issues through an index"""
+    data = setup_test_data(db_session)
+    board = client.post(
+        "/api/v1/boards/",
+        json={
+            "name": "Plan Board",
+            "project_id": data["project_id"],
+            "board_type": "kanban",
+        },
+    ).json()
+    for name in ("To Do", "In Progress", "Done"):
+        client.post(f"/api/v1/boards/{board['id']}/columns", json={"name": name})
+    # Only the few rows picked per column are sorted into one list
+    assert_index_only_plan(
+        client, engine, f"/api/v1/boards/{board['id']}/snapshot", allow_sort=True
+    )
+
+
+def test_board_counts_plan(client, db_session, engine):
+    """Test that board header counts read counters instead of issues"""
+    data = setup_test_data(db_session)
+    board = client.post(
+        "/api/v1/boards/",
+        json={
+            "name": "Plan Board",
+            "project_id": data["project_id"],
+            "board_type": "kanban",
+        },
+    ).json()
+    for name in ("To Do", "In Progress", "Done"):
+        client.post(f"/api/v1/boards/{board['id']}/columns", json={"name": name})
+    with capture_selects(engine) as statements:
+        response = client.get(f"/api/v1/boards/{board['id']}/counts")
+    assert response.status_code == 200
+    assert not any("FROM issues" in statement for statement, _ in statements)
+    # Only the board's columns are sorted by position
+    assert_index_only_plan(
+        client, engine, f"/api/v1/boards/{board['id']}/counts", allow_sort=True
+    )
+
+
+def test_board_column_issues_plan(client, db_session, engine):
+    """Test that a column's status IN (...) filter uses an index"""
+    data = setup_test_data(db_session)
+    board = client.post(
+        "/api/v1/boards/",
+        json={
+            "name": "Plan Board",
+            "project_id": data["project_id"],
+            "board_type": "kanban",
+        },
+    ).json()
+    column = client.post(
+        f"/api/v1/boards/{board['id']}/columns",
+        json={"name": "Active", "statuses": ["IN_PROGRESS", "IN_REVIEW"]},
+    ).json()
+    # The newest page of the matched statuses is merged with a sort
+    assert_index_only_plan(
+        client,
+        engine,
+        f"/api/v1/boards/{board['id']}/issues?column_id={column['id']}",
+        allow_sort=True,
+    )
+
+
+def test_rank_plans(client, db_session, engine):
+    """Test that rank moves and rank-ordered lists seek the rank indexes"""
+    data = setup_test_data(db_session)
+    other = setup_test_data(db_session)
+    board = client.post(
+        "/api/v1/boards/",
+        json={
+            "name": "Plan Board",
+            "project_id": data["project_id"],
+            "board_type": "kanban",
+        },
+    ).json()
+    assert_index_only_plan(
+        client, engine, f"/api/v1/boards/{board['id']}/issues?order=rank"
+    )
+
+    with capture_selects(engine) as statements:
+        response = client.patch(
+            f"/api/v1/issues/{data['issue_id']}/rank",
+            json={"after_id": other["issue_id"]},
+        )
+    assert response.status_code == 200
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            for row in plan:
+                assert not row[-1].startswith("SCAN issues"), row[-1]
+                assert "USE TEMP B-TREE" not in row[-1], row[-1]
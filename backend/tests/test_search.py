@@ -1,10 +1,13 @@
 """Tests for search API endpoints"""
 
+import json
+
 from fastapi.testclient import TestClient
 from passlib.context import CryptContext
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.core.search_cache import get_search_cache
 from app.db.base import Base, get_db
 from app.main import app
 from app.models.issue import Issue, IssuePriority, IssueStatus, IssueType
@@ -207,3 +210,317 @@ def test_search_invalid_status():
 def test_search_min_length():
     response = client.get("/api/v1/search/?q=")
     assert response.status_code == 422
+
+
+def test_search_jql():
+    user = setup_test_user()
+    project = setup_test_project(user.id, key="JQL")
+    low = setup_test_issue(project.id, user.id, "JQL Low")
+    high = setup_test_issue(project.id, user.id, "JQL High")
+    done = setup_test_issue(project.id, user.id, "JQL Done")
+    client.patch(f"/api/v1/issues/{high.id}/priority", json={"priority": "HIGH"})
+    client.patch(f"/api/v1/issues/{done.id}/status", json={"status": "DONE"})
+
+    response = client.get(
+        "/api/v1/search/jql",
+        params={
+            "q": "project = JQL AND status IN (TO_DO, IN_PROGRESS) "
+            "ORDER BY priority DESC"
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [issue["id"] for issue in data] == [high.id, low.id]
+    assert data[0]["key"].startswith("JQL-")
+
+    response = client.get(
+        "/api/v1/search/jql",
+        params={
+            "q": f"project = {project.id} AND (status = DONE OR priority > MEDIUM)"
+        },
+    )
+    assert {issue["id"] for issue in response.json()} == {high.id, done.id}
+
+    response = client.get(
+        "/api/v1/search/jql",
+        params={"q": "project = JQL AND NOT status = DONE AND title ~ low"},
+    )
+    assert [issue["id"] for issue in response.json()] == [low.id]
+
+
+def test_search_jql_rejected():
+    response = client.get("/api/v1/search/jql", params={"q": "title ~ crash"})
+    assert response.status_code == 400
+    assert "scan" in response.json()["detail"]
+
+    response = client.get("/api/v1/search/jql", params={"q": "status = STUCK"})
+    assert response.status_code == 400
+
+
+def test_search_issues_ranked_full_text():
+    user = setup_test_user()
+    project = setup_test_project(user.id, "FTS")
+    in_title = setup_test_issue(project.id, user.id, "Zebraphone crashes on start")
+    in_comment = setup_test_issue(project.id, user.id, "Unrelated issue")
+    response = client.post(
+        f"/api/v1/comments/?author_id={user.id}",
+        json={"body": "Same zebraphone problem here", "issue_id": in_comment.id},
+    )
+    assert response.status_code == 201
+    comment_id = response.json()["id"]
+
+    # The last word is a prefix and title matches outrank comment matches
+    response = client.get("/api/v1/search/issues", params={"q": "zebrapho"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [issue["id"] for issue in data] == [in_title.id, in_comment.id]
+    assert "<mark>Zebraphone</mark>" in data[0]["snippet"]
+
+    response = client.get("/api/v1/search/issues", params={"q": "zebraphone start"})
+    assert [issue["id"] for issue in response.json()] == [in_title.id]
+
+    # Triggers keep the index in sync with comment edits and deletes
+    client.put(f"/api/v1/comments/{comment_id}", json={"body": "Works for me"})
+    response = client.get("/api/v1/search/issues", params={"q": "zebraphone"})
+    assert [issue["id"] for issue in response.json()] == [in_title.id]
+    response = client.get("/api/v1/issues/", params={"search": "works"})
+    assert in_comment.id in [issue["id"] for issue in response.json()]
+
+    client.delete(f"/api/v1/issues/{in_title.id}")
+    response = client.get("/api/v1/search/", params={"q": "zebraphone"})
+    assert [r["id"] for r in response.json()["results"] if r["type"] == "issue"] == []
+
+
+def test_search_issues_query_syntax_is_literal():
+    for q in ['title:foo OR "', "NEAR(a b", "***", "-"]:
+        response = client.get("/api/v1/search/issues", params={"q": q})
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+
+
+def test_search_ranks_all_types_together():
+    user = setup_test_user("zorblax", "zorblax@example.com")
+    db = TestingSessionLocal()
+    try:
+        project = Project(name="Zorblax", key="ZORB", owner_id=user.id)
+        db.add(project)
+        db.commit()
+        db.refresh(project)
+    finally:
+        db.close()
+    for title in ["Zorblax launch", "Zorblax docking", "Refuel the zorblax"]:
+        setup_test_issue(project.id, user.id, title)
+
+    response = client.get("/api/v1/search/", params={"q": "zorblax", "limit": 100})
+    assert response.status_code == 200
+    data = response.json()
+    results = data["results"]
+    assert [r["type"] for r in results[:2]] == ["user", "project"]
+    assert {r["type"] for r in results[2:]} == {"issue"}
+    scores = [r["score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+    assert data["totals"] == {"issue": 3, "project": 1, "user": 1}
+    assert data["total"] == len(results) == 5
+
+
+def test_search_cursor_pages_match_single_page():
+    user = setup_test_user()
+    project = setup_test_project(user.id, "QUUX")
+    for i in range(5):
+        setup_test_issue(project.id, user.id, f"Quuxly item {i}")
+    setup_test_user("quuxly", "quuxly@example.com")
+
+    full = client.get("/api/v1/search/", params={"q": "quuxly", "limit": 100})
+    expected = [(r["type"], r["id"]) for r in full.json()["results"]]
+    assert len(expected) == 6
+
+    seen = []
+    params = {"q": "quuxly", "limit": 2}
+    while True:
+        response = client.get("/api/v1/search/", params=params)
+        assert response.status_code == 200
+        assert response.json()["total"] == 6
+        seen += [(r["type"], r["id"]) for r in response.json()["results"]]
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {"q": "quuxly", "limit": 2, "cursor": next_cursor}
+    assert seen == expected
+
+    response = client.get(
+        "/api/v1/search/", params={"q": "quuxly", "skip": 2, "limit": 2}
+    )
+    assert [(r["type"], r["id"]) for r in response.json()["results"]] == expected[2:4]
+
+
+def test_search_invalid_type_and_cursor():
+    response = client.get("/api/v1/search/", params={"q": "x", "type": "board"})
+    assert response.status_code == 400
+    response = client.get("/api/v1/search/", params={"q": "x", "cursor": "nope"})
+    assert response.status_code == 400
+
+
+def suggest(q, **params):
+    response = client.get("/api/v1/search/suggest", params={"q": q, **params})
+    assert response.status_code == 200
+    return [(r["type"], r["label"]) for r in response.json()]
+
+
+def test_suggest_names_and_issue_keys():
+    user = setup_test_user("vantorek", "vantorek@example.com")
+    db = TestingSessionLocal()
+    try:
+        db.add(Project(name="Vantage Point", key="VANT", owner_id=user.id))
+        db.commit()
+        project = db.query(Project).filter(Project.key == "VANT").one()
+    finally:
+        db.close()
+    issue_ids = [setup_test_issue(project.id, user.id).id for _ in range(12)]
+
+    # Prefix of any word, ranked by how much of the term is typed
+    assert suggest("vant") == [("project", "Vantage Point"), ("user", "vantorek")]
+    assert suggest("point") == [("project", "Vantage Point")]
+    assert suggest("vant", type="user") == [("user", "vantorek")]
+    # A typo still finds the user, below every prefix match
+    assert ("user", "vantorek") in suggest("vantroek")
+
+    assert suggest("vant-1", type="issue") == [
+        ("issue", "VANT-1"),
+        ("issue", "VANT-10"),
+        ("issue", "VANT-11"),
+        ("issue", "VANT-12"),
+    ]
+    newest = client.get(
+        "/api/v1/search/suggest", params={"q": "VANT-", "limit": 2}
+    ).json()
+    assert [r["id"] for r in newest] == issue_ids[:-3:-1]
+    assert newest[0]["url"] == f"/api/v1/issues/{issue_ids[-1]}"
+
+    response = client.get("/api/v1/search/suggest", params={"q": "x", "type": "board"})
+    assert response.status_code == 400
+
+
+def test_suggest_follows_changes():
+    owner = setup_test_user()
+    project = setup_test_project(owner.id, "WOMBLE")
+    suggest("warm")
+
+    response = client.post(
+        "/api/v1/users/",
+        json={
+            "username": "wombleton",
+            "email": "wombleton@example.com",
+            "password": "password123",
+            "full_name": "Orinoco Wombleton",
+        },
+    )
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+    assert suggest("orinoco") == [("user", "wombleton")]
+
+    issue = setup_test_issue(project.id, owner.id)
+    kept = setup_test_issue(project.id, owner.id)
+    assert suggest(issue.issue_key, type="issue") == [("issue", issue.issue_key)]
+    client.delete(f"/api/v1/issues/{issue.id}")
+    assert suggest(issue.issue_key, type="issue") == []
+    assert suggest(kept.issue_key, type="issue") == [("issue", kept.issue_key)]
+
+    # Deleting a user deactivates it, which removes it from suggestions
+    client.delete(f"/api/v1/users/{user_id}")
+    assert suggest("orinoco") == []
+
+
+def cache_stats():
+    response = client.get("/api/v1/search/cache")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_search_cache_hits_and_write_invalidation():
+    user = setup_test_user()
+    project = setup_test_project(user.id, "GRIBBLE")
+    setup_test_issue(project.id, user.id, "Gribble pump")
+
+    def titles():
+        response = client.get("/api/v1/search/issues", params={"q": "gribble"})
+        assert response.status_code == 200
+        return [issue["title"] for issue in response.json()]
+
+    before = cache_stats()
+    assert titles() == ["Gribble pump"]
+    # Queries differing only in ASCII case share an entry
+    response = client.get("/api/v1/search/issues", params={"q": "GRIBBLE"})
+    assert [issue["title"] for issue in response.json()] == ["Gribble pump"]
+    stats = cache_stats()
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["hits"] == before["hits"] + 1
+
+    # A user write leaves issue searches cached
+    setup_test_user("gribbler", "gribbler@example.com")
+    titles()
+    assert cache_stats()["hits"] == before["hits"] + 2
+
+    # An issue write makes the next lookup recompute
+    setup_test_issue(project.id, user.id, "Gribble valve")
+    assert sorted(titles()) == ["Gribble pump", "Gribble valve"]
+    stats = cache_stats()
+    assert stats["invalidations"] == before["invalidations"] + 1
+    assert stats["misses"] == before["misses"] + 2
+
+    # Comments are searched too, so a new comment invalidates as well
+    hose = setup_test_issue(project.id, user.id, "Gribble hose")
+    assert client.get("/api/v1/search/issues", params={"q": "wobbly"}).json() == []
+    response = client.post(
+        f"/api/v1/comments/?author_id={user.id}",
+        json={"body": "The hose is wobbly", "issue_id": hose.id},
+    )
+    assert response.status_code == 201
+    response = client.get("/api/v1/search/issues", params={"q": "wobbly"})
+    assert [issue["id"] for issue in response.json()] == [hose.id]
+
+
+def test_search_cache_expiry_and_eviction(monkeypatch):
+    cache = get_search_cache(engine)
+    monkeypatch.setattr(cache, "max_size", 2)
+    before = cache_stats()
+    for q in ["evict-a", "evict-b", "evict-c"]:
+        client.get("/api/v1/search/users", params={"q": q})
+    stats = cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] >= before["evictions"] + 1
+
+    monkeypatch.setattr(cache, "ttl", 0)
+    client.get("/api/v1/search/users", params={"q": "expire"})
+    client.get("/api/v1/search/users", params={"q": "expire"})
+    stats = cache_stats()
+    assert stats["expirations"] == before["expirations"] + 1
+
+
+def test_search_issues_facets():
+    user = setup_test_user()
+    project = setup_test_project(user.id, "FACETED")
+    for title in ["Snorkel mask", "Snorkel fins", "Diving snorkel"]:
+        setup_test_issue(project.id, user.id, title)
+    setup_test_issue(project.id, user.id, "Unrelated wetsuit")
+
+    response = client.get(
+        "/api/v1/search/issues",
+        params={"q": "snorkel", "limit": 1, "facets": "status,assignee_id"},
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    facets = json.loads(response.headers["X-Facets"])
+    assert facets["status"]["TO_DO"] == 3
+    assert facets["assignee_id"] == {"none": 3}
+
+    # Served from the cache, facets included
+    response = client.get(
+        "/api/v1/search/issues",
+        params={"q": "snorkel", "limit": 1, "facets": "status,assignee_id"},
+    )
+    assert json.loads(response.headers["X-Facets"]) == facets
+
+    response = client.get(
+        "/api/v1/search/issues", params={"q": "snorkel", "facets": "votes"}
+    )
+    assert response.status_code == 400
@@ -262,6 +262,80 @@ def test_get_sprint_issues():
     assert isinstance(response.json(), list)
 
 
+def test_get_sprint_issues_ranked():
+    """Test listing a sprint backlog in its manual order, page by page"""
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    start_date = datetime.now()
+    sprint_id = client.post(
+        "/api/v1/sprints/",
+        json={
+            "name": "Ranked Sprint",
+            "project_id": project.id,
+            "start_date": start_date.isoformat(),
+            "end_date": (start_date + timedelta(days=14)).isoformat(),
+        },
+    ).json()["id"]
+    issue_ids = [
+        client.post(
+            "/api/v1/issues/",
+            json={
+                "title": f"Backlog item {i}",
+                "issue_type": "TASK",
+                "priority": "LOW",
+                "project_id": project.id,
+                "reporter_id": user.id,
+                "sprint_id": sprint_id,
+            },
+        ).json()["id"]
+        for i in range(3)
+    ]
+    client.patch(
+        f"/api/v1/issues/{issue_ids[2]}/rank", json={"before_id": issue_ids[0]}
+    )
+
+    response = client.get(f"/api/v1/sprints/{sprint_id}/issues?order=rank&limit=2")
+    assert response.status_code == 200
+    first_page = [issue["id"] for issue in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(
+        f"/api/v1/sprints/{sprint_id}/issues?order=rank&limit=2&cursor={cursor}"
+    )
+    second_page = [issue["id"] for issue in response.json()]
+    assert first_page + second_page == [issue_ids[2], issue_ids[0], issue_ids[1]]
+
+
+def test_get_sprint_issues_sparse_fields():
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    start_date = datetime.now()
+    end_date = start_date + timedelta(days=14)
+
+    sprint_data = {
+        "name": "Sprint 8",
+        "project_id": project.id,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+    }
+    sprint_id = client.post("/api/v1/sprints/", json=sprint_data).json()["id"]
+    issue_data = {
+        "title": "Sprint Sparse Issue",
+        "issue_type": "TASK",
+        "priority": "LOW",
+        "project_id": project.id,
+        "reporter_id": user.id,
+        "sprint_id": sprint_id,
+    }
+    client.post("/api/v1/issues/", json=issue_data)
+
+    response = client.get(f"/api/v1/sprints/{sprint_id}/issues?fields=key,status")
+    assert response.status_code == 200
+    assert response.json() == [{"key": response.json()[0]["key"], "status": "TO_DO"}]
+
+    response = client.get(f"/api/v1/sprints/{sprint_id}/issues?fields=nope")
+    assert response.status_code == 400
+
+
 def test_get_sprint_stats():
     user = setup_test_user()
     project = setup_test_project(user.id)
@@ -304,3 +378,43 @@ def test_get_sprints_by_project():
     assert response.status_code == 200
     data = response.json()
     assert len(data) >= 1
+
+
+def test_get_sprint_stats_conditional():
+    user = setup_test_user()
+    project = setup_test_project(user.id)
+    start_date = datetime.now()
+    end_date = start_date + timedelta(days=14)
+
+    sprint_data = {
+        "name": "Sprint 9",
+        "project_id": project.id,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+    }
+    sprint_id = client.post("/api/v1/sprints/", json=sprint_data).json()["id"]
+    issue_data = {
+        "title": "Stats Issue",
+        "issue_type": "TASK",
+        "priority": "LOW",
+        "project_id": project.id,
+        "reporter_id": user.id,
+        "sprint_id": sprint_id,
+    }
+    issue_id = client.post("/api/v1/issues/", json=issue_data).json()["id"]
+
+    response = client.get(f"/api/v1/sprints/{sprint_id}/stats")
+    etag = response.headers["ETag"]
+    assert response.json()["done_issues"] == 0
+
+    response = client.get(
+        f"/api/v1/sprints/{sprint_id}/stats", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    client.patch(f"/api/v1/issues/{issue_id}/status", json={"status": "DONE"})
+    response = client.get(
+        f"/api/v1/sprints/{sprint_id}/stats", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["done_issues"] == 1